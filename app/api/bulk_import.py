@@ -0,0 +1,70 @@
+"""
+A module for bulk import in the app.api package.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from app.api.oauth2_validation import require_admin
+from app.config.config import performance_setting
+from app.db.bulk_import import import_records, start_import
+from app.exceptions.exceptions import ImportConflictException
+from app.schemas.external.bulk_import import ImportReport, ImportRowError
+from app.schemas.infrastructure.file_format import FileFormat
+from app.schemas.infrastructure.import_dataset import ImportDataset
+from app.utils.file_utils.record_utils import read_records
+
+router: APIRouter = APIRouter(
+    prefix="/import",
+    tags=["import"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.post(
+    "/{dataset}",
+    response_model=ImportReport,
+    status_code=status.HTTP_200_OK,
+)
+async def import_dataset(
+    request: Request,
+    dataset: ImportDataset,
+    name: str = Query(..., min_length=1, max_length=200),
+    file_format: FileFormat = Query(FileFormat.NDJSON, alias="format"),
+    restart: bool = False,
+) -> ImportReport:
+    """
+    Imports the file sent as the request body for admins, parsed as it
+     is received and written in batches of IMPORT_BATCH_SIZE rows. Sending
+     the file again under the same name resumes after its last applied
+     row.
+    ## Parameter:
+    - `request:` **The HTTP request with the file as its body**
+    - `type:` **Request**
+    - `dataset:` **The dataset to import the file into**
+    - `type:` **ImportDataset**
+    - `name:` **The name identifying the import**
+    - `type:` **str**
+    - `file_format:` **The format of the file, NDJSON by default**
+    - `type:` **FileFormat**
+    - `restart:` **Import the file from its first row**
+    - `type:` **bool**
+    ## Response:
+    - `return:` **The report of the import**
+    - `rtype:` **ImportReport**
+    """
+    report: ImportReport = await start_import(dataset, name, restart)
+
+    def report_error(error: ImportRowError) -> None:
+        if len(report.errors) < performance_setting.IMPORT_MAX_REPORTED_ERRORS:
+            report.errors.append(error)
+        else:
+            report.errors_truncated = True
+
+    try:
+        return await import_records(
+            report, read_records(request.stream(), file_format), report_error
+        )
+    except ImportConflictException as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(exc)
+        ) from exc
@@ -0,0 +1,53 @@
+"""
+A module for export in the app.api package.
+"""
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.oauth2_validation import require_admin
+from app.config.config import performance_setting
+from app.db.export import stream_export
+from app.schemas.infrastructure.export_dataset import ExportDataset
+from app.schemas.infrastructure.file_format import FileFormat
+from app.utils.file_utils.record_utils import MEDIA_TYPES
+
+router: APIRouter = APIRouter(
+    prefix="/export",
+    tags=["export"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get(
+    "/{dataset}",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def export_dataset(
+    dataset: ExportDataset,
+    file_format: FileFormat = Query(FileFormat.NDJSON, alias="format"),
+) -> StreamingResponse:
+    """
+    Exports every row of a dataset for admins, streamed in chunks of
+     EXPORT_BATCH_SIZE rows read through a server-side cursor.
+    ## Parameter:
+    - `dataset:` **The dataset to export**
+    - `type:` **ExportDataset**
+    - `file_format:` **The format of the file, NDJSON by default**
+    - `type:` **FileFormat**
+    ## Response:
+    - `return:` **The exported file**
+    - `rtype:` **StreamingResponse**
+    """
+    return StreamingResponse(
+        stream_export(
+            dataset, file_format, performance_setting.EXPORT_BATCH_SIZE
+        ),
+        media_type=MEDIA_TYPES[file_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{dataset}.{file_format}"'
+            )
+        },
+    )
@@ -0,0 +1,264 @@
+"""
+A module for graphql app in the app.api.graphql package.
+"""
+
+import json
+import logging
+from contextvars import Token
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from starlette.background import BackgroundTasks
+from starlette_graphene3 import GraphQLApp
+
+from app.api.graphql.introspection import (
+    IntrospectionCache,
+    IntrospectionKey,
+    get_introspection_cache,
+    is_introspection_allowed,
+    is_introspection_only,
+)
+from app.config.auth_settings import AuthSettings
+from app.config.performance_settings import PerformanceSettings
+from app.core.query_detector import (
+    QueryDetector,
+    RepeatedStatement,
+    reset_detection,
+    start_detection,
+)
+from app.core.tracing import Trace, export_trace, reset_trace, start_trace
+from app.exceptions.exceptions import RepeatedQueryError
+from app.schemas.infrastructure.introspection_policy import (
+    IntrospectionPolicy,
+)
+from app.utils.graphql_utils import (
+    GraphQLOperation,
+    inspect_operation,
+    load_graphql_payload,
+    uses_introspection,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+SCHEMA_VERSION_HEADER: str = "X-Schema-Version"
+
+
+class GraphQLApplication(GraphQLApp):  # type: ignore[misc]
+    """
+    GraphQL ASGI application that enforces the introspection policy,
+     replays cached introspection results, adds the Apollo tracing
+     extension to the responses of traced requests and reports the
+     N+1 query patterns of every operation when detection is on.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        auth_settings: AuthSettings,
+        performance_settings: PerformanceSettings,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.auth_settings: AuthSettings = auth_settings
+        self.performance_settings: PerformanceSettings = performance_settings
+        self.introspection_cache: IntrospectionCache = get_introspection_cache(
+            self.schema
+        )
+
+    def is_traced(self, request: Request) -> bool:
+        """
+        Check whether the request asked to be traced
+        :param request: The GraphQL HTTP request
+        :type request: Request
+        :return: True if tracing is enabled and the debug header is set
+        :rtype: bool
+        """
+        return (
+            self.performance_settings.TRACING_ENABLED
+            and self.performance_settings.TRACING_HEADER in request.headers
+        )
+
+    async def _handle_http_request(self, request: Request) -> Response:
+        """
+        Execute the operation, checking its statements for N+1 query
+         patterns when detection is on
+        :param request: The GraphQL HTTP request
+        :type request: Request
+        :return: The GraphQL response
+        :rtype: Response
+        """
+        if self.performance_settings.QUERY_DETECTOR_MODE == "off":
+            return await self._execute_http_request(request)
+        detector: QueryDetector
+        token: Token[Optional[QueryDetector]]
+        detector, token = start_detection(
+            self.performance_settings.QUERY_DETECTOR_THRESHOLD
+        )
+        try:
+            response: Response = await self._execute_http_request(request)
+        finally:
+            reset_detection(token)
+        return self._report_repeated_statements(detector, response)
+
+    async def _execute_http_request(self, request: Request) -> Response:
+        """
+        Execute the operation, answering introspection from the cache and
+         tracing its resolvers when requested
+        :param request: The GraphQL HTTP request
+        :type request: Request
+        :return: The GraphQL response
+        :rtype: Response
+        """
+        payload: Optional[dict[str, Any]] = load_graphql_payload(
+            await request.body()
+        )
+        query: Any = payload.get("query") if payload else None
+        if not payload or not isinstance(query, str):
+            response: JSONResponse = await super()._handle_http_request(request)
+            return response
+        if (
+            self.auth_settings.GRAPHQL_INTROSPECTION
+            != IntrospectionPolicy.ENABLED
+            and uses_introspection(self.schema.graphql_schema, query)
+            and not await is_introspection_allowed(request, self.auth_settings)
+        ):
+            return self.forbidden_response()
+        if self.is_traced(request):
+            return await self._handle_traced_request(request, payload)
+        operation_name: Any = payload.get("operationName")
+        operation: Optional[GraphQLOperation] = inspect_operation(
+            query, operation_name if isinstance(operation_name, str) else None
+        )
+        if operation is not None and is_introspection_only(operation):
+            return await self._handle_introspection_request(request, payload)
+        response = await super()._handle_http_request(request)
+        return response
+
+    async def _handle_introspection_request(
+        self, request: Request, payload: dict[str, Any]
+    ) -> Response:
+        """
+        Answer an introspection query from the cache, executing it only
+         the first time it is seen for this schema version
+        :param request: The GraphQL HTTP request
+        :type request: Request
+        :param payload: The GraphQL request payload
+        :type payload: dict[str, Any]
+        :return: The GraphQL response
+        :rtype: Response
+        """
+        headers: dict[str, str] = {
+            SCHEMA_VERSION_HEADER: self.introspection_cache.version
+        }
+        key: IntrospectionKey = self.introspection_cache.key(payload)
+        body: Optional[bytes] = self.introspection_cache.get(key)
+        if body is not None:
+            return Response(
+                body, media_type="application/json", headers=headers
+            )
+        response: JSONResponse = await super()._handle_http_request(request)
+        body = bytes(response.body)
+        if "errors" not in json.loads(body):
+            self.introspection_cache.put(key, body)
+        response.headers.update(headers)
+        return response
+
+    async def _handle_traced_request(
+        self, request: Request, payload: dict[str, Any]
+    ) -> JSONResponse:
+        """
+        Execute the operation tracing its resolvers
+        :param request: The GraphQL HTTP request
+        :type request: Request
+        :param payload: The GraphQL request payload
+        :type payload: dict[str, Any]
+        :return: The GraphQL response with the tracing extension
+        :rtype: JSONResponse
+        """
+        trace: Trace
+        token: Token[Optional[Trace]]
+        trace, token = start_trace()
+        try:
+            response: JSONResponse = await super()._handle_http_request(request)
+        finally:
+            reset_trace(token)
+            trace.finish()
+        content: dict[str, Any] = json.loads(bytes(response.body))
+        content.setdefault("extensions", {})["tracing"] = trace.to_dict()
+        background: BackgroundTasks = BackgroundTasks()
+        if response.background is not None:
+            background.add_task(response.background)
+        if self.performance_settings.TRACING_EXPORT_PATH:
+            background.add_task(
+                export_trace,
+                self.performance_settings.TRACING_EXPORT_PATH,
+                payload.get("operationName"),
+                trace,
+            )
+        return JSONResponse(
+            content,
+            status_code=response.status_code,
+            background=background,
+        )
+
+    def _report_repeated_statements(
+        self, detector: QueryDetector, response: Response
+    ) -> Response:
+        """
+        Report the statements the operation repeated from a resolver
+         path, in the way the detection mode asks for
+        :param detector: The detector of the operation
+        :type detector: QueryDetector
+        :param response: The GraphQL response
+        :type response: Response
+        :return: The response, with the findings in its extensions when
+         the mode is warn
+        :rtype: Response
+        """
+        findings: list[RepeatedStatement] = detector.findings()
+        if not findings:
+            return response
+        for finding in findings:
+            logger.warning(
+                "N+1 query: %s issued %d times from %s",
+                finding.statement,
+                finding.repetitions,
+                finding.path or "the operation",
+            )
+        if self.performance_settings.QUERY_DETECTOR_MODE == "raise":
+            raise RepeatedQueryError(
+                f"Operation repeated {len(findings)} statement shapes",
+                "\n".join(
+                    f"{finding.repetitions}x {finding.path}: {finding.statement}"
+                    for finding in findings
+                ),
+            )
+        if self.performance_settings.QUERY_DETECTOR_MODE != "warn":
+            return response
+        content: dict[str, Any] = json.loads(bytes(response.body))
+        content.setdefault("extensions", {})["nPlusOne"] = detector.to_dict()
+        return JSONResponse(
+            content,
+            status_code=response.status_code,
+            background=response.background,
+        )
+
+    @staticmethod
+    def forbidden_response() -> JSONResponse:
+        """
+        Build the response returned when introspection is not allowed
+        :return: A GraphQL shaped 403 response
+        :rtype: JSONResponse
+        """
+        return JSONResponse(
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": "GraphQL introspection is not allowed",
+                        "extensions": {"code": "FORBIDDEN"},
+                    }
+                ],
+            },
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
@@ -0,0 +1,151 @@
+"""
+A module for introspection in the app.api.graphql package.
+"""
+
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import sha256
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.security.utils import get_authorization_scheme_param
+from graphene import Schema
+from graphql import print_schema
+
+from app.api.oauth2_validation import is_admin_token
+from app.config.auth_settings import AuthSettings
+from app.core.metrics import Counter, metrics_registry
+from app.schemas.infrastructure.introspection_policy import (
+    IntrospectionPolicy,
+)
+from app.utils.graphql_utils import GraphQLOperation
+
+INTROSPECTION_FIELDS: frozenset[str] = frozenset({"__schema", "__type"})
+INTROSPECTION_ROOT_FIELDS: frozenset[str] = INTROSPECTION_FIELDS | {
+    "__typename"
+}
+
+IntrospectionKey = tuple[str, str, str]
+
+
+class IntrospectionCache:
+    """
+    Serialized introspection results and SDL of a schema version.
+    The schema does not change while the process runs, so each distinct
+     introspection query is executed once and replayed as bytes.
+    """
+
+    def __init__(self, schema: Schema, max_size: int = 32):
+        self.sdl: bytes = print_schema(schema.graphql_schema).encode()
+        self.version: str = sha256(self.sdl).hexdigest()[:16]
+        self.max_size: int = max_size
+        self._results: OrderedDict[IntrospectionKey, bytes] = OrderedDict()
+        self._hits: Counter = metrics_registry.counter(
+            "cache_hits_total",
+            "Lookups answered from a cache",
+            cache="introspection",
+        )
+        self._misses: Counter = metrics_registry.counter(
+            "cache_misses_total",
+            "Lookups a cache could not answer",
+            cache="introspection",
+        )
+
+    @staticmethod
+    def key(payload: dict[str, Any]) -> IntrospectionKey:
+        """
+        Build the cache key of a GraphQL request payload
+        :param payload: The GraphQL request payload
+        :type payload: dict[str, Any]
+        :return: The query, operation name and variables of the request
+        :rtype: IntrospectionKey
+        """
+        return (
+            str(payload.get("query")),
+            str(payload.get("operationName") or ""),
+            json.dumps(payload.get("variables") or {}, sort_keys=True),
+        )
+
+    def get(self, key: IntrospectionKey) -> Optional[bytes]:
+        """
+        Get the serialized result of an introspection query
+        :param key: The cache key of the request
+        :type key: IntrospectionKey
+        :return: The serialized response body, if it is cached
+        :rtype: Optional[bytes]
+        """
+        body: Optional[bytes] = self._results.get(key)
+        if body is None:
+            self._misses.inc()
+            return None
+        self._hits.inc()
+        self._results.move_to_end(key)
+        return body
+
+    def put(self, key: IntrospectionKey, body: bytes) -> None:
+        """
+        Cache the serialized result of an introspection query
+        :param key: The cache key of the request
+        :type key: IntrospectionKey
+        :param body: The serialized response body
+        :type body: bytes
+        :return: None
+        :rtype: NoneType
+        """
+        self._results[key] = body
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def get_introspection_cache(schema: Schema) -> IntrospectionCache:
+    """
+    Get the introspection cache of a schema
+    :param schema: The graphene schema
+    :type schema: Schema
+    :return: The cache, built on first use
+    :rtype: IntrospectionCache
+    """
+    return IntrospectionCache(schema)
+
+
+def is_introspection_only(operation: GraphQLOperation) -> bool:
+    """
+    Check whether an operation selects nothing but introspection fields
+    :param operation: The operation description
+    :type operation: GraphQLOperation
+    :return: True if the whole result depends only on the schema
+    :rtype: bool
+    """
+    return bool(
+        operation.root_fields & INTROSPECTION_FIELDS
+        and operation.root_fields <= INTROSPECTION_ROOT_FIELDS
+    )
+
+
+async def is_introspection_allowed(
+    request: Request, auth_settings: AuthSettings
+) -> bool:
+    """
+    Check whether the request may introspect the schema under the
+     configured policy
+    :param request: The HTTP request
+    :type request: Request
+    :param auth_settings: Dependency method for cached setting object
+    :type auth_settings: AuthSettings
+    :return: True if introspection is allowed for this request
+    :rtype: bool
+    """
+    policy: IntrospectionPolicy = auth_settings.GRAPHQL_INTROSPECTION
+    if policy == IntrospectionPolicy.ENABLED:
+        return True
+    if policy == IntrospectionPolicy.DISABLED:
+        return False
+    scheme, token = get_authorization_scheme_param(
+        request.headers.get("Authorization")
+    )
+    if scheme.lower() != "bearer" or not token:
+        return False
+    return await is_admin_token(token, auth_settings)
@@ -0,0 +1,3 @@
+"""
+Package app.api.graphql.middlewares initialization.
+"""
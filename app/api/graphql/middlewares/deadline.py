@@ -0,0 +1,78 @@
+"""
+A module for deadline in the app.api.graphql.middlewares package.
+"""
+
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable
+
+from graphql import GraphQLResolveInfo
+from sqlalchemy.exc import DBAPIError
+
+from app.core.deadline import check_deadline
+from app.exceptions.exceptions import DeadlineExceededError
+
+QUERY_CANCELED_SQLSTATE: str = "57014"
+
+
+def is_statement_timeout(exc: DBAPIError) -> bool:
+    """
+    Check whether a database error was caused by statement_timeout
+    :param exc: The database error
+    :type exc: DBAPIError
+    :return: True if the statement was cancelled by the server
+    :rtype: bool
+    """
+    sqlstate: Any = getattr(exc.orig, "pgcode", None) or getattr(
+        exc.orig, "sqlstate", None
+    )
+    return bool(sqlstate == QUERY_CANCELED_SQLSTATE)
+
+
+class DeadlineResolverMiddleware:
+    """
+    GraphQL middleware that stops resolving once the deadline of the
+     operation has expired and maps cancelled statements to a
+     structured GraphQL timeout error.
+    """
+
+    def resolve(
+        self,
+        next_: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Resolve a field under the deadline of the current operation
+        :param next_: The next resolver in the chain
+        :type next_: Callable[..., Any]
+        :param root: The parent value
+        :type root: Any
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :param kwargs: The field arguments
+        :type kwargs: Any
+        :return: The resolved value
+        :rtype: Any
+        """
+        check_deadline()
+        result: Any = next_(root, info, **kwargs)
+        if isawaitable(result):
+            return self._await_result(result)
+        return result
+
+    @staticmethod
+    async def _await_result(result: Awaitable[Any]) -> Any:
+        """
+        Await an asynchronous resolver translating statement timeouts
+        :param result: The awaitable returned by the resolver
+        :type result: Awaitable[Any]
+        :return: The resolved value
+        :rtype: Any
+        """
+        try:
+            return await result
+        except DBAPIError as exc:
+            if is_statement_timeout(exc):
+                raise DeadlineExceededError() from exc
+            raise
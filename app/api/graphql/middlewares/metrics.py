@@ -0,0 +1,86 @@
+"""
+A module for metrics in the app.api.graphql.middlewares package.
+"""
+
+from inspect import isawaitable
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable
+
+from graphql import GraphQLResolveInfo
+
+from app.core.metrics import Histogram, metrics_registry
+
+RESOLVER_DURATION_METRIC: str = "graphql_resolver_duration_seconds"
+
+
+class MetricsResolverMiddleware:
+    """
+    GraphQL middleware that records the latency of the resolvers by
+     field. Only root fields and asynchronous resolvers are timed, so
+     plain attribute lookups do not pay for a measurement.
+    """
+
+    def resolve(
+        self,
+        next_: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Resolve a field recording how long it took
+        :param next_: The next resolver in the chain
+        :type next_: Callable[..., Any]
+        :param root: The parent value
+        :type root: Any
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :param kwargs: The field arguments
+        :type kwargs: Any
+        :return: The resolved value
+        :rtype: Any
+        """
+        start_time: int = perf_counter_ns()
+        result: Any = next_(root, info, **kwargs)
+        if isawaitable(result):
+            return self._await_result(result, info, start_time)
+        if info.path.prev is None:
+            self.histogram(info).record(perf_counter_ns() - start_time)
+        return result
+
+    async def _await_result(
+        self,
+        result: Awaitable[Any],
+        info: GraphQLResolveInfo,
+        start_time: int,
+    ) -> Any:
+        """
+        Await an asynchronous resolver recording how long it took
+        :param result: The awaitable returned by the resolver
+        :type result: Awaitable[Any]
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :param start_time: When the resolver was called, in nanoseconds
+        :type start_time: int
+        :return: The resolved value
+        :rtype: Any
+        """
+        try:
+            return await result
+        finally:
+            self.histogram(info).record(perf_counter_ns() - start_time)
+
+    @staticmethod
+    def histogram(info: GraphQLResolveInfo) -> Histogram:
+        """
+        Get the histogram of the field being resolved
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :return: The histogram of the field
+        :rtype: Histogram
+        """
+        return metrics_registry.histogram(
+            RESOLVER_DURATION_METRIC,
+            "Latency of GraphQL resolvers",
+            field=f"{info.parent_type.name}.{info.field_name}",
+        )
@@ -0,0 +1,73 @@
+"""
+A module for query detector in the app.api.graphql.middlewares package.
+"""
+
+from contextvars import Token
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable
+
+from graphql import GraphQLResolveInfo
+
+from app.core.query_detector import (
+    get_detector,
+    reset_resolver_path,
+    resolver_path,
+    set_resolver_path,
+)
+
+
+class QueryDetectorResolverMiddleware:
+    """
+    GraphQL middleware that attributes the SQL issued by every resolver
+     to its path when the request is checked for N+1 queries.
+    """
+
+    def resolve(
+        self,
+        next_: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Resolve a field with its path as the current resolver path
+        :param next_: The next resolver in the chain
+        :type next_: Callable[..., Any]
+        :param root: The parent value
+        :type root: Any
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :param kwargs: The field arguments
+        :type kwargs: Any
+        :return: The resolved value
+        :rtype: Any
+        """
+        if get_detector() is None:
+            return next_(root, info, **kwargs)
+        path: str = resolver_path(info)
+        token: Token[str] = set_resolver_path(path)
+        try:
+            result: Any = next_(root, info, **kwargs)
+        finally:
+            reset_resolver_path(token)
+        if isawaitable(result):
+            return self._await_result(result, path)
+        return result
+
+    @staticmethod
+    async def _await_result(result: Awaitable[Any], path: str) -> Any:
+        """
+        Await an asynchronous resolver with its path as the current
+         resolver path
+        :param result: The awaitable returned by the resolver
+        :type result: Awaitable[Any]
+        :param path: The path of the resolver
+        :type path: str
+        :return: The resolved value
+        :rtype: Any
+        """
+        token: Token[str] = set_resolver_path(path)
+        try:
+            return await result
+        finally:
+            reset_resolver_path(token)
@@ -0,0 +1,80 @@
+"""
+A module for tracing in the app.api.graphql.middlewares package.
+"""
+
+from contextvars import Token
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Optional
+
+from graphql import GraphQLResolveInfo
+
+from app.core.tracing import (
+    ResolverSpan,
+    Trace,
+    get_trace,
+    reset_current_span,
+    set_current_span,
+)
+
+
+class TracingResolverMiddleware:
+    """
+    GraphQL middleware that records the start offset and duration of
+     every resolver, and the SQL it issues, when the request is traced.
+    """
+
+    def resolve(
+        self,
+        next_: Callable[..., Any],
+        root: Any,
+        info: GraphQLResolveInfo,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Resolve a field inside a tracing span
+        :param next_: The next resolver in the chain
+        :type next_: Callable[..., Any]
+        :param root: The parent value
+        :type root: Any
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :param kwargs: The field arguments
+        :type kwargs: Any
+        :return: The resolved value
+        :rtype: Any
+        """
+        trace: Optional[Trace] = get_trace()
+        if trace is None:
+            return next_(root, info, **kwargs)
+        span: ResolverSpan = trace.start_resolver(info)
+        token: Token[Optional[ResolverSpan]] = set_current_span(span)
+        try:
+            result: Any = next_(root, info, **kwargs)
+        finally:
+            reset_current_span(token)
+        if isawaitable(result):
+            return self._await_result(result, trace, span)
+        trace.finish_resolver(span)
+        return result
+
+    @staticmethod
+    async def _await_result(
+        result: Awaitable[Any], trace: Trace, span: ResolverSpan
+    ) -> Any:
+        """
+        Await an asynchronous resolver inside its tracing span
+        :param result: The awaitable returned by the resolver
+        :type result: Awaitable[Any]
+        :param trace: The trace of the operation
+        :type trace: Trace
+        :param span: The span of the resolver
+        :type span: ResolverSpan
+        :return: The resolved value
+        :rtype: Any
+        """
+        token: Token[Optional[ResolverSpan]] = set_current_span(span)
+        try:
+            return await result
+        finally:
+            reset_current_span(token)
+            trace.finish_resolver(span)
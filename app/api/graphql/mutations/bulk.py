@@ -0,0 +1,184 @@
+"""
+A module for bulk in the app.api.graphql.mutations package.
+The bulk mutations validate every item up front and report the invalid
+ ones by their index instead of failing the whole list, then write the
+ valid items with a single multi-row statement in one transaction.
+"""
+
+from typing import Any, Iterable, Optional, Sequence, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.api.graphql.types.bulk import BulkItemErrorType
+from app.config.config import performance_setting
+from app.exceptions.exceptions import TooManyItemsError
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+def check_bulk_size(items: list[Any]) -> None:
+    """
+    Reject a bulk mutation with more items than allowed
+    :param items: The items of the mutation
+    :type items: list[Any]
+    :return: None
+    :rtype: NoneType
+    """
+    if len(items) > performance_setting.MAX_BULK_ITEMS:
+        raise TooManyItemsError(
+            f"At most {performance_setting.MAX_BULK_ITEMS} items are"
+            f" allowed, got {len(items)}"
+        )
+
+
+def item_error(index: int, message: str, code: str) -> BulkItemErrorType:
+    """
+    Build the error of an item of a bulk mutation
+    :param index: The position of the item in the input list
+    :type index: int
+    :param message: The error message
+    :type message: str
+    :param code: The error code
+    :type code: str
+    :return: The item error
+    :rtype: BulkItemErrorType
+    """
+    return BulkItemErrorType(index=index, message=message, code=code)
+
+
+def validation_message(exc: ValidationError) -> str:
+    """
+    Join the errors of a validation into a single message
+    :param exc: The validation error
+    :type exc: ValidationError
+    :return: The field errors separated by semicolons
+    :rtype: str
+    """
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def validate_items(
+    items: list[Any], schema: type[SchemaT]
+) -> tuple[list[tuple[int, SchemaT]], list[BulkItemErrorType]]:
+    """
+    Validate every item of a bulk mutation against a schema
+    :param items: The input objects of the mutation
+    :type items: list[Any]
+    :param schema: The Pydantic schema of an item
+    :type schema: type[SchemaT]
+    :return: The valid items with their index and the invalid items
+     errors
+    :rtype: tuple[list[tuple[int, SchemaT]], list[BulkItemErrorType]]
+    """
+    valid: list[tuple[int, SchemaT]] = []
+    errors: list[BulkItemErrorType] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(dict(item))))
+        except ValidationError as exc:
+            errors.append(
+                item_error(index, validation_message(exc), "BAD_USER_INPUT")
+            )
+    return valid, errors
+
+
+async def existing_ids(
+    session: AsyncSession,
+    column: InstrumentedAttribute[int],
+    ids: Iterable[int],
+) -> set[int]:
+    """
+    Get which of the given ids exist, with a single query
+    :param session: The session of the bulk mutation
+    :type session: AsyncSession
+    :param column: The primary key column to look the ids up in
+    :type column: InstrumentedAttribute[int]
+    :param ids: The ids referenced by the items
+    :type ids: Iterable[int]
+    :return: The ids that exist
+    :rtype: set[int]
+    """
+    lookup: set[int] = set(ids)
+    if not lookup:
+        return set()
+    return set(
+        (await session.scalars(select(column).where(column.in_(lookup)))).all()
+    )
+
+
+async def load_by_ids(
+    session: AsyncSession,
+    model: Any,
+    ids: Iterable[int],
+    options: Sequence[ORMOption],
+) -> dict[int, Any]:
+    """
+    Select written rows again with the relationships their fields
+     resolve, so the fields still resolve once the session is closed
+    :param session: The session of the mutation
+    :type session: AsyncSession
+    :param model: The model class of the rows
+    :type model: Any
+    :param ids: The ids of the rows
+    :type ids: Iterable[int]
+    :param options: The loader options of the relationships
+    :type options: Sequence[ORMOption]
+    :return: The loaded rows by id
+    :rtype: dict[int, Any]
+    """
+    lookup: set[int] = set(ids)
+    if not lookup:
+        return {}
+    rows = (
+        await session.scalars(
+            select(model)
+            .where(model.id.in_(lookup))
+            .options(*options)
+            .execution_options(populate_existing=True)
+        )
+    ).unique()
+    return {row.id: row for row in rows}
+
+
+async def reload_items(
+    session: AsyncSession,
+    model: Any,
+    items: list[Optional[Any]],
+    options: Sequence[ORMOption],
+) -> list[Optional[Any]]:
+    """
+    Replace the written rows of a bulk mutation with the same rows
+     loaded with their relationships, in one statement
+    :param session: The session of the bulk mutation
+    :type session: AsyncSession
+    :param model: The model class of the rows
+    :type model: Any
+    :param items: The written row of every item, None for failed items
+    :type items: list[Optional[Any]]
+    :param options: The loader options of the relationships
+    :type options: Sequence[ORMOption]
+    :return: The loaded row of every item, in input order
+    :rtype: list[Optional[Any]]
+    """
+    loaded: dict[int, Any] = await load_by_ids(
+        session, model, (item.id for item in items if item), options
+    )
+    return [loaded[item.id] if item else None for item in items]
+
+
+def sort_errors(errors: list[BulkItemErrorType]) -> list[BulkItemErrorType]:
+    """
+    Sort the item errors by the position of their item
+    :param errors: The item errors
+    :type errors: list[BulkItemErrorType]
+    :return: The errors in input order
+    :rtype: list[BulkItemErrorType]
+    """
+    return sorted(errors, key=lambda error: error.index)
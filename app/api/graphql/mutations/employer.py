@@ -2,21 +2,74 @@
 A module for employer in the app.api.graphql.mutations package.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
-from graphene import Boolean, Field, Int, Mutation, String
-from graphql import GraphQLError
+from graphene import Boolean, Field, Int, List, Mutation, NonNull, String
 from graphql.type.definition import GraphQLResolveInfo
 from pydantic import EmailStr, PositiveInt
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql.dml import (
+    ReturningDelete,
+    ReturningInsert,
+    ReturningUpdate,
+)
 
-from app.api.graphql.types.employer import EmployerType
-from app.api.oauth2_validation import admin_user, authenticate_user
-from app.config.config import auth_setting
+from app.api.graphql.mutations.bulk import (
+    check_bulk_size,
+    item_error,
+    load_by_ids,
+    reload_items,
+    sort_errors,
+    validate_items,
+)
+from app.api.graphql.types.bulk import BulkItemErrorType
+from app.api.graphql.types.employer import EmployerInput, EmployerType
+from app.api.oauth2_validation import admin_user
+from app.core.prefix_index import (
+    EMPLOYER_NAME,
+    INDUSTRY,
+    discard_prefixes,
+    update_prefixes,
+)
 from app.db.session import get_session
-from app.exceptions.exceptions import DatabaseException, ServiceException
+from app.db.upsert import conflict_insert
+from app.exceptions.exceptions import AlreadyExistsError, DatabaseException
 from app.models.employer import Employer
-from app.schemas.external.user import UserAuth
+from app.schemas.external.employer import EmployerCreate
+
+EMPLOYER_LOAD_OPTIONS: tuple[ORMOption, ...] = (selectinload(Employer.jobs),)
+
+
+def index_employer_changes(employers: list[Employer]) -> None:
+    """
+    Refresh created or updated employers in the autocomplete indexes
+    :param employers: The employers as written
+    :type employers: list[Employer]
+    :return: None
+    :rtype: NoneType
+    """
+    update_prefixes(
+        EMPLOYER_NAME, ((employer.id, employer.name) for employer in employers)
+    )
+    update_prefixes(
+        INDUSTRY, ((employer.id, employer.industry) for employer in employers)
+    )
+
+
+def unindex_employer_ids(employer_ids: list[int]) -> None:
+    """
+    Remove deleted employers from the autocomplete indexes
+    :param employer_ids: The ids of the deleted employers
+    :type employer_ids: list[int]
+    :return: None
+    :rtype: NoneType
+    """
+    discard_prefixes(EMPLOYER_NAME, employer_ids)
+    discard_prefixes(INDUSTRY, employer_ids)
 
 
 class AddEmployer(Mutation):  # type: ignore
@@ -36,26 +89,38 @@ class AddEmployer(Mutation):  # type: ignore
         contact_email: EmailStr,
         industry: str,
     ) -> "AddEmployer":
-        if not info:
-            raise GraphQLError("No information for authentication")
-        user: UserAuth = await authenticate_user(info.context, auth_setting)
-        if not user:
-            raise ServiceException("User not authenticated")
-        employer = Employer(
-            name=name, contact_email=contact_email, industry=industry
+        stmt: ReturningInsert[tuple[Employer]] = (
+            conflict_insert(Employer)
+            .values(name=name, contact_email=contact_email, industry=industry)
+            .on_conflict_do_nothing()
+            .returning(Employer)
         )
         async_session: AsyncSession = await get_session()
-        async_session.add(employer)
-        await async_session.commit()
-        return AddEmployer(employer=employer, authenticated=user.email)
+        async with async_session as session:
+            employer: Optional[Employer] = (
+                (await session.scalars(stmt)).unique().one_or_none()
+            )
+            if not employer:
+                raise AlreadyExistsError(
+                    "Employer already exists with that contact email"
+                )
+            employer = (
+                await load_by_ids(
+                    session, Employer, [employer.id], EMPLOYER_LOAD_OPTIONS
+                )
+            )[employer.id]
+            await session.commit()
+        index_employer_changes([employer])
+        return AddEmployer(employer=employer)
 
 
 class UpdateEmployer(Mutation):  # type: ignore
     class Arguments:
-        id = Int(required=True)
+        _id = Int(required=True, name="id")
         name = String()
         contact_email = String()
         industry = String()
+        expected_version = Int()
 
     employer = Field(lambda: EmployerType)
 
@@ -71,24 +136,46 @@ class UpdateEmployer(Mutation):  # type: ignore
         name: Optional[str] = None,
         contact_email: Optional[EmailStr] = None,
         industry: Optional[str] = None,
+        expected_version: Optional[PositiveInt] = None,
     ) -> "UpdateEmployer":
+        values: dict[str, Any] = {
+            column: value
+            for column, value in (
+                ("name", name),
+                ("contact_email", contact_email),
+                ("industry", industry),
+            )
+            if value is not None
+        }
+        stmt: ReturningUpdate[tuple[Employer]] = (
+            update(Employer)
+            .where(Employer.id == _id)
+            .values(**values, version=Employer.version + 1)
+            .returning(Employer)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Employer.version == expected_version)
         async_session: AsyncSession = await get_session()
-        employer = await async_session.get(Employer, _id)
-        if not employer:
-            raise DatabaseException("Employer not found")
-        if name is not None:
-            employer.name = name
-        if contact_email is not None:
-            employer.contact_email = contact_email
-        if industry is not None:
-            employer.industry = industry
-        await async_session.commit()
+        async with async_session as session:
+            employer: Optional[Employer] = (
+                (await session.scalars(stmt)).unique().one_or_none()
+            )
+            if not employer:
+                raise DatabaseException("Employer not found")
+            employer = (
+                await load_by_ids(
+                    session, Employer, [_id], EMPLOYER_LOAD_OPTIONS
+                )
+            )[_id]
+            await session.commit()
+        index_employer_changes([employer])
         return UpdateEmployer(employer=employer)
 
 
 class DeleteEmployer(Mutation):  # type: ignore
     class Arguments:
-        id = Int(required=True)
+        _id = Int(required=True, name="id")
+        expected_version = Int()
 
     success = Boolean()
 
@@ -98,11 +185,84 @@ class DeleteEmployer(Mutation):  # type: ignore
         root: Optional[Employer],
         info: Optional[GraphQLResolveInfo],
         _id: PositiveInt,
+        expected_version: Optional[PositiveInt] = None,
     ) -> "DeleteEmployer":
+        stmt: ReturningDelete[tuple[int]] = (
+            delete(Employer).where(Employer.id == _id).returning(Employer.id)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Employer.version == expected_version)
         async_session: AsyncSession = await get_session()
-        employer = await async_session.get(Employer, _id)
-        if not employer:
-            raise DatabaseException("Employer not found")
-        await async_session.delete(employer)
-        await async_session.commit()
+        async with async_session as session:
+            try:
+                if (await session.execute(stmt)).first() is None:
+                    raise DatabaseException("Employer not found")
+                await session.commit()
+            except IntegrityError as exc:
+                raise DatabaseException(
+                    "Employer has jobs and cannot be deleted"
+                ) from exc
+        unindex_employer_ids([_id])
         return DeleteEmployer(success=True)
+
+
+class AddEmployers(Mutation):  # type: ignore
+    class Arguments:
+        employers = List(NonNull(EmployerInput), required=True)
+
+    employers = List(lambda: EmployerType)
+    errors = List(lambda: BulkItemErrorType)
+
+    @staticmethod
+    @admin_user
+    async def mutate(
+        root: Optional[Employer],
+        info: Optional[GraphQLResolveInfo],
+        employers: list[dict[str, Any]],
+    ) -> "AddEmployers":
+        check_bulk_size(employers)
+        valid, errors = validate_items(employers, EmployerCreate)
+        insertable: dict[str, tuple[int, EmployerCreate]] = {}
+        for index, item in valid:
+            if item.contact_email in insertable:
+                errors.append(
+                    item_error(
+                        index,
+                        "Employer repeated in the input",
+                        "ALREADY_EXISTS",
+                    )
+                )
+            else:
+                insertable[item.contact_email] = (index, item)
+        created: list[Optional[Employer]] = [None] * len(employers)
+        if insertable:
+            stmt: ReturningInsert[tuple[Employer]] = (
+                conflict_insert(Employer)
+                .on_conflict_do_nothing()
+                .returning(Employer)
+            )
+            async_session: AsyncSession = await get_session()
+            async with async_session as session:
+                inserted = (
+                    await session.scalars(
+                        stmt,
+                        [item.model_dump() for _, item in insertable.values()],
+                    )
+                ).unique()
+                for employer in inserted:
+                    created[insertable[employer.contact_email][0]] = employer
+                created = await reload_items(
+                    session, Employer, created, EMPLOYER_LOAD_OPTIONS
+                )
+                await session.commit()
+        errors.extend(
+            item_error(
+                index,
+                "Employer already exists with that contact email",
+                "ALREADY_EXISTS",
+            )
+            for index, _ in insertable.values()
+            if created[index] is None
+        )
+        index_employer_changes([employer for employer in created if employer])
+        return AddEmployers(employers=created, errors=sort_errors(errors))
@@ -2,18 +2,100 @@
 A module for job in the app.api.graphql.mutations package.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
-from graphene import Boolean, Field, Int, Mutation, String
+from graphene import Boolean, Field, Int, List, Mutation, NonNull, String
 from graphql.type.definition import GraphQLResolveInfo
 from pydantic import PositiveInt
+from sqlalchemy import delete, insert, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql.dml import (
+    ReturningDelete,
+    ReturningInsert,
+    ReturningUpdate,
+)
 
-from app.api.graphql.types.job import JobType
+from app.api.graphql.mutations.bulk import (
+    check_bulk_size,
+    existing_ids,
+    item_error,
+    load_by_ids,
+    reload_items,
+    sort_errors,
+    validate_items,
+)
+from app.api.graphql.types.bulk import BulkItemErrorType
+from app.api.graphql.types.job import JobInput, JobType, JobUpdateInput
 from app.api.oauth2_validation import admin_user
+from app.core.prefix_index import JOB_TITLE, discard_prefixes, update_prefixes
+from app.core.search_index import index_jobs, unindex_jobs
 from app.db.session import get_session
 from app.exceptions.exceptions import DatabaseException
+from app.models.application import Application
+from app.models.employer import Employer
 from app.models.job import Job
+from app.schemas.external.job import JobCreate, JobUpdate
+
+JOB_LOAD_OPTIONS: tuple[ORMOption, ...] = (
+    joinedload(Job.employer),
+    selectinload(Job.applications),
+)
+
+
+def index_job_changes(jobs: list[Job]) -> None:
+    """
+    Refresh created or updated jobs in the in-process search and
+     autocomplete indexes
+    :param jobs: The jobs as written
+    :type jobs: list[Job]
+    :return: None
+    :rtype: NoneType
+    """
+    index_jobs((job.id, job.title, job.description) for job in jobs)
+    update_prefixes(JOB_TITLE, ((job.id, job.title) for job in jobs))
+
+
+def unindex_job_ids(job_ids: list[int]) -> None:
+    """
+    Remove deleted jobs from the in-process search and autocomplete
+     indexes
+    :param job_ids: The ids of the deleted jobs
+    :type job_ids: list[int]
+    :return: None
+    :rtype: NoneType
+    """
+    unindex_jobs(job_ids)
+    discard_prefixes(JOB_TITLE, job_ids)
+
+
+def update_job_statement(
+    _id: PositiveInt,
+    values: dict[str, Any],
+    expected_version: Optional[PositiveInt] = None,
+) -> ReturningUpdate[tuple[Job]]:
+    """
+    Build the statement that updates a Job and bumps its version
+    :param _id: The ID of the Job
+    :type _id: PositiveInt
+    :param values: The columns to update
+    :type values: dict[str, Any]
+    :param expected_version: The version the Job must have, if any
+    :type expected_version: Optional[PositiveInt]
+    :return: The UPDATE ... RETURNING statement
+    :rtype: ReturningUpdate[tuple[Job]]
+    """
+    stmt: ReturningUpdate[tuple[Job]] = (
+        update(Job)
+        .where(Job.id == _id)
+        .values(**values, version=Job.version + 1)
+        .returning(Job)
+    )
+    if expected_version is not None:
+        stmt = stmt.where(Job.version == expected_version)
+    return stmt
 
 
 class AddJob(Mutation):  # type: ignore
@@ -35,17 +117,27 @@ class AddJob(Mutation):  # type: ignore
     ) -> "AddJob":
         job = Job(title=title, description=description, employer_id=employer_id)
         async_session: AsyncSession = await get_session()
-        async_session.add(job)
-        await async_session.commit()
+        async with async_session as session:
+            session.add(job)
+            try:
+                await session.flush()
+            except IntegrityError as exc:
+                raise DatabaseException("Employer not found") from exc
+            job = (await load_by_ids(session, Job, [job.id], JOB_LOAD_OPTIONS))[
+                job.id
+            ]
+            await session.commit()
+        index_job_changes([job])
         return AddJob(job=job)
 
 
 class UpdateJob(Mutation):  # type: ignore
     class Arguments:
-        id = Int(required=True)
+        _id = Int(required=True, name="id")
         title = String()
         description = String()
         employer_id = Int()
+        expected_version = Int()
 
     job = Field(lambda: JobType)
 
@@ -58,24 +150,39 @@ class UpdateJob(Mutation):  # type: ignore
         title: Optional[str] = None,
         description: Optional[str] = None,
         employer_id: Optional[PositiveInt] = None,
+        expected_version: Optional[PositiveInt] = None,
     ) -> "UpdateJob":
+        values: dict[str, Any] = {
+            column: value
+            for column, value in (
+                ("title", title),
+                ("description", description),
+                ("employer_id", employer_id),
+            )
+            if value is not None
+        }
+        stmt: ReturningUpdate[tuple[Job]] = update_job_statement(
+            _id, values, expected_version
+        )
         async_session: AsyncSession = await get_session()
-        job = await async_session.get(Job, _id)
-        if not job:
-            raise DatabaseException("Job not found")
-        if title is not None:
-            job.title = title
-        if description is not None:
-            job.description = description
-        if employer_id is not None:
-            job.employer_id = employer_id
-        await async_session.commit()
+        async with async_session as session:
+            job: Optional[Job] = (
+                (await session.scalars(stmt)).unique().one_or_none()
+            )
+            if not job:
+                raise DatabaseException("Job not found")
+            job = (await load_by_ids(session, Job, [_id], JOB_LOAD_OPTIONS))[
+                _id
+            ]
+            await session.commit()
+        index_job_changes([job])
         return UpdateJob(job=job)
 
 
 class DeleteJob(Mutation):  # type: ignore
     class Arguments:
-        id = Int(required=True)
+        _id = Int(required=True, name="id")
+        expected_version = Int()
 
     success = Boolean()
     job = Field(lambda: JobType)
@@ -86,11 +193,191 @@ class DeleteJob(Mutation):  # type: ignore
         root: Optional[Job],
         info: Optional[GraphQLResolveInfo],
         _id: PositiveInt,
+        expected_version: Optional[PositiveInt] = None,
     ) -> "DeleteJob":
+        stmt: ReturningDelete[tuple[int]] = (
+            delete(Job).where(Job.id == _id).returning(Job.id)
+        )
+        if expected_version is not None:
+            stmt = stmt.where(Job.version == expected_version)
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            job: Optional[Job] = (
+                await load_by_ids(session, Job, [_id], JOB_LOAD_OPTIONS)
+            ).get(_id)
+            try:
+                if not job or (await session.execute(stmt)).first() is None:
+                    raise DatabaseException("Job not found")
+                await session.commit()
+            except IntegrityError as exc:
+                raise DatabaseException(
+                    "Job has applications and cannot be deleted"
+                ) from exc
+        unindex_job_ids([job.id])
+        return DeleteJob(success=True, job=job)
+
+
+class AddJobs(Mutation):  # type: ignore
+    class Arguments:
+        jobs = List(NonNull(JobInput), required=True)
+
+    jobs = List(lambda: JobType)
+    errors = List(lambda: BulkItemErrorType)
+
+    @staticmethod
+    @admin_user
+    async def mutate(
+        root: Optional[Job],
+        info: Optional[GraphQLResolveInfo],
+        jobs: list[dict[str, Any]],
+    ) -> "AddJobs":
+        check_bulk_size(jobs)
+        valid, errors = validate_items(jobs, JobCreate)
+        created: list[Optional[Job]] = [None] * len(jobs)
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            employer_ids: set[int] = await existing_ids(
+                session, Employer.id, (item.employer_id for _, item in valid)
+            )
+            insertable: list[tuple[int, JobCreate]] = []
+            for index, item in valid:
+                if item.employer_id in employer_ids:
+                    insertable.append((index, item))
+                else:
+                    errors.append(
+                        item_error(index, "Employer not found", "NOT_FOUND")
+                    )
+            if insertable:
+                stmt: ReturningInsert[tuple[Job]] = insert(Job).returning(
+                    Job, sort_by_parameter_order=True
+                )
+                inserted = (
+                    await session.scalars(
+                        stmt, [item.model_dump() for _, item in insertable]
+                    )
+                ).unique()
+                for (index, _), job in zip(insertable, inserted):
+                    created[index] = job
+                created = await reload_items(
+                    session, Job, created, JOB_LOAD_OPTIONS
+                )
+                await session.commit()
+        index_job_changes([job for job in created if job])
+        return AddJobs(jobs=created, errors=sort_errors(errors))
+
+
+class UpdateJobs(Mutation):  # type: ignore
+    class Arguments:
+        jobs = List(NonNull(JobUpdateInput), required=True)
+
+    jobs = List(lambda: JobType)
+    errors = List(lambda: BulkItemErrorType)
+
+    @staticmethod
+    @admin_user
+    async def mutate(
+        root: Optional[Job],
+        info: Optional[GraphQLResolveInfo],
+        jobs: list[dict[str, Any]],
+    ) -> "UpdateJobs":
+        check_bulk_size(jobs)
+        valid, errors = validate_items(jobs, JobUpdate)
+        updated: list[Optional[Job]] = [None] * len(jobs)
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            employer_ids: set[int] = await existing_ids(
+                session,
+                Employer.id,
+                (
+                    item.employer_id
+                    for _, item in valid
+                    if item.employer_id is not None
+                ),
+            )
+            for index, item in valid:
+                if (
+                    item.employer_id is not None
+                    and item.employer_id not in employer_ids
+                ):
+                    errors.append(
+                        item_error(index, "Employer not found", "NOT_FOUND")
+                    )
+                    continue
+                values: dict[str, Any] = item.model_dump(
+                    exclude={"id", "expected_version"}, exclude_none=True
+                )
+                job: Optional[Job] = (
+                    (
+                        await session.scalars(
+                            update_job_statement(
+                                item.id, values, item.expected_version
+                            )
+                        )
+                    )
+                    .unique()
+                    .one_or_none()
+                )
+                if job:
+                    updated[index] = job
+                else:
+                    errors.append(
+                        item_error(index, "Job not found", "NOT_FOUND")
+                    )
+            updated = await reload_items(
+                session, Job, updated, JOB_LOAD_OPTIONS
+            )
+            await session.commit()
+        index_job_changes([job for job in updated if job])
+        return UpdateJobs(jobs=updated, errors=sort_errors(errors))
+
+
+class DeleteJobs(Mutation):  # type: ignore
+    class Arguments:
+        ids = List(NonNull(Int), required=True)
+
+    ids = List(Int)
+    errors = List(lambda: BulkItemErrorType)
+
+    @staticmethod
+    @admin_user
+    async def mutate(
+        root: Optional[Job],
+        info: Optional[GraphQLResolveInfo],
+        ids: list[PositiveInt],
+    ) -> "DeleteJobs":
+        check_bulk_size(ids)
+        deleted: set[int] = set()
         async_session: AsyncSession = await get_session()
-        job = await async_session.get(Job, _id)
-        if not job:
-            raise DatabaseException("Job not found")
-        await async_session.delete(job)
-        await async_session.commit()
-        return DeleteJob(success=True)
+        async with async_session as session:
+            applied: set[int] = await existing_ids(
+                session, Application.job_id, ids
+            )
+            deletable: list[int] = [_id for _id in ids if _id not in applied]
+            if deletable:
+                stmt: ReturningDelete[tuple[int]] = (
+                    delete(Job).where(Job.id.in_(deletable)).returning(Job.id)
+                )
+                try:
+                    deleted = set((await session.scalars(stmt)).all())
+                    await session.commit()
+                except IntegrityError as exc:
+                    raise DatabaseException(
+                        "Job has applications and cannot be deleted"
+                    ) from exc
+        unindex_job_ids(list(deleted))
+        return DeleteJobs(
+            ids=[_id if _id in deleted else None for _id in ids],
+            errors=[
+                (
+                    item_error(
+                        index,
+                        "Job has applications and cannot be deleted",
+                        "CONFLICT",
+                    )
+                    if _id in applied
+                    else item_error(index, "Job not found", "NOT_FOUND")
+                )
+                for index, _id in enumerate(ids)
+                if _id not in deleted
+            ],
+        )
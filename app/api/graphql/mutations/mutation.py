@@ -6,22 +6,40 @@ from graphene import ObjectType
 
 from app.api.graphql.mutations.employer import (
     AddEmployer,
+    AddEmployers,
     DeleteEmployer,
     UpdateEmployer,
 )
-from app.api.graphql.mutations.job import AddJob, DeleteJob, UpdateJob
-from app.api.graphql.mutations.user import AddUser, ApplyToJob, LoginUser
+from app.api.graphql.mutations.job import (
+    AddJob,
+    AddJobs,
+    DeleteJob,
+    DeleteJobs,
+    UpdateJob,
+    UpdateJobs,
+)
+from app.api.graphql.mutations.user import (
+    AddUser,
+    ApplyToJob,
+    ApplyToJobs,
+    LoginUser,
+)
 
 
 class Mutation(ObjectType):  # type: ignore
     add_job = AddJob.Field()
     update_job = UpdateJob.Field()
     delete_job = DeleteJob.Field()
+    add_jobs = AddJobs.Field()
+    update_jobs = UpdateJobs.Field()
+    delete_jobs = DeleteJobs.Field()
 
     add_employer = AddEmployer.Field()
     update_employer = UpdateEmployer.Field()
     delete_employer = DeleteEmployer.Field()
+    add_employers = AddEmployers.Field()
 
     login_user = LoginUser.Field()
     add_user = AddUser.Field()
     apply_to_job = ApplyToJob.Field()
+    apply_to_jobs = ApplyToJobs.Field()
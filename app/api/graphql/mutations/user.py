@@ -4,27 +4,60 @@ A module for user in the app.api.graphql.mutations package.
 
 from typing import Any, Optional
 
-from graphene import Field, Int, Mutation, String
+from graphene import Field, Int, List, Mutation, NonNull, String
 from graphql import GraphQLError
 from graphql.type.definition import GraphQLResolveInfo
 from pydantic import EmailStr, PositiveInt
 from sqlalchemy import Select, select
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.sql.dml import ReturningInsert
 
-from app.api.graphql.types.application import ApplicationType
+from app.api.graphql.mutations.bulk import (
+    check_bulk_size,
+    existing_ids,
+    item_error,
+    load_by_ids,
+    reload_items,
+    sort_errors,
+    validate_items,
+)
+from app.api.graphql.types.application import (
+    ApplicationInput,
+    ApplicationType,
+)
+from app.api.graphql.types.bulk import BulkItemErrorType
 from app.api.graphql.types.user import UserType
-from app.api.oauth2_validation import admin_user, auth_same_user
+from app.api.oauth2_validation import (
+    admin_user,
+    auth_same_user,
+    authenticate_user,
+)
 from app.config.config import auth_setting
 from app.core.security.jwt import build_payload, create_access_token
 from app.core.security.password import hash_password, verify_password
 from app.db.session import get_session
-from app.exceptions.exceptions import NotFoundException
+from app.db.upsert import conflict_insert
+from app.exceptions.exceptions import (
+    AlreadyExistsError,
+    DatabaseException,
+    NotFoundException,
+)
 from app.models.application import Application
 from app.models.employer import Employer
 from app.models.job import Job
 from app.models.user import User
+from app.schemas.external.application import ApplicationCreate
 from app.schemas.external.token import TokenPayload
+from app.schemas.external.user import UserAuth
+
+APPLICATION_LOAD_OPTIONS: tuple[ORMOption, ...] = (
+    joinedload(Application.job),
+    joinedload(Application.user),
+)
 
 
 class LoginUser(Mutation):  # type: ignore
@@ -76,23 +109,28 @@ class AddUser(Mutation):  # type: ignore
         password: str,
         role: str,
     ) -> "AddUser":
-        async_session: AsyncSession = await get_session()
-        stmt = select(User).where(User.email == email)
-        try:
-            user_obj: User | None = (await async_session.scalars(stmt)).first()
-        except SQLAlchemyError as sa_exc:
-            raise sa_exc
-        if user_obj:
-            raise NotFoundException("User already exists with that email")
         hashed_password: str = hash_password(password)
-        user: User = User(
-            username=username,
-            email=email,
-            hashed_password=hashed_password,
-            role=role,
+        stmt: ReturningInsert[tuple[User]] = (
+            conflict_insert(User)
+            .values(
+                username=username,
+                email=email,
+                hashed_password=hashed_password,
+                role=role,
+            )
+            .on_conflict_do_nothing()
+            .returning(User)
         )
-        async_session.add(user)
-        await async_session.commit()
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            user: Optional[User] = (
+                (await session.scalars(stmt)).unique().one_or_none()
+            )
+            if not user:
+                raise AlreadyExistsError(
+                    "User already exists with that username or email"
+                )
+            await session.commit()
         return AddUser(user=user)
 
 
@@ -111,16 +149,113 @@ class ApplyToJob(Mutation):  # type: ignore
         user_id: PositiveInt,
         job_id: PositiveInt,
     ) -> "ApplyToJob":
-        async_session: AsyncSession = await get_session()
-        stmt = select(Application).where(
-            Application.user_id == user_id and Application.job_id == job_id
+        insert_stmt: postgresql.Insert | sqlite.Insert = conflict_insert(
+            Application
+        ).values(user_id=user_id, job_id=job_id)
+        stmt: ReturningInsert[tuple[Application]] = (
+            insert_stmt.on_conflict_do_update(
+                index_elements=[Application.user_id, Application.job_id],
+                set_={"user_id": insert_stmt.excluded.user_id},
+            ).returning(Application)
         )
-        try:
-            application: Application | None = (
-                await async_session.scalars(stmt)
-            ).first()
-        except SQLAlchemyError as sa_exc:
-            raise sa_exc
-        async_session.add(application)
-        await async_session.commit()
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            try:
+                application: Application = (
+                    (await session.scalars(stmt)).unique().one()
+                )
+            except IntegrityError as exc:
+                await session.rollback()
+                if not await existing_ids(session, Job.id, [job_id]):
+                    raise DatabaseException("Job not found") from exc
+                raise DatabaseException("User not found") from exc
+            application = (
+                await load_by_ids(
+                    session,
+                    Application,
+                    [application.id],
+                    APPLICATION_LOAD_OPTIONS,
+                )
+            )[application.id]
+            await session.commit()
         return ApplyToJob(application=application)
+
+
+class ApplyToJobs(Mutation):  # type: ignore
+    class Arguments:
+        applications = List(NonNull(ApplicationInput), required=True)
+
+    applications = List(lambda: ApplicationType)
+    errors = List(lambda: BulkItemErrorType)
+
+    @staticmethod
+    async def mutate(
+        root: Job | None,
+        info: GraphQLResolveInfo | None,
+        applications: list[dict[str, Any]],
+    ) -> "ApplyToJobs":
+        if not isinstance(info, GraphQLResolveInfo):
+            raise GraphQLError("No information available")
+        check_bulk_size(applications)
+        user_auth: UserAuth = await authenticate_user(
+            info.context, auth_setting
+        )
+        valid, errors = validate_items(applications, ApplicationCreate)
+        authorized: list[tuple[int, ApplicationCreate]] = []
+        for index, item in valid:
+            if item.user_id == user_auth.id:
+                authorized.append((index, item))
+            else:
+                errors.append(
+                    item_error(
+                        index,
+                        "You are not authorized to perform this action",
+                        "FORBIDDEN",
+                    )
+                )
+        applied: list[Optional[Application]] = [None] * len(applications)
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            job_ids: set[int] = await existing_ids(
+                session, Job.id, (item.job_id for _, item in authorized)
+            )
+            keys: dict[tuple[int, int], list[int]] = {}
+            for index, item in authorized:
+                if item.job_id in job_ids:
+                    keys.setdefault((item.user_id, item.job_id), []).append(
+                        index
+                    )
+                else:
+                    errors.append(
+                        item_error(index, "Job not found", "NOT_FOUND")
+                    )
+            if keys:
+                insert_stmt: postgresql.Insert | sqlite.Insert = (
+                    conflict_insert(Application)
+                )
+                stmt: ReturningInsert[tuple[Application]] = (
+                    insert_stmt.on_conflict_do_update(
+                        index_elements=[
+                            Application.user_id,
+                            Application.job_id,
+                        ],
+                        set_={"user_id": insert_stmt.excluded.user_id},
+                    ).returning(Application)
+                )
+                inserted = (
+                    await session.scalars(
+                        stmt,
+                        [
+                            {"user_id": user_id, "job_id": job_id}
+                            for user_id, job_id in keys
+                        ],
+                    )
+                ).unique()
+                for application in inserted:
+                    for index in keys[application.user_id, application.job_id]:
+                        applied[index] = application
+                applied = await reload_items(
+                    session, Application, applied, APPLICATION_LOAD_OPTIONS
+                )
+                await session.commit()
+        return ApplyToJobs(applications=applied, errors=sort_errors(errors))
@@ -4,19 +4,30 @@ A module for application in the app.api.graphql.queries package.
 
 from typing import Any, Optional
 
-from graphene import List, ObjectType
+from graphene import List, NonNull, ObjectType
 from graphql.type.definition import GraphQLResolveInfo
 
 from app.api.graphql.resolvers.application import resolver_applications
-from app.api.graphql.types.application import ApplicationType
+from app.api.graphql.types.application import (
+    ApplicationFilter,
+    ApplicationOrderBy,
+    ApplicationType,
+)
 from app.models.application import Application
 
 
 class ApplicationQuery(ObjectType):  # type: ignore
-    applications = List(ApplicationType)
+    applications = List(
+        ApplicationType,
+        filters=ApplicationFilter(),
+        order_by=List(NonNull(ApplicationOrderBy)),
+    )
 
     @staticmethod
     async def resolve_applications(
-        root: Optional[Any], info: Optional[GraphQLResolveInfo]
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        filters: Optional[dict[str, Any]] = None,
+        order_by: Optional[list[dict[str, Any]]] = None,
     ) -> list[Application]:
-        return await resolver_applications()
+        return await resolver_applications(filters, order_by)
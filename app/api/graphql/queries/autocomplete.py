@@ -0,0 +1,31 @@
+"""
+A module for autocomplete queries in the app.api.graphql.queries package.
+"""
+
+from typing import Any, Optional
+
+from graphene import Int, List, ObjectType, String
+from graphql.type.definition import GraphQLResolveInfo
+
+from app.api.graphql.resolvers.autocomplete import resolver_autocomplete
+from app.api.graphql.resolvers.filtering import argument_value
+from app.api.graphql.types.autocomplete import AutocompleteKind
+
+
+class AutocompleteQuery(ObjectType):  # type: ignore
+    autocomplete = List(
+        String,
+        prefix=String(required=True),
+        kind=AutocompleteKind(required=True),
+        limit=Int(),
+    )
+
+    @staticmethod
+    async def resolve_autocomplete(
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        prefix: str,
+        kind: AutocompleteKind,
+        limit: Optional[int] = None,
+    ) -> list[str]:
+        return await resolver_autocomplete(prefix, argument_value(kind), limit)
@@ -0,0 +1,44 @@
+"""
+A module for dashboard queries in the app.api.graphql.queries package.
+"""
+
+from typing import Any, Optional
+
+from graphene import Field, Int, ObjectType
+from graphql.type.definition import GraphQLResolveInfo
+from pydantic import PositiveInt
+
+from app.api.graphql.resolvers.dashboard import (
+    EmployerDashboard,
+    resolver_employer_dashboard,
+)
+from app.api.graphql.types.dashboard import EmployerDashboardType
+
+
+class DashboardQuery(ObjectType):  # type: ignore
+    employer_dashboard = Field(
+        EmployerDashboardType, employer_id=Int(required=True)
+    )
+
+    @staticmethod
+    async def resolve_employer_dashboard(
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        employer_id: PositiveInt,
+    ) -> EmployerDashboardType:
+        dashboard: EmployerDashboard = await resolver_employer_dashboard(
+            employer_id
+        )
+        return EmployerDashboardType(
+            employer_id=dashboard.employer.employer_id,
+            name=dashboard.employer.name,
+            industry=dashboard.employer.industry,
+            jobs_count=dashboard.employer.jobs,
+            applicants_count=dashboard.employer.applicants,
+            industry_rank=dashboard.industry_rank,
+            industry_employers=dashboard.industry_employers,
+            jobs=dashboard.jobs,
+            recent_applicants=dashboard.recent_applicants,
+            staleness_seconds=dashboard.staleness_seconds,
+            pending_changes=dashboard.pending_changes,
+        )
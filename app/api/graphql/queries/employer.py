@@ -4,21 +4,31 @@ A module for employer queries in the app.api.graphql.queries package.
 
 from typing import Any, Optional
 
-from graphene import Field, Int, List, ObjectType
+from graphene import Field, Int, List, NonNull, ObjectType
 from graphql.type.definition import GraphQLResolveInfo
 from pydantic import PositiveInt
 
 from app.api.graphql.resolvers.employer import (
+    EMPLOYER_RELATIONSHIPS,
     resolver_employer,
     resolver_employers,
 )
-from app.api.graphql.types.employer import EmployerType
+from app.api.graphql.resolvers.loaders import unselected_relationships
+from app.api.graphql.types.employer import (
+    EmployerFilter,
+    EmployerOrderBy,
+    EmployerType,
+)
 from app.models.employer import Employer
 
 
 class EmployerQuery(ObjectType):  # type: ignore
-    employers = List(EmployerType)
-    employer = Field(EmployerType, id=Int(required=True))
+    employers = List(
+        EmployerType,
+        filters=EmployerFilter(),
+        order_by=List(NonNull(EmployerOrderBy)),
+    )
+    employer = Field(EmployerType, _id=Int(required=True, name="id"))
 
     @staticmethod
     async def resolve_employer(
@@ -26,10 +36,19 @@ class EmployerQuery(ObjectType):  # type: ignore
         info: Optional[GraphQLResolveInfo],
         _id: PositiveInt,
     ) -> Employer:
-        return await resolver_employer(_id)
+        return await resolver_employer(
+            _id, unselected_relationships(info, EMPLOYER_RELATIONSHIPS)
+        )
 
     @staticmethod
     async def resolve_employers(
-        root: Optional[Any], info: Optional[GraphQLResolveInfo]
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        filters: Optional[dict[str, Any]] = None,
+        order_by: Optional[list[dict[str, Any]]] = None,
     ) -> list[Employer]:
-        return await resolver_employers()
+        return await resolver_employers(
+            filters,
+            order_by,
+            unselected_relationships(info, EMPLOYER_RELATIONSHIPS),
+        )
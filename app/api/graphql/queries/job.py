@@ -4,18 +4,44 @@ A module for job queries in the app.api.graphql.queries package.
 
 from typing import Any, Optional
 
-from graphene import Field, Int, List, ObjectType
+from graphene import Field, Int, List, NonNull, ObjectType, String
 from graphql.type.definition import GraphQLResolveInfo
 from pydantic import PositiveInt
 
-from app.api.graphql.resolvers.job import resolver_job, resolver_jobs
-from app.api.graphql.types.job import JobType
+from app.api.graphql.resolvers.job import (
+    JOB_RELATIONSHIPS,
+    resolver_job,
+    resolver_jobs,
+)
+from app.api.graphql.resolvers.loaders import unselected_relationships
+from app.api.graphql.resolvers.search import (
+    SearchHit,
+    encode_cursor,
+    resolver_count_jobs,
+    resolver_search_jobs,
+)
+from app.api.graphql.types.job import JobFilter, JobOrderBy, JobType
+from app.api.graphql.types.search import (
+    JobSearchEdgeType,
+    JobSearchResultType,
+)
 from app.models.job import Job
+from app.utils.graphql_utils import selected_fields
 
 
 class JobQuery(ObjectType):  # type: ignore
-    jobs = List(JobType)
-    job = Field(JobType, id=Int(required=True))
+    jobs = List(
+        JobType,
+        filters=JobFilter(),
+        order_by=List(NonNull(JobOrderBy)),
+    )
+    job = Field(JobType, _id=Int(required=True, name="id"))
+    search_jobs = Field(
+        JobSearchResultType,
+        query=String(required=True),
+        first=Int(),
+        after=String(),
+    )
 
     @staticmethod
     async def resolve_job(
@@ -23,10 +49,48 @@ class JobQuery(ObjectType):  # type: ignore
         info: Optional[GraphQLResolveInfo],
         _id: PositiveInt,
     ) -> Job:
-        return await resolver_job(_id)
+        return await resolver_job(
+            _id, unselected_relationships(info, JOB_RELATIONSHIPS)
+        )
 
     @staticmethod
     async def resolve_jobs(
-        root: Optional[Any], info: Optional[GraphQLResolveInfo]
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        filters: Optional[dict[str, Any]] = None,
+        order_by: Optional[list[dict[str, Any]]] = None,
     ) -> list[Job]:
-        return await resolver_jobs()
+        return await resolver_jobs(
+            filters,
+            order_by,
+            unselected_relationships(info, JOB_RELATIONSHIPS),
+        )
+
+    @staticmethod
+    async def resolve_search_jobs(
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        query: str,
+        first: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> JobSearchResultType:
+        hits: list[SearchHit]
+        hits, has_next_page = await resolver_search_jobs(query, first, after)
+        edges: list[JobSearchEdgeType] = [
+            JobSearchEdgeType(
+                cursor=encode_cursor(hit.rank, hit.job.id),
+                rank=hit.rank,
+                node=hit.job,
+            )
+            for hit in hits
+        ]
+        fields: Optional[frozenset[str]] = selected_fields(info)
+        total_count: Optional[int] = None
+        if fields is None or "totalCount" in fields:
+            total_count = await resolver_count_jobs(query)
+        return JobSearchResultType(
+            edges=edges,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_next_page=has_next_page,
+            total_count=total_count,
+        )
@@ -5,6 +5,8 @@ A module for combining all queries in the app.api.graphql.queries package.
 from graphene import ObjectType
 
 from .application import ApplicationQuery
+from .autocomplete import AutocompleteQuery
+from .dashboard import DashboardQuery
 from .employer import EmployerQuery
 from .job import JobQuery
 from .user import UserQuery
@@ -15,6 +17,8 @@ class Query(
     EmployerQuery,
     UserQuery,
     ApplicationQuery,
+    AutocompleteQuery,
+    DashboardQuery,
     ObjectType,  # type: ignore
 ):
     pass
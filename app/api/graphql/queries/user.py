@@ -4,24 +4,40 @@ A module for user in the app.api.graphql.queries package.
 
 from typing import Any, Optional
 
-from graphene import Field, Int, List, ObjectType
+from graphene import Field, Int, List, NonNull, ObjectType
 from graphql.type.definition import GraphQLResolveInfo
 from pydantic import PositiveInt
 
-from app.api.graphql.resolvers.user import resolver_user, resolver_users
-from app.api.graphql.types.user import UserType
+from app.api.graphql.resolvers.loaders import unselected_relationships
+from app.api.graphql.resolvers.user import (
+    USER_RELATIONSHIPS,
+    resolver_user,
+    resolver_users,
+)
+from app.api.graphql.types.user import UserFilter, UserOrderBy, UserType
 from app.models.user import User
 
 
 class UserQuery(ObjectType):  # type: ignore
-    users = List(UserType)
-    user = Field(UserType, id=Int(required=True))
+    users = List(
+        UserType,
+        filters=UserFilter(),
+        order_by=List(NonNull(UserOrderBy)),
+    )
+    user = Field(UserType, _id=Int(required=True, name="id"))
 
     @staticmethod
     async def resolve_users(
-        root: Optional[Any], info: Optional[GraphQLResolveInfo]
+        root: Optional[Any],
+        info: Optional[GraphQLResolveInfo],
+        filters: Optional[dict[str, Any]] = None,
+        order_by: Optional[list[dict[str, Any]]] = None,
     ) -> list[User]:
-        return await resolver_users()
+        return await resolver_users(
+            filters,
+            order_by,
+            unselected_relationships(info, USER_RELATIONSHIPS),
+        )
 
     @staticmethod
     async def resolve_user(
@@ -29,4 +45,6 @@ class UserQuery(ObjectType):  # type: ignore
         info: Optional[GraphQLResolveInfo],
         _id: PositiveInt,
     ) -> User:
-        return await resolver_user(_id)
+        return await resolver_user(
+            _id, unselected_relationships(info, USER_RELATIONSHIPS)
+        )
@@ -2,17 +2,42 @@
 A module for application in the app.api.graphql.resolvers package.
 """
 
-from sqlalchemy import Result, select
+from typing import Any, Mapping, Optional, Sequence
+
+from sqlalchemy import Result, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
+from app.api.graphql.resolvers.filtering import (
+    FilterClause,
+    filter_statement,
+    order_statement,
+)
 from app.db.session import get_session
 from app.models.application import Application
 
+APPLICATION_FILTERS: dict[str, FilterClause] = {
+    "user_id": lambda value: Application.user_id == value,
+    "job_id": lambda value: Application.job_id == value,
+}
+APPLICATION_ORDER_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": Application.id,
+    "user_id": Application.user_id,
+    "job_id": Application.job_id,
+}
+
 
-async def resolver_applications() -> list[Application]:
+async def resolver_applications(
+    filters: Optional[Mapping[str, Any]] = None,
+    order_by: Optional[Sequence[Mapping[str, Any]]] = None,
+) -> list[Application]:
+    stmt: Select[tuple[Application]] = order_statement(
+        filter_statement(select(Application), filters, APPLICATION_FILTERS),
+        order_by,
+        APPLICATION_ORDER_COLUMNS,
+        Application.id,
+    )
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        result: Result[tuple[Application]] = await session.execute(
-            select(Application)
-        )
-    return list(result.scalars().all())
+        result: Result[tuple[Application]] = await session.execute(stmt)
+    return list(result.unique().scalars().all())
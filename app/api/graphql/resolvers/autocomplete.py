@@ -0,0 +1,39 @@
+"""
+A module for autocomplete in the app.api.graphql.resolvers package.
+"""
+
+from typing import Optional
+
+from app.config.config import performance_setting
+from app.core.prefix_index import PrefixIndex, prefix_indexes
+from app.db.prefix_indexes import load_prefix_indexes
+from app.exceptions.exceptions import InvalidArgumentError
+
+
+async def resolver_autocomplete(
+    prefix: str, kind: str, limit: Optional[int] = None
+) -> list[str]:
+    """
+    Suggest the labels of a column that start with a prefix
+    :param prefix: The typed prefix
+    :type prefix: str
+    :param kind: The column to suggest labels from
+    :type kind: str
+    :param limit: The maximum number of suggestions, if not the default
+    :type limit: Optional[int]
+    :return: The suggestions in alphabetical order
+    :rtype: list[str]
+    """
+    if limit is None:
+        limit = performance_setting.AUTOCOMPLETE_LIMIT
+    if not 1 <= limit <= performance_setting.AUTOCOMPLETE_MAX_LIMIT:
+        raise InvalidArgumentError(
+            "limit must be between 1 and"
+            f" {performance_setting.AUTOCOMPLETE_MAX_LIMIT}"
+        )
+    if not prefix:
+        return []
+    index: PrefixIndex = prefix_indexes[kind]
+    if not index.ready:
+        await load_prefix_indexes()
+    return index.search(prefix, limit)
@@ -0,0 +1,107 @@
+"""
+A module for dashboard in the app.api.graphql.resolvers package.
+The dashboard is read from its read model only. When the read model is
+ further behind the writes than DASHBOARD_MAX_STALENESS_SECONDS, the
+ pending changes are applied before reading it, and the staleness it is
+ read with is returned along with it. They are applied as well when the
+ employer is not in the read model yet but has pending changes, so a new
+ employer is not reported as missing.
+"""
+
+from typing import NamedTuple
+
+from pydantic import PositiveInt
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.config import performance_setting
+from app.db.dashboard import (
+    dashboard_refresher,
+    dashboard_staleness,
+    employer_pending,
+)
+from app.db.session import get_session
+from app.exceptions.exceptions import DatabaseException
+from app.models.dashboard import (
+    DashboardApplicant,
+    DashboardEmployer,
+    DashboardJob,
+)
+
+
+class EmployerDashboard(NamedTuple):
+    """
+    The dashboard of an employer and how stale it is
+    """
+
+    employer: DashboardEmployer
+    industry_rank: int
+    industry_employers: int
+    jobs: list[DashboardJob]
+    recent_applicants: list[DashboardApplicant]
+    staleness_seconds: float
+    pending_changes: int
+
+
+async def resolver_employer_dashboard(
+    employer_id: PositiveInt,
+) -> EmployerDashboard:
+    """
+    Read the dashboard of an employer from the read model
+    :param employer_id: The id of the employer
+    :type employer_id: PositiveInt
+    :return: The dashboard of the employer
+    :rtype: EmployerDashboard
+    """
+    staleness, pending = await dashboard_staleness()
+    if staleness > performance_setting.DASHBOARD_MAX_STALENESS_SECONDS or (
+        pending and await employer_pending(employer_id)
+    ):
+        await dashboard_refresher.refresh()
+        staleness, pending = await dashboard_staleness()
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        employer = await session.get(DashboardEmployer, employer_id)
+        if not employer:
+            raise DatabaseException("Employer not found")
+        ahead: int = (
+            await session.scalar(
+                select(func.count()).where(
+                    DashboardEmployer.industry == employer.industry,
+                    DashboardEmployer.applicants > employer.applicants,
+                )
+            )
+            or 0
+        )
+        industry_employers: int = (
+            await session.scalar(
+                select(func.count()).where(
+                    DashboardEmployer.industry == employer.industry
+                )
+            )
+            or 0
+        )
+        jobs: list[DashboardJob] = list(
+            await session.scalars(
+                select(DashboardJob)
+                .where(DashboardJob.employer_id == employer_id)
+                .order_by(DashboardJob.applicants.desc(), DashboardJob.job_id)
+            )
+        )
+        recent_applicants: list[DashboardApplicant] = list(
+            await session.scalars(
+                select(DashboardApplicant)
+                .where(DashboardApplicant.employer_id == employer_id)
+                .order_by(DashboardApplicant.application_id.desc())
+                .limit(performance_setting.DASHBOARD_RECENT_APPLICANTS)
+            )
+        )
+    return EmployerDashboard(
+        employer,
+        ahead + 1,
+        industry_employers,
+        jobs,
+        recent_applicants,
+        staleness,
+        pending,
+    )
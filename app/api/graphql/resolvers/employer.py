@@ -2,28 +2,59 @@
 A module for employer resolvers in the app.api.graphql.resolvers package.
 """
 
+from typing import Any, Mapping, Optional, Sequence
+
 from pydantic import PositiveInt
-from sqlalchemy import Result, select
+from sqlalchemy import Result, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.api.graphql.resolvers.filtering import (
+    FilterClause,
+    filter_statement,
+    order_statement,
+)
 from app.db.session import get_session
 from app.exceptions.exceptions import DatabaseException
 from app.models.employer import Employer
 
+EMPLOYER_FILTERS: dict[str, FilterClause] = {
+    "industry": lambda value: Employer.industry == value,
+}
+EMPLOYER_ORDER_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": Employer.id,
+    "contact_email": Employer.contact_email,
+}
+
+EMPLOYER_RELATIONSHIPS: dict[str, InstrumentedAttribute[Any]] = {
+    "jobs": Employer.jobs,
+}
+
 
-async def resolver_employers() -> list[Employer]:
+async def resolver_employers(
+    filters: Optional[Mapping[str, Any]] = None,
+    order_by: Optional[Sequence[Mapping[str, Any]]] = None,
+    options: Sequence[ORMOption] = (),
+) -> list[Employer]:
+    stmt: Select[tuple[Employer]] = order_statement(
+        filter_statement(select(Employer), filters, EMPLOYER_FILTERS),
+        order_by,
+        EMPLOYER_ORDER_COLUMNS,
+        Employer.id,
+    ).options(*options)
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        result: Result[tuple[Employer]] = await session.execute(
-            select(Employer)
-        )
-    return list(result.scalars().all())
+        result: Result[tuple[Employer]] = await session.execute(stmt)
+    return list(result.unique().scalars().all())
 
 
-async def resolver_employer(_id: PositiveInt) -> Employer:
+async def resolver_employer(
+    _id: PositiveInt, options: Sequence[ORMOption] = ()
+) -> Employer:
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        employer = await session.get(Employer, _id)
+        employer = await session.get(Employer, _id, options=options)
         if not employer:
             raise DatabaseException("Employer not found")
-    return Employer(employer)
+    return employer
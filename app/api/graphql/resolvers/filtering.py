@@ -0,0 +1,83 @@
+"""
+A module for filtering in the app.api.graphql.resolvers package.
+The filter and orderBy arguments are compiled into the WHERE and ORDER
+ BY clauses of the list queries. Every resolver declares the clauses it
+ accepts, so only allow-listed, indexed columns ever reach the SQL.
+"""
+
+from enum import Enum
+from typing import Any, Callable, Mapping, Optional, Sequence, TypeVar
+
+from graphql import GraphQLError
+from sqlalchemy import ColumnElement, Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+FilterClause = Callable[[Any], ColumnElement[bool]]
+SelectT = TypeVar("SelectT", bound=Select[Any])
+
+
+def argument_value(argument: Any) -> Any:
+    """
+    Get the value of an argument, unwrapping GraphQL enum members
+    :param argument: The argument as received by the resolver
+    :type argument: Any
+    :return: The plain value
+    :rtype: Any
+    """
+    return argument.value if isinstance(argument, Enum) else argument
+
+
+def filter_statement(
+    stmt: SelectT,
+    filters: Optional[Mapping[str, Any]],
+    clauses: Mapping[str, FilterClause],
+) -> SelectT:
+    """
+    Add a WHERE clause for every filter that was given
+    :param stmt: The list query
+    :type stmt: SelectT
+    :param filters: The filter input of the query, if any
+    :type filters: Optional[Mapping[str, Any]]
+    :param clauses: The allow-listed filters and the clause each builds
+    :type clauses: Mapping[str, FilterClause]
+    :return: The filtered query
+    :rtype: SelectT
+    """
+    for name, value in (filters or {}).items():
+        if value is None:
+            continue
+        if name not in clauses:
+            raise GraphQLError(f"Filtering by {name} is not supported")
+        stmt = stmt.where(clauses[name](argument_value(value)))
+    return stmt
+
+
+def order_statement(
+    stmt: SelectT,
+    order_by: Optional[Sequence[Mapping[str, Any]]],
+    columns: Mapping[str, InstrumentedAttribute[Any]],
+    tie_breaker: InstrumentedAttribute[Any],
+) -> SelectT:
+    """
+    Add the ORDER BY clause of the requested sort, ending with a unique
+     column so pages of the same sort never shuffle
+    :param stmt: The list query
+    :type stmt: SelectT
+    :param order_by: The orderBy input of the query, if any
+    :type order_by: Optional[Sequence[Mapping[str, Any]]]
+    :param columns: The allow-listed sort fields and their columns
+    :type columns: Mapping[str, InstrumentedAttribute[Any]]
+    :param tie_breaker: The unique column that ends the sort
+    :type tie_breaker: InstrumentedAttribute[Any]
+    :return: The sorted query
+    :rtype: SelectT
+    """
+    clauses: list[ColumnElement[Any]] = []
+    for item in order_by or []:
+        field: str = argument_value(item["field"])
+        if field not in columns:
+            raise GraphQLError(f"Sorting by {field} is not supported")
+        column: InstrumentedAttribute[Any] = columns[field]
+        descending: bool = argument_value(item.get("direction")) == "desc"
+        clauses.append(column.desc() if descending else column.asc())
+    return stmt.order_by(*clauses, tie_breaker.asc())
@@ -2,26 +2,63 @@
 A module for job resolvers in the app.api.graphql.resolvers package.
 """
 
+from typing import Any, Mapping, Optional, Sequence
+
 from pydantic import PositiveInt
-from sqlalchemy import Result, select
+from sqlalchemy import Result, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.api.graphql.resolvers.filtering import (
+    FilterClause,
+    filter_statement,
+    order_statement,
+)
 from app.db.session import get_session
 from app.exceptions.exceptions import DatabaseException
+from app.models.employer import Employer
 from app.models.job import Job
 
+JOB_FILTERS: dict[str, FilterClause] = {
+    "employer_id": lambda value: Job.employer_id == value,
+    "title_contains": lambda value: Job.title.contains(value, autoescape=True),
+    "industry": lambda value: Job.employer.has(Employer.industry == value),
+}
+JOB_ORDER_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": Job.id,
+    "employer_id": Job.employer_id,
+}
+
+JOB_RELATIONSHIPS: dict[str, InstrumentedAttribute[Any]] = {
+    "employer": Job.employer,
+    "applications": Job.applications,
+}
+
 
-async def resolver_jobs() -> list[Job]:
+async def resolver_jobs(
+    filters: Optional[Mapping[str, Any]] = None,
+    order_by: Optional[Sequence[Mapping[str, Any]]] = None,
+    options: Sequence[ORMOption] = (),
+) -> list[Job]:
+    stmt: Select[tuple[Job]] = order_statement(
+        filter_statement(select(Job), filters, JOB_FILTERS),
+        order_by,
+        JOB_ORDER_COLUMNS,
+        Job.id,
+    ).options(*options)
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        result: Result[tuple[Job]] = await session.execute(select(Job))
-    return list(result.scalars().all())
+        result: Result[tuple[Job]] = await session.execute(stmt)
+    return list(result.unique().scalars().all())
 
 
-async def resolver_job(_id: PositiveInt) -> Job:
+async def resolver_job(
+    _id: PositiveInt, options: Sequence[ORMOption] = ()
+) -> Job:
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        job = await session.get(Job, _id)
+        job = await session.get(Job, _id, options=options)
         if not job:
             raise DatabaseException("Job not found")
-    return Job(job)
+    return job
@@ -0,0 +1,160 @@
+"""
+A module for loaders in the app.api.graphql.resolvers package.
+The loaders of a request collect the keys its field resolvers ask for
+ while the items of a list are resolved, and look them all up with one
+ statement once every resolver of that step has asked. They are kept in
+ the context of the request, so their results are shared by its fields.
+"""
+
+import asyncio
+from typing import Any, Mapping, Optional
+
+from graphql import GraphQLResolveInfo
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, noload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.db.session import get_session
+from app.models.application import Application
+from app.utils.graphql_utils import selected_fields
+
+LOADERS_CONTEXT_KEY: str = "loaders"
+
+
+async def count_by(
+    column: InstrumentedAttribute[int], keys: list[int]
+) -> dict[int, int]:
+    """
+    Count the rows of each key of a foreign key column with one GROUP BY
+     statement, without loading the rows
+    :param column: The foreign key column to group by
+    :type column: InstrumentedAttribute[int]
+    :param keys: The parent ids to count the rows of
+    :type keys: list[int]
+    :return: The number of rows of every key that has any
+    :rtype: dict[int, int]
+    """
+    stmt: Select[tuple[int, int]] = (
+        select(column, func.count()).where(column.in_(keys)).group_by(column)
+    )
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        result = await session.execute(stmt)
+    return dict(result.tuples().all())
+
+
+class CountLoader:
+    """
+    Number of child rows per parent id, counted in batches
+    """
+
+    def __init__(self, column: InstrumentedAttribute[int]):
+        self.column: InstrumentedAttribute[int] = column
+        self.counts: dict[int, asyncio.Future[int]] = {}
+        self.pending: list[int] = []
+        self.batches: set[asyncio.Task[None]] = set()
+
+    def load(self, key: int) -> asyncio.Future[int]:
+        """
+        Get the number of child rows of a parent, counted with the other
+         keys requested in the same step
+        :param key: The id of the parent
+        :type key: int
+        :return: A future resolved with the number of child rows
+        :rtype: asyncio.Future[int]
+        """
+        future: Optional[asyncio.Future[int]] = self.counts.get(key)
+        if future is not None:
+            return future
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.counts[key] = future
+        if not self.pending:
+            loop.call_soon(self.schedule_batch)
+        self.pending.append(key)
+        return future
+
+    def schedule_batch(self) -> None:
+        """
+        Start counting the pending keys, keeping a reference to the task
+         until it is done
+        :return: None
+        :rtype: NoneType
+        """
+        keys: list[int] = self.pending
+        self.pending = []
+        task: asyncio.Task[None] = asyncio.create_task(self.count(keys))
+        self.batches.add(task)
+        task.add_done_callback(self.batches.discard)
+
+    async def count(self, keys: list[int]) -> None:
+        """
+        Count the rows of a batch of keys and resolve their futures
+        :param keys: The parent ids of the batch
+        :type keys: list[int]
+        :return: None
+        :rtype: NoneType
+        """
+        try:
+            counts: dict[int, int] = await count_by(self.column, keys)
+        except Exception as exc:
+            for key in keys:
+                self.counts[key].set_exception(exc)
+            return
+        for key in keys:
+            self.counts[key].set_result(counts.get(key, 0))
+
+
+class RequestLoaders:
+    """
+    The loaders of a GraphQL request
+    """
+
+    def __init__(self) -> None:
+        self.user_applications_count: CountLoader = CountLoader(
+            Application.user_id
+        )
+
+
+def get_loaders(info: Optional[GraphQLResolveInfo]) -> RequestLoaders:
+    """
+    Get the loaders of the request being resolved, creating them on the
+     first use
+    :param info: The GraphQL resolve info, if any
+    :type info: Optional[GraphQLResolveInfo]
+    :return: The loaders of the request, or new ones when the request
+     has no context to keep them in
+    :rtype: RequestLoaders
+    """
+    context: Any = None if info is None else info.context
+    if not isinstance(context, dict):
+        return RequestLoaders()
+    loaders: Optional[RequestLoaders] = context.get(LOADERS_CONTEXT_KEY)
+    if loaders is None:
+        loaders = context[LOADERS_CONTEXT_KEY] = RequestLoaders()
+    return loaders
+
+
+def unselected_relationships(
+    info: Optional[GraphQLResolveInfo],
+    relationships: Mapping[str, InstrumentedAttribute[Any]],
+) -> list[ORMOption]:
+    """
+    Get the options that skip loading the relationships the operation
+     does not select
+    :param info: The GraphQL resolve info, if any
+    :type info: Optional[GraphQLResolveInfo]
+    :param relationships: The relationships by the name of their field
+    :type relationships: Mapping[str, InstrumentedAttribute[Any]]
+    :return: The loader options, none if the selection is not known
+    :rtype: list[ORMOption]
+    """
+    fields: Optional[frozenset[str]] = selected_fields(info)
+    if fields is None:
+        return []
+    return [
+        noload(relationship)
+        for name, relationship in relationships.items()
+        if name not in fields
+    ]
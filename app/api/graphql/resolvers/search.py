@@ -0,0 +1,243 @@
+"""
+A module for search in the app.api.graphql.resolvers package.
+On PostgreSQL jobs are matched against the generated search_vector
+ column, served by its GIN index, and ordered by ts_rank. Other backends
+ rank them with the in-process inverted index. Both produce a page of
+ (rank, id) pairs ordered by rank and then id, which is what the cursor
+ of a page encodes, and the jobs of the page are loaded afterwards.
+"""
+
+import asyncio
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from bisect import bisect_right
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    cast,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.config import performance_setting
+from app.core.search_index import job_index, job_text
+from app.db.session import async_engine, get_session
+from app.exceptions.exceptions import InvalidArgumentError
+from app.models.job import SEARCH_CONFIGURATION, Job
+
+JOB_SEARCH_VECTOR = literal_column("job.search_vector", TSVECTOR)
+RankedId = tuple[float, int]
+
+_index_lock: asyncio.Lock = asyncio.Lock()
+
+
+class SearchHit(NamedTuple):
+    """
+    A job matching a search and its rank
+    """
+
+    job: Job
+    rank: float
+
+
+def encode_cursor(rank: float, job_id: int) -> str:
+    """
+    Encode the position of a hit as an opaque cursor
+    :param rank: The rank of the hit
+    :type rank: float
+    :param job_id: The id of the job
+    :type job_id: int
+    :return: The cursor
+    :rtype: str
+    """
+    return urlsafe_b64encode(f"{rank!r}:{job_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> RankedId:
+    """
+    Decode a cursor returned by a previous search
+    :param cursor: The cursor
+    :type cursor: str
+    :return: The rank and job id the cursor points at
+    :rtype: RankedId
+    """
+    try:
+        rank, job_id = urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return float(rank), int(job_id)
+    except (ValueError, binascii.Error) as exc:
+        raise InvalidArgumentError("Invalid search cursor") from exc
+
+
+def page_size(first: Optional[int]) -> int:
+    """
+    Validate the requested page size
+    :param first: The number of hits requested, if any
+    :type first: Optional[int]
+    :return: The page size
+    :rtype: int
+    """
+    if first is None:
+        return performance_setting.SEARCH_PAGE_SIZE
+    if not 1 <= first <= performance_setting.SEARCH_MAX_PAGE_SIZE:
+        raise InvalidArgumentError(
+            "first must be between 1 and"
+            f" {performance_setting.SEARCH_MAX_PAGE_SIZE}"
+        )
+    return first
+
+
+def match_jobs_sql(query: str) -> tuple[ColumnElement[bool], Any]:
+    """
+    Build the full-text condition of a search on PostgreSQL
+    :param query: The search text, in web search syntax
+    :type query: str
+    :return: The condition matching the jobs and its text search query
+    :rtype: tuple[ColumnElement[bool], Any]
+    """
+    tsquery = func.websearch_to_tsquery(
+        cast(SEARCH_CONFIGURATION, REGCONFIG), query
+    )
+    return JOB_SEARCH_VECTOR.op("@@")(tsquery), tsquery
+
+
+async def rank_jobs_sql(
+    session: AsyncSession, query: str, after: Optional[RankedId], limit: int
+) -> list[RankedId]:
+    """
+    Rank the jobs matching a search with PostgreSQL full-text search
+    :param session: The session of the search
+    :type session: AsyncSession
+    :param query: The search text, in web search syntax
+    :type query: str
+    :param after: The position to continue after, if any
+    :type after: Optional[RankedId]
+    :param limit: The number of hits to return
+    :type limit: int
+    :return: The rank and id of the hits
+    :rtype: list[RankedId]
+    """
+    match, tsquery = match_jobs_sql(query)
+    rank = func.ts_rank(JOB_SEARCH_VECTOR, tsquery)
+    stmt = select(rank, Job.id).where(match)
+    if after is not None:
+        after_rank, after_id = after
+        stmt = stmt.where(
+            or_(rank < after_rank, and_(rank == after_rank, Job.id > after_id))
+        )
+    stmt = stmt.order_by(rank.desc(), Job.id).limit(limit)
+    return [
+        (float(job_rank), job_id)
+        for job_rank, job_id in (await session.execute(stmt)).all()
+    ]
+
+
+async def build_job_index(session: AsyncSession) -> None:
+    """
+    Load every job into the in-process index, once
+    :param session: The session to read the jobs with
+    :type session: AsyncSession
+    :return: None
+    :rtype: NoneType
+    """
+    async with _index_lock:
+        if job_index.ready:
+            return
+        result = await session.execute(
+            select(Job.id, Job.title, Job.description)
+        )
+        for job_id, title, description in result:
+            job_index.add(job_id, job_text(title, description))
+        job_index.ready = True
+
+
+async def rank_jobs_in_process(
+    session: AsyncSession, query: str, after: Optional[RankedId], limit: int
+) -> list[RankedId]:
+    """
+    Rank the jobs matching a search with the in-process index
+    :param session: The session to build the index with
+    :type session: AsyncSession
+    :param query: The search text
+    :type query: str
+    :param after: The position to continue after, if any
+    :type after: Optional[RankedId]
+    :param limit: The number of hits to return
+    :type limit: int
+    :return: The rank and id of the hits
+    :rtype: list[RankedId]
+    """
+    await build_job_index(session)
+    ranked: list[RankedId] = job_index.search(query)
+    start: int = 0
+    if after is not None:
+        start = bisect_right(
+            ranked,
+            (-after[0], after[1]),
+            key=lambda hit: (-hit[0], hit[1]),
+        )
+    return ranked[start : start + limit]
+
+
+async def resolver_count_jobs(query: str) -> int:
+    """
+    Count every job matching a search, without loading them
+    :param query: The search text
+    :type query: str
+    :return: The number of matching jobs
+    :rtype: int
+    """
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        if async_engine.dialect.name != "postgresql":
+            await build_job_index(session)
+            return len(job_index.search(query))
+        match, _ = match_jobs_sql(query)
+        total: Optional[int] = await session.scalar(
+            select(func.count()).select_from(Job).where(match)
+        )
+    return total or 0
+
+
+async def resolver_search_jobs(
+    query: str, first: Optional[int] = None, after: Optional[str] = None
+) -> tuple[list[SearchHit], bool]:
+    """
+    Search jobs by the words of their title and description
+    :param query: The search text
+    :type query: str
+    :param first: The number of hits to return, if not the default
+    :type first: Optional[int]
+    :param after: The cursor of the last hit of the previous page
+    :type after: Optional[str]
+    :return: The hits of the page and whether more hits follow
+    :rtype: tuple[list[SearchHit], bool]
+    """
+    size: int = page_size(first)
+    position: Optional[RankedId] = decode_cursor(after) if after else None
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        if async_engine.dialect.name == "postgresql":
+            ranked = await rank_jobs_sql(session, query, position, size + 1)
+        else:
+            ranked = await rank_jobs_in_process(
+                session, query, position, size + 1
+            )
+        page: list[RankedId] = ranked[:size]
+        jobs: dict[int, Job] = {
+            job.id: job
+            for job in (
+                await session.scalars(
+                    select(Job).where(Job.id.in_([_id for _, _id in page]))
+                )
+            ).unique()
+        }
+    hits: list[SearchHit] = [
+        SearchHit(jobs[job_id], rank) for rank, job_id in page if job_id in jobs
+    ]
+    return hits, len(ranked) > size
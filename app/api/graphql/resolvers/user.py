@@ -2,26 +2,62 @@
 A module for user in the app.api.graphql.resolvers package.
 """
 
+from typing import Any, Mapping, Optional, Sequence
+
 from pydantic import PositiveInt
-from sqlalchemy import Result, select
+from sqlalchemy import Result, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.api.graphql.resolvers.filtering import (
+    FilterClause,
+    filter_statement,
+    order_statement,
+)
 from app.db.session import get_session
 from app.exceptions.exceptions import DatabaseException
 from app.models.user import User
 
+USER_FILTERS: dict[str, FilterClause] = {
+    "created_after": lambda value: User.created_at >= value,
+    "created_before": lambda value: User.created_at < value,
+}
+USER_ORDER_COLUMNS: dict[str, InstrumentedAttribute[Any]] = {
+    "id": User.id,
+    "username": User.username,
+    "email": User.email,
+    "created_at": User.created_at,
+}
+
+USER_RELATIONSHIPS: dict[str, InstrumentedAttribute[Any]] = {
+    "applications": User.applications,
+}
+
 
-async def resolver_users() -> list[User]:
+async def resolver_users(
+    filters: Optional[Mapping[str, Any]] = None,
+    order_by: Optional[Sequence[Mapping[str, Any]]] = None,
+    options: Sequence[ORMOption] = (),
+) -> list[User]:
+    stmt: Select[tuple[User]] = order_statement(
+        filter_statement(select(User), filters, USER_FILTERS),
+        order_by,
+        USER_ORDER_COLUMNS,
+        User.id,
+    ).options(*options)
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        result: Result[tuple[User]] = await session.execute(select(User))
-    return list(result.scalars().all())
+        result: Result[tuple[User]] = await session.execute(stmt)
+    return list(result.unique().scalars().all())
 
 
-async def resolver_user(_id: PositiveInt) -> User:
+async def resolver_user(
+    _id: PositiveInt, options: Sequence[ORMOption] = ()
+) -> User:
     async_session: AsyncSession = await get_session()
     async with async_session as session:
-        job = await session.get(User, _id)
-        if not job:
+        user = await session.get(User, _id, options=options)
+        if not user:
             raise DatabaseException("User not found")
-    return User(job)
+    return user
@@ -5,14 +5,27 @@ Package app.api.graphql.types initialization.
 from graphene import ObjectType
 
 from .application import ApplicationType
+from .bulk import BulkItemErrorType
+from .dashboard import (
+    DashboardApplicantType,
+    DashboardJobType,
+    EmployerDashboardType,
+)
 from .employer import EmployerType
 from .job import JobType
+from .search import JobSearchEdgeType, JobSearchResultType
 from .user import UserType
 
 # Export a list of models in the order you want them called.
 __all__: list[ObjectType] = [
     ApplicationType,
+    BulkItemErrorType,
+    DashboardApplicantType,
+    DashboardJobType,
+    EmployerDashboardType,
     EmployerType,
     JobType,
+    JobSearchEdgeType,
+    JobSearchResultType,
     UserType,
 ]
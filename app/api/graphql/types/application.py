@@ -4,9 +4,10 @@ A module for application in the app.api.graphql.types package.
 
 from typing import Optional
 
-from graphene import Field, Int, ObjectType
+from graphene import Enum, Field, InputObjectType, Int, ObjectType
 from graphql import GraphQLResolveInfo
 
+from app.api.graphql.types.sorting import SortDirection
 from app.models.application import Application
 from app.models.job import Job
 from app.models.user import User
@@ -30,3 +31,24 @@ class ApplicationType(ObjectType):  # type: ignore
         root: Optional[Application], info: Optional[GraphQLResolveInfo]
     ) -> Job | None:
         return None if root is None else root.job
+
+
+class ApplicationInput(InputObjectType):  # type: ignore
+    user_id = Int(required=True)
+    job_id = Int(required=True)
+
+
+class ApplicationFilter(InputObjectType):  # type: ignore
+    user_id = Int()
+    job_id = Int()
+
+
+class ApplicationOrderField(Enum):  # type: ignore
+    ID = "id"
+    USER_ID = "user_id"
+    JOB_ID = "job_id"
+
+
+class ApplicationOrderBy(InputObjectType):  # type: ignore
+    field = ApplicationOrderField(required=True)
+    direction = SortDirection(default_value="asc")
@@ -0,0 +1,13 @@
+"""
+A module for autocomplete in the app.api.graphql.types package.
+"""
+
+from graphene import Enum
+
+from app.core.prefix_index import EMPLOYER_NAME, INDUSTRY, JOB_TITLE
+
+
+class AutocompleteKind(Enum):  # type: ignore
+    JOB_TITLE = JOB_TITLE
+    EMPLOYER_NAME = EMPLOYER_NAME
+    INDUSTRY = INDUSTRY
@@ -0,0 +1,11 @@
+"""
+A module for bulk in the app.api.graphql.types package.
+"""
+
+from graphene import Int, ObjectType, String
+
+
+class BulkItemErrorType(ObjectType):  # type: ignore
+    index = Int()
+    message = String()
+    code = String()
@@ -0,0 +1,33 @@
+"""
+A module for dashboard in the app.api.graphql.types package.
+"""
+
+from graphene import Float, Int, List, ObjectType, String
+
+
+class DashboardJobType(ObjectType):  # type: ignore
+    job_id = Int()
+    title = String()
+    applicants = Int()
+
+
+class DashboardApplicantType(ObjectType):  # type: ignore
+    application_id = Int()
+    job_id = Int()
+    job_title = String()
+    user_id = Int()
+    username = String()
+
+
+class EmployerDashboardType(ObjectType):  # type: ignore
+    employer_id = Int()
+    name = String()
+    industry = String()
+    jobs_count = Int()
+    applicants_count = Int()
+    industry_rank = Int()
+    industry_employers = Int()
+    jobs = List(DashboardJobType)
+    recent_applicants = List(DashboardApplicantType)
+    staleness_seconds = Float()
+    pending_changes = Int()
@@ -4,10 +4,11 @@ A module for employer in the app.api.graphql.types package.
 
 from typing import Optional
 
-from graphene import Int, List, ObjectType, String
+from graphene import Enum, InputObjectType, Int, List, ObjectType, String
 from graphql.type.definition import GraphQLResolveInfo
 from sqlalchemy.orm import InstrumentedAttribute
 
+from app.api.graphql.types.sorting import SortDirection
 from app.models.employer import Employer
 from app.models.job import Job
 
@@ -17,7 +18,9 @@ class EmployerType(ObjectType):  # type: ignore
     name = String()
     contact_email = String()
     industry = String()
+    version = Int()
     jobs = List("app.api.graphql.types.job.JobType")
+    jobs_count = Int()
 
     @staticmethod
     def resolve_jobs(
@@ -28,3 +31,23 @@ class EmployerType(ObjectType):  # type: ignore
         if isinstance(root.jobs, InstrumentedAttribute):
             return root.jobs.all()
         return root.jobs
+
+
+class EmployerInput(InputObjectType):  # type: ignore
+    name = String(required=True)
+    contact_email = String(required=True)
+    industry = String(required=True)
+
+
+class EmployerFilter(InputObjectType):  # type: ignore
+    industry = String()
+
+
+class EmployerOrderField(Enum):  # type: ignore
+    ID = "id"
+    CONTACT_EMAIL = "contact_email"
+
+
+class EmployerOrderBy(InputObjectType):  # type: ignore
+    field = EmployerOrderField(required=True)
+    direction = SortDirection(default_value="asc")
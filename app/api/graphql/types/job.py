@@ -4,9 +4,18 @@ A module for job in the app.api.graphql.types package.
 
 from typing import Optional
 
-from graphene import Field, Int, List, ObjectType, String
+from graphene import (
+    Enum,
+    Field,
+    InputObjectType,
+    Int,
+    List,
+    ObjectType,
+    String,
+)
 from graphql.type.definition import GraphQLResolveInfo
 
+from app.api.graphql.types.sorting import SortDirection
 from app.models.application import Application
 from app.models.employer import Employer
 from app.models.job import Job
@@ -17,8 +26,10 @@ class JobType(ObjectType):  # type: ignore
     title = String()
     description = String()
     employer_id = Int()
+    version = Int()
     employer = Field("app.api.graphql.types.employer.EmployerType")
     applications = List("app.api.graphql.types.application.ApplicationType")
+    applications_count = Int()
 
     @staticmethod
     def resolve_employer(
@@ -31,3 +42,33 @@ class JobType(ObjectType):  # type: ignore
         root: Optional[Job], info: Optional[GraphQLResolveInfo]
     ) -> list[Application] | None:
         return None if root is None else root.applications
+
+
+class JobInput(InputObjectType):  # type: ignore
+    title = String(required=True)
+    description = String(required=True)
+    employer_id = Int(required=True)
+
+
+class JobUpdateInput(InputObjectType):  # type: ignore
+    id = Int(required=True)
+    title = String()
+    description = String()
+    employer_id = Int()
+    expected_version = Int()
+
+
+class JobFilter(InputObjectType):  # type: ignore
+    employer_id = Int()
+    title_contains = String()
+    industry = String()
+
+
+class JobOrderField(Enum):  # type: ignore
+    ID = "id"
+    EMPLOYER_ID = "employer_id"
+
+
+class JobOrderBy(InputObjectType):  # type: ignore
+    field = JobOrderField(required=True)
+    direction = SortDirection(default_value="asc")
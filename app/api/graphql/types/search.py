@@ -0,0 +1,18 @@
+"""
+A module for search in the app.api.graphql.types package.
+"""
+
+from graphene import Boolean, Field, Float, Int, List, ObjectType, String
+
+
+class JobSearchEdgeType(ObjectType):  # type: ignore
+    cursor = String()
+    rank = Float()
+    node = Field("app.api.graphql.types.job.JobType")
+
+
+class JobSearchResultType(ObjectType):  # type: ignore
+    edges = List(JobSearchEdgeType)
+    end_cursor = String()
+    has_next_page = Boolean()
+    total_count = Int()
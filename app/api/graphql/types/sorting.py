@@ -0,0 +1,10 @@
+"""
+A module for sorting in the app.api.graphql.types package.
+"""
+
+from graphene import Enum
+
+
+class SortDirection(Enum):  # type: ignore
+    ASC = "asc"
+    DESC = "desc"
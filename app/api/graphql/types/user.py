@@ -4,9 +4,19 @@ A module for user in the app.api.graphql.types package.
 
 from typing import Optional
 
-from graphene import Int, List, ObjectType, String
+from graphene import (
+    DateTime,
+    Enum,
+    InputObjectType,
+    Int,
+    List,
+    ObjectType,
+    String,
+)
 from graphql import GraphQLResolveInfo
 
+from app.api.graphql.resolvers.loaders import get_loaders
+from app.api.graphql.types.sorting import SortDirection
 from app.models.application import Application
 from app.models.user import User
 
@@ -17,9 +27,35 @@ class UserType(ObjectType):  # type: ignore
     email = String()
     role = String()
     applications = List("app.api.graphql.types.application.ApplicationType")
+    applications_count = Int()
 
     @staticmethod
     def resolve_applications(
         root: Optional[User], info: Optional[GraphQLResolveInfo]
     ) -> list[Application] | None:
         return None if root is None else root.applications
+
+    @staticmethod
+    async def resolve_applications_count(
+        root: Optional[User], info: Optional[GraphQLResolveInfo]
+    ) -> int | None:
+        if root is None:
+            return None
+        return await get_loaders(info).user_applications_count.load(root.id)
+
+
+class UserFilter(InputObjectType):  # type: ignore
+    created_after = DateTime()
+    created_before = DateTime()
+
+
+class UserOrderField(Enum):  # type: ignore
+    ID = "id"
+    USERNAME = "username"
+    EMAIL = "email"
+    CREATED_AT = "created_at"
+
+
+class UserOrderBy(InputObjectType):  # type: ignore
+    field = UserOrderField(required=True)
+    direction = SortDirection(default_value="asc")
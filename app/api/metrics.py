@@ -0,0 +1,29 @@
+"""
+A module for metrics in the app.api package.
+"""
+
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import metrics_registry
+
+PROMETHEUS_MEDIA_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+router: APIRouter = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Exposes the metrics of this worker in the Prometheus text format.
+    ## Response:
+    - `return:` **The metrics exposition**
+    - `rtype:` **PlainTextResponse**
+    """
+    return PlainTextResponse(
+        metrics_registry.render(), media_type=PROMETHEUS_MEDIA_TYPE
+    )
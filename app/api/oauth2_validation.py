@@ -6,6 +6,8 @@ import logging
 from functools import wraps
 from typing import Any, Callable
 
+from fastapi import HTTPException, Request, status
+from fastapi.security.utils import get_authorization_scheme_param
 from graphql import GraphQLError, GraphQLResolveInfo
 from pydantic import PositiveInt
 from sqlalchemy import Select, select
@@ -39,10 +41,11 @@ async def get_login_user(username: str) -> User:
     stmt: Select[Any]
     async_session: AsyncSession = await get_session()
     stmt = select(User).where(User.username == username)
-    try:
-        user: User | None = (await async_session.scalars(stmt)).first()
-    except SQLAlchemyError as sa_exc:
-        raise DatabaseException(str(sa_exc)) from sa_exc
+    async with async_session as session:
+        try:
+            user: User | None = (await session.scalars(stmt)).first()
+        except SQLAlchemyError as sa_exc:
+            raise DatabaseException(str(sa_exc)) from sa_exc
     if not user:
         raise NotFoundException(f"User not found with username: {username}")
     return user
@@ -73,6 +76,49 @@ async def authenticate_user(
     return user_auth
 
 
+async def is_admin_token(token: str, auth_settings: AuthSettings) -> bool:
+    """
+    Check whether a token belongs to an admin user
+    :param token: JWT token from OAuth2PasswordBearer
+    :type token: str
+    :param auth_settings: Dependency method for cached setting object
+    :type auth_settings: AuthSettings
+    :return: True if the token is valid and its user is an admin
+    :rtype: bool
+    """
+    try:
+        payload: dict[str, Any] = decode_jwt(token, auth_settings)
+        user: User = await get_login_user(
+            payload.get("preferred_username") or ""
+        )
+    except (HTTPException, NotFoundException, DatabaseException):
+        return False
+    return user.role == "admin"
+
+
+async def require_admin(request: Request) -> None:
+    """
+    Dependency that lets only requests with the bearer token of an admin
+     user through
+    :param request: The HTTP request
+    :type request: Request
+    :return: None
+    :rtype: NoneType
+    """
+    scheme, token = get_authorization_scheme_param(
+        request.headers.get("Authorization")
+    )
+    if scheme.lower() != "bearer" or not token:
+        await raise_unauthorized_error(
+            auth_setting.DETAIL, auth_setting.HEADERS
+        )
+    if not await is_admin_token(token, auth_setting):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You are not authorized to perform this action",
+        )
+
+
 def admin_user(func: Callable[..., Any]) -> Callable[..., Any]:
     """
     This decorator validates the role of the user to be admin
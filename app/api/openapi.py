@@ -0,0 +1,48 @@
+"""
+A module for openapi in the app.api package.
+"""
+
+from fastapi import APIRouter, Request, Response, status
+
+from app.config.config import auth_setting, init_setting
+from app.utils.file_utils.openapi_utils import (
+    OpenAPIDocument,
+    get_openapi_document,
+)
+
+router: APIRouter = APIRouter(tags=["openapi"], include_in_schema=False)
+
+
+@router.get(
+    f"{auth_setting.API_V1_STR}{init_setting.OPENAPI_FILE_PATH}",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+)
+async def get_openapi(request: Request) -> Response:
+    """
+    Serves the OpenAPI document computed at startup, gzip encoded when
+     the client accepts it, and answers revalidations by ETag.
+    ## Parameter:
+    - `request:` **The HTTP request**
+    - `type:` **Request**
+    ## Response:
+    - `return:` **The OpenAPI document**
+    - `rtype:` **Response**
+    """
+    document: OpenAPIDocument = get_openapi_document(request.app)
+    headers: dict[str, str] = {
+        "ETag": document.etag,
+        "Vary": "Accept-Encoding",
+    }
+    if request.headers.get("if-none-match") == document.etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        return Response(
+            document.compressed, media_type="application/json", headers=headers
+        )
+    return Response(
+        document.content, media_type="application/json", headers=headers
+    )
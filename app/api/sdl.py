@@ -0,0 +1,48 @@
+"""
+A module for sdl in the app.api package.
+"""
+
+from fastapi import APIRouter, HTTPException, Request, Response, status
+
+from app.api.graphql.introspection import (
+    IntrospectionCache,
+    get_introspection_cache,
+    is_introspection_allowed,
+)
+from app.api.graphql.schema import schema
+from app.config.config import auth_setting
+
+router: APIRouter = APIRouter(prefix="/schema.graphql", tags=["graphql"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+)
+async def get_sdl(request: Request) -> Response:
+    """
+    Exports the GraphQL schema in SDL, printed once per schema version,
+     under the same policy as introspection.
+    ## Parameter:
+    - `request:` **The HTTP request**
+    - `type:` **Request**
+    ## Response:
+    - `return:` **The schema definition**
+    - `rtype:` **Response**
+    """
+    if not await is_introspection_allowed(request, auth_setting):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="GraphQL introspection is not allowed",
+        )
+    cache: IntrospectionCache = get_introspection_cache(schema)
+    etag: str = f'"{cache.version}"'
+    headers: dict[str, str] = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+    return Response(
+        cache.sdl, media_type="text/plain; charset=utf-8", headers=headers
+    )
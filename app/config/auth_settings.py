@@ -8,6 +8,10 @@ from pydantic import AnyHttpUrl, PositiveInt, field_validator
 from pydantic_core.core_schema import ValidationInfo
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.schemas.infrastructure.introspection_policy import (
+    IntrospectionPolicy,
+)
+
 
 class AuthSettings(BaseSettings):
     """
@@ -45,6 +49,7 @@ class AuthSettings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_MINUTES: PositiveInt
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: PositiveInt
     AUDIENCE: Optional[AnyHttpUrl] = None
+    GRAPHQL_INTROSPECTION: IntrospectionPolicy = IntrospectionPolicy.ENABLED
 
     @field_validator("AUDIENCE", mode="before")
     def assemble_audience(
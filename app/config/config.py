@@ -7,6 +7,7 @@ from functools import lru_cache
 from app.config.auth_settings import AuthSettings
 from app.config.database_settings import SQLDatabaseSettings
 from app.config.init_settings import InitSettings
+from app.config.performance_settings import PerformanceSettings
 from app.config.settings import Settings
 
 
@@ -50,7 +51,18 @@ def get_auth_settings() -> AuthSettings:
     return AuthSettings()
 
 
+@lru_cache()
+def get_performance_settings() -> PerformanceSettings:
+    """
+    Get performance settings cached
+    :return: Performance settings instance
+    :rtype: PerformanceSettings
+    """
+    return PerformanceSettings()
+
+
 init_setting: InitSettings = InitSettings()
 setting: Settings = Settings()
 sql_database_setting: SQLDatabaseSettings = SQLDatabaseSettings()
 auth_setting: AuthSettings = AuthSettings()
+performance_setting: PerformanceSettings = PerformanceSettings()
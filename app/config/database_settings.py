@@ -2,7 +2,7 @@
 A module for sql database settings in the app.core.config package.
 """
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import PositiveInt, PostgresDsn, field_validator
 from pydantic_core import MultiHostUrl
@@ -27,18 +27,24 @@ class SQLDatabaseSettings(BaseSettings):
         ".[A-Z|a-z]{2,"
         "}$'"
     )
+    DB_EMAIL_CONSTRAINT_SQLITE: str = (
+        "contact_email GLOB '*?@?*.[A-Za-z][A-Za-z]*'"
+        " AND contact_email NOT GLOB '*[ ]*'"
+    )
+    DATABASE_BACKEND: Literal["postgresql", "sqlite"] = "postgresql"
+    SQLITE_DATABASE_PATH: str = ":memory:"
     POSTGRES_SCHEME: str
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_HOST: str
     POSTGRES_PORT: PositiveInt
     POSTGRES_DB: str
-    SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn] = None
+    SQLALCHEMY_DATABASE_URI: Optional[PostgresDsn | str] = None
 
     @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
     def assemble_postgresql_connection(
         cls, v: Optional[str], info: ValidationInfo
-    ) -> PostgresDsn:
+    ) -> PostgresDsn | str:
         """
         Assemble the database connection as URI string
         :param v: Variables to consider
@@ -46,11 +52,14 @@ class SQLDatabaseSettings(BaseSettings):
         :param info: The field validation info
         :type info: ValidationInfo
         :return: SQLAlchemy URI
-        :rtype: PostgresDsn
+        :rtype: PostgresDsn | str
         """
         # pylint: disable=no-self-argument,invalid-name
         if info.config is None:
             raise ValueError("info.config cannot be None")
+        if info.data.get("DATABASE_BACKEND") == "sqlite":
+            path: str = info.data.get("SQLITE_DATABASE_PATH", ":memory:")
+            return f"sqlite+aiosqlite:///{path}"
         uri: MultiHostUrl = MultiHostUrl.build(
             scheme=info.data.get("POSTGRES_SCHEME", "postgresql"),
             username=info.data.get("POSTGRES_USER"),
@@ -4,7 +4,9 @@ A module for init settings in the app.core.config package.
 
 import base64
 from pathlib import Path
+from typing import Literal
 
+from pydantic import PositiveInt
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -48,6 +50,12 @@ class InitSettings(BaseSettings):
         "[%(name)s][%(asctime)s][%(levelname)s][%(module)s]"
         "[%(funcName)s][%(lineno)d]: %(message)s"
     )
+    LOG_QUEUE_SIZE: PositiveInt = 10000
+    LOG_QUEUE_DROP_POLICY: Literal["drop_newest", "drop_oldest"] = "drop_newest"
+    LOG_ROTATION: Literal["size", "time"] = "size"
+    LOG_MAX_BYTES: PositiveInt = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: PositiveInt = 5
+    LOG_ROTATION_WHEN: str = "midnight"
     PASSWORD_REGEX: str = (
         "^(?=.*?[A-Z])(?=.*?[a-z])(?=.*?[0-9])(?=.*?" "[#?!@$%^&*-]).{8,14}$"
     )
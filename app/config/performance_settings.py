@@ -0,0 +1,58 @@
+"""
+A module for performance settings in the app.core.config package.
+"""
+
+from typing import Literal, Optional
+
+from pydantic import Field, NonNegativeInt, PositiveFloat, PositiveInt
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class PerformanceSettings(BaseSettings):
+    """
+    Settings class for concurrency, load shedding and other runtime
+     performance controls
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="allow",
+    )
+
+    CONCURRENCY_LIMIT_ALGORITHM: Literal["fixed", "aimd", "gradient"] = "fixed"
+    MAX_CONCURRENT_REQUESTS: PositiveInt = 64
+    MIN_CONCURRENT_REQUESTS: PositiveInt = 4
+    MAX_QUEUED_REQUESTS: NonNegativeInt = 128
+    QUEUE_TIMEOUT_SECONDS: PositiveFloat = 2.0
+    RETRY_AFTER_SECONDS: PositiveInt = 1
+    AIMD_LATENCY_THRESHOLD_SECONDS: PositiveFloat = 0.5
+    AIMD_BACKOFF_RATIO: PositiveFloat = 0.9
+    GRADIENT_SMOOTHING: PositiveFloat = 0.2
+    GRADIENT_RTT_TOLERANCE: PositiveFloat = 2.0
+    GRADIENT_MIN_RTT_WINDOW: PositiveInt = 1000
+    REQUEST_TIMEOUT_HEADER: str = "X-Request-Timeout"
+    DEFAULT_REQUEST_TIMEOUT_SECONDS: PositiveFloat = 30.0
+    MAX_REQUEST_TIMEOUT_SECONDS: PositiveFloat = 60.0
+    OPERATION_TIMEOUTS: dict[str, PositiveFloat] = {}
+    METRICS_ENABLED: bool = True
+    METRICS_SAMPLE_RATE: float = Field(default=1.0, gt=0, le=1)
+    METRICS_MAX_OPERATION_NAMES: PositiveInt = 256
+    TRACING_ENABLED: bool = True
+    TRACING_HEADER: str = "X-Debug-Trace"
+    TRACING_EXPORT_PATH: Optional[str] = None
+    QUERY_DETECTOR_MODE: Literal["off", "log", "warn", "raise"] = "off"
+    QUERY_DETECTOR_THRESHOLD: int = Field(default=3, ge=2)
+    MAX_BULK_ITEMS: PositiveInt = 500
+    SEARCH_PAGE_SIZE: PositiveInt = 20
+    SEARCH_MAX_PAGE_SIZE: PositiveInt = 100
+    AUTOCOMPLETE_LIMIT: PositiveInt = 10
+    AUTOCOMPLETE_MAX_LIMIT: PositiveInt = 50
+    DASHBOARD_REFRESH_INTERVAL_SECONDS: PositiveFloat = 5.0
+    DASHBOARD_REFRESH_BATCH_SIZE: PositiveInt = 1000
+    DASHBOARD_MAX_STALENESS_SECONDS: PositiveFloat = 30.0
+    DASHBOARD_RECENT_APPLICANTS: PositiveInt = 10
+    EXPORT_BATCH_SIZE: PositiveInt = 1000
+    IMPORT_BATCH_SIZE: PositiveInt = 1000
+    IMPORT_MAX_REPORTED_ERRORS: PositiveInt = 1000
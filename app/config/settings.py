@@ -10,6 +10,7 @@ from pydantic import (
     EmailStr,
     FilePath,
     IPvAnyAddress,
+    PositiveFloat,
     PositiveInt,
     field_validator,
 )
@@ -37,8 +38,12 @@ class Settings(BaseSettings):
     SMTP_HOST: str
     SMTP_USER: str
     SMTP_PASSWORD: str
+    SMTP_TLS: bool = True
     MAIL_SUBJECT: str
     MAIL_TIMEOUT: float
+    ALERT_BATCH_WINDOW_SECONDS: PositiveFloat = 30.0
+    ALERT_RATE_LIMIT_SECONDS: PositiveFloat = 300.0
+    ALERT_MAX_PENDING: PositiveInt = 1000
     EMAILS_FROM_EMAIL: Optional[EmailStr] = None
     EMAILS_FROM_NAME: Optional[str] = None
     BACKEND_CORS_ORIGINS: list[AnyHttpUrl] = []
@@ -0,0 +1,180 @@
+"""
+This module provides an asynchronous sink for critical alerts.
+Alerts are collected over a time window, deduplicated with counts and
+ mailed as one digest per subject, rate limited per subject.
+"""
+
+import asyncio
+import logging
+from collections import Counter, deque
+from email.message import EmailMessage
+from time import monotonic
+from typing import Optional
+
+import aiosmtplib
+
+from app.config.config import setting
+from app.config.settings import Settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class AlertMailer:
+    """
+    Batching, deduplicating and rate limited alert mailer that sends
+     through an asyncio SMTP client on a background task.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings: Settings = settings
+        self._records: deque[tuple[str, str]] = deque(
+            maxlen=settings.ALERT_MAX_PENDING
+        )
+        self._pending: dict[str, Counter[str]] = {}
+        self._last_sent: dict[str, float] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def submit(self, subject: str, message: str) -> None:
+        """
+        Queue an alert. It is safe to call from any thread.
+        :param subject: The subject the alert is grouped under
+        :type subject: str
+        :param message: The alert message
+        :type message: str
+        :return: None
+        :rtype: NoneType
+        """
+        self._records.append((subject, message))
+
+    def start(self) -> None:
+        """
+        Start the background task on the running event loop
+        :return: None
+        :rtype: NoneType
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task and send every pending alert
+        :return: None
+        :rtype: NoneType
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush(force=True)
+
+    async def _run(self) -> None:
+        """
+        Flush the collected alerts once per batch window
+        :return: None
+        :rtype: NoneType
+        """
+        while True:
+            await asyncio.sleep(self.settings.ALERT_BATCH_WINDOW_SECONDS)
+            await self.flush()
+
+    async def flush(self, force: bool = False) -> None:
+        """
+        Group the collected alerts and mail the subjects that are not
+         rate limited
+        :param force: Whether to ignore the rate limit
+        :type force: bool
+        :return: None
+        :rtype: NoneType
+        """
+        while self._records:
+            subject, message = self._records.popleft()
+            self._pending.setdefault(subject, Counter())[message] += 1
+        now: float = monotonic()
+        for subject in list(self._pending):
+            last_sent: Optional[float] = self._last_sent.get(subject)
+            if (
+                not force
+                and last_sent is not None
+                and now - last_sent < self.settings.ALERT_RATE_LIMIT_SECONDS
+            ):
+                continue
+            counts: Counter[str] = self._pending.pop(subject)
+            self._last_sent[subject] = now
+            try:
+                await self._send(subject, counts)
+            except (aiosmtplib.SMTPException, OSError) as exc:
+                logger.error("Could not send alert %s: %s", subject, exc)
+
+    def build_message(self, subject: str, counts: Counter[str]) -> EmailMessage:
+        """
+        Build the digest e-mail for a subject
+        :param subject: The subject of the digest
+        :type subject: str
+        :param counts: The deduplicated messages with their occurrences
+        :type counts: Counter[str]
+        :return: The e-mail message
+        :rtype: EmailMessage
+        """
+        message: EmailMessage = EmailMessage()
+        message["From"] = str(self.settings.EMAILS_FROM_EMAIL)
+        message["To"] = self.settings.SMTP_USER
+        message["Subject"] = subject
+        message.set_content(
+            "\n\n".join(
+                f"[{count}x] {text}" for text, count in counts.most_common()
+            )
+        )
+        return message
+
+    async def _send(self, subject: str, counts: Counter[str]) -> None:
+        """
+        Send the digest of a subject through the SMTP server
+        :param subject: The subject of the digest
+        :type subject: str
+        :param counts: The deduplicated messages with their occurrences
+        :type counts: Counter[str]
+        :return: None
+        :rtype: NoneType
+        """
+        await aiosmtplib.send(
+            self.build_message(subject, counts),
+            hostname=self.settings.SMTP_HOST,
+            port=self.settings.SMTP_PORT,
+            username=self.settings.SMTP_USER,
+            password=self.settings.SMTP_PASSWORD,
+            start_tls=self.settings.SMTP_TLS,
+            timeout=self.settings.MAIL_TIMEOUT,
+        )
+
+
+class AlertMailHandler(logging.Handler):
+    """
+    Logging handler that hands records over to the alert mailer instead
+     of talking to the SMTP server itself
+    """
+
+    def __init__(self, mailer: AlertMailer, subject: str):
+        super().__init__()
+        self.mailer: AlertMailer = mailer
+        self.subject: str = subject
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Submit a record to the alert mailer
+        :param record: The record to submit
+        :type record: logging.LogRecord
+        :return: None
+        :rtype: NoneType
+        """
+        try:
+            self.mailer.submit(
+                f"{self.subject}: {record.name}", self.format(record)
+            )
+        except Exception:
+            self.handleError(record)
+
+
+alert_mailer: AlertMailer = AlertMailer(setting)
@@ -0,0 +1,328 @@
+"""
+This module provides the admission control used to bound the number of
+ in-flight GraphQL requests and to shed load when the backend is slow.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from app.config.performance_settings import PerformanceSettings
+from app.exceptions.exceptions import ServiceUnavailableException
+from app.schemas.infrastructure.request_priority import RequestPriority
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Limiter(ABC):
+    """
+    Base class for concurrency limit strategies
+    """
+
+    def __init__(self, limit: int, min_limit: int, max_limit: int):
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self._limit: float = float(limit)
+
+    @property
+    def limit(self) -> int:
+        """
+        The current concurrency limit
+        :return: The maximum number of requests allowed in flight
+        :rtype: int
+        """
+        return int(self._limit)
+
+    def _clamp(self, limit: float) -> float:
+        """
+        Keep a candidate limit within the configured bounds
+        :param limit: The candidate limit
+        :type limit: float
+        :return: The bounded limit
+        :rtype: float
+        """
+        return max(float(self.min_limit), min(float(self.max_limit), limit))
+
+    @abstractmethod
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        """
+        Feed a request sample into the limiter
+        :param rtt: The observed latency of the request in seconds
+        :type rtt: float
+        :param in_flight: The number of requests in flight when it ended
+        :type in_flight: int
+        :param dropped: Whether the request failed or timed out
+        :type dropped: bool
+        :return: None
+        :rtype: NoneType
+        """
+
+
+class FixedLimiter(Limiter):
+    """
+    Limiter with a static concurrency limit
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(limit, limit, limit)
+
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        return None
+
+
+class AIMDLimiter(Limiter):
+    """
+    Additive increase, multiplicative decrease limiter. The limit grows
+     by one while latency stays under the threshold and the limit is
+     actually being used, and it backs off on slow or failed requests.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_threshold: float,
+        backoff_ratio: float,
+    ):
+        super().__init__(limit, min_limit, max_limit)
+        self.latency_threshold: float = latency_threshold
+        self.backoff_ratio: float = backoff_ratio
+
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        if dropped or rtt > self.latency_threshold:
+            self._limit = self._clamp(self._limit * self.backoff_ratio)
+        elif in_flight * 2 >= self.limit:
+            self._limit = self._clamp(self._limit + 1)
+
+
+class GradientLimiter(Limiter):
+    """
+    Gradient based limiter. The limit follows the ratio between the
+     minimum latency seen in the current window (the no-load latency)
+     and the latency of each sample, plus a small queue allowance.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        min_limit: int,
+        max_limit: int,
+        smoothing: float,
+        rtt_tolerance: float,
+        min_rtt_window: int,
+    ):
+        super().__init__(limit, min_limit, max_limit)
+        self.smoothing: float = smoothing
+        self.rtt_tolerance: float = rtt_tolerance
+        self.min_rtt_window: int = min_rtt_window
+        self._min_rtt: float = math.inf
+        self._samples: int = 0
+
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> None:
+        self._samples += 1
+        if self._samples >= self.min_rtt_window:
+            self._samples = 0
+            self._min_rtt = math.inf
+        self._min_rtt = min(self._min_rtt, rtt)
+        if rtt <= 0:
+            return
+        if dropped:
+            gradient: float = 0.5
+        else:
+            gradient = max(
+                0.5, min(1.0, self.rtt_tolerance * self._min_rtt / rtt)
+            )
+        queue_size: float = math.sqrt(self._limit)
+        new_limit: float = self._limit * gradient + queue_size
+        self._limit = self._clamp(
+            (1 - self.smoothing) * self._limit + self.smoothing * new_limit
+        )
+
+
+class AdmissionController:
+    """
+    Admission controller with a bounded, prioritised wait queue.
+    Requests run immediately while there is spare capacity, otherwise
+     they wait in the queue up to a deadline; when the queue is full a
+     request is either rejected or displaces a lower priority waiter.
+    """
+
+    def __init__(
+        self, limiter: Limiter, max_queue_size: int, queue_timeout: float
+    ):
+        self.limiter: Limiter = limiter
+        self.max_queue_size: int = max_queue_size
+        self.queue_timeout: float = queue_timeout
+        self.in_flight: int = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._counter: itertools.count[int] = itertools.count()
+
+    @property
+    def queue_size(self) -> int:
+        """
+        The number of requests waiting for a slot
+        :return: The queue size
+        :rtype: int
+        """
+        return len(self._waiters)
+
+    async def acquire(self, priority: RequestPriority) -> None:
+        """
+        Wait for a free slot for a request with the given priority
+        :param priority: The priority of the request
+        :type priority: RequestPriority
+        :return: None
+        :rtype: NoneType
+        """
+        if self.in_flight < self.limiter.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue_size and not self._evict(
+            priority
+        ):
+            raise ServiceUnavailableException("Request queue is full")
+        future: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        entry: tuple[int, int, asyncio.Future[None]] = (
+            priority,
+            next(self._counter),
+            future,
+        )
+        heapq.heappush(self._waiters, entry)
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except TimeoutError as exc:
+            self._discard(entry)
+            raise ServiceUnavailableException(
+                "Timed out waiting for a free slot"
+            ) from exc
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                if future.exception() is None:
+                    self.release()
+            else:
+                self._discard(entry)
+            raise
+
+    def release(
+        self, rtt: Optional[float] = None, dropped: bool = False
+    ) -> None:
+        """
+        Release a slot and hand it over to the next waiter
+        :param rtt: The observed latency of the request in seconds
+        :type rtt: Optional[float]
+        :param dropped: Whether the request failed
+        :type dropped: bool
+        :return: None
+        :rtype: NoneType
+        """
+        if rtt is not None:
+            self.limiter.update(rtt, self.in_flight, dropped)
+        self.in_flight -= 1
+        self._grant()
+
+    def _grant(self) -> None:
+        """
+        Wake up queued requests while there is spare capacity
+        :return: None
+        :rtype: NoneType
+        """
+        while self._waiters and self.in_flight < self.limiter.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    def _evict(self, priority: RequestPriority) -> bool:
+        """
+        Shed the lowest priority waiter if it ranks below the new request
+        :param priority: The priority of the incoming request
+        :type priority: RequestPriority
+        :return: True if a waiter was shed to make room
+        :rtype: bool
+        """
+        if not self._waiters:
+            return False
+        worst: tuple[int, int, asyncio.Future[None]] = max(self._waiters)
+        if worst[0] <= priority:
+            return False
+        self._discard(worst)
+        if not worst[2].done():
+            worst[2].set_exception(
+                ServiceUnavailableException(
+                    "Request shed in favour of a higher priority request"
+                )
+            )
+        return True
+
+    def _discard(self, entry: tuple[int, int, asyncio.Future[None]]) -> None:
+        """
+        Remove a waiter from the queue
+        :param entry: The queue entry to remove
+        :type entry: tuple[int, int, asyncio.Future[None]]
+        :return: None
+        :rtype: NoneType
+        """
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            return
+        heapq.heapify(self._waiters)
+
+
+def build_limiter(performance_settings: PerformanceSettings) -> Limiter:
+    """
+    Build the concurrency limiter selected in the settings
+    :param performance_settings: Dependency method for cached setting
+     object
+    :type performance_settings: PerformanceSettings
+    :return: The configured limiter
+    :rtype: Limiter
+    """
+    max_limit: int = performance_settings.MAX_CONCURRENT_REQUESTS
+    min_limit: int = min(
+        performance_settings.MIN_CONCURRENT_REQUESTS, max_limit
+    )
+    if performance_settings.CONCURRENCY_LIMIT_ALGORITHM == "aimd":
+        return AIMDLimiter(
+            max_limit,
+            min_limit,
+            max_limit,
+            performance_settings.AIMD_LATENCY_THRESHOLD_SECONDS,
+            performance_settings.AIMD_BACKOFF_RATIO,
+        )
+    if performance_settings.CONCURRENCY_LIMIT_ALGORITHM == "gradient":
+        return GradientLimiter(
+            max_limit,
+            min_limit,
+            max_limit,
+            performance_settings.GRADIENT_SMOOTHING,
+            performance_settings.GRADIENT_RTT_TOLERANCE,
+            performance_settings.GRADIENT_MIN_RTT_WINDOW,
+        )
+    return FixedLimiter(max_limit)
+
+
+def build_admission_controller(
+    performance_settings: PerformanceSettings,
+) -> AdmissionController:
+    """
+    Build the admission controller for the GraphQL endpoint
+    :param performance_settings: Dependency method for cached setting
+     object
+    :type performance_settings: PerformanceSettings
+    :return: The configured admission controller
+    :rtype: AdmissionController
+    """
+    return AdmissionController(
+        build_limiter(performance_settings),
+        performance_settings.MAX_QUEUED_REQUESTS,
+        performance_settings.QUEUE_TIMEOUT_SECONDS,
+    )
@@ -0,0 +1,90 @@
+"""
+This module keeps track of the deadline of the current operation so it
+ can be enforced from the ASGI layer down to the database statements.
+"""
+
+from contextvars import ContextVar, Token
+from time import monotonic
+from typing import Optional
+
+from app.config.performance_settings import PerformanceSettings
+from app.exceptions.exceptions import DeadlineExceededError
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def set_deadline(timeout: float) -> Token[Optional[float]]:
+    """
+    Set the deadline of the current context
+    :param timeout: The number of seconds the operation may run for
+    :type timeout: float
+    :return: The token to restore the previous deadline
+    :rtype: Token[Optional[float]]
+    """
+    return _deadline.set(monotonic() + timeout)
+
+
+def reset_deadline(token: Token[Optional[float]]) -> None:
+    """
+    Restore the deadline that was active before set_deadline
+    :param token: The token returned by set_deadline
+    :type token: Token[Optional[float]]
+    :return: None
+    :rtype: NoneType
+    """
+    _deadline.reset(token)
+
+
+def get_remaining_time() -> Optional[float]:
+    """
+    Get the time left before the current deadline expires
+    :return: The remaining seconds, or None if there is no deadline
+    :rtype: Optional[float]
+    """
+    deadline: Optional[float] = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - monotonic()
+
+
+def check_deadline() -> None:
+    """
+    Raise if the deadline of the current context has already expired
+    :return: None
+    :rtype: NoneType
+    """
+    remaining: Optional[float] = get_remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError()
+
+
+def resolve_timeout(
+    operation_name: Optional[str],
+    header_value: Optional[str],
+    performance_settings: PerformanceSettings,
+) -> float:
+    """
+    Resolve the timeout of an operation from the request header or the
+     per-operation configuration
+    :param operation_name: The name of the GraphQL operation
+    :type operation_name: Optional[str]
+    :param header_value: The raw value of the timeout header
+    :type header_value: Optional[str]
+    :param performance_settings: Dependency method for cached setting
+     object
+    :type performance_settings: PerformanceSettings
+    :return: The timeout in seconds
+    :rtype: float
+    """
+    timeout: float = performance_settings.OPERATION_TIMEOUTS.get(
+        operation_name or "",
+        performance_settings.DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    )
+    if header_value:
+        try:
+            requested: float = float(header_value)
+        except ValueError:
+            requested = 0
+        if requested > 0:
+            timeout = requested
+    return min(timeout, performance_settings.MAX_REQUEST_TIMEOUT_SECONDS)
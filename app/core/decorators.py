@@ -5,71 +5,117 @@ This module provides decorators designed to provide additional
 
 import logging
 from functools import wraps
-from time import perf_counter
-from typing import Any, Callable
+from inspect import iscoroutinefunction
+from random import random
+from time import perf_counter_ns
+from typing import Any, Callable, Optional, TypeVar, cast, overload
+
+from app.config.config import performance_setting
+from app.core.metrics import Histogram, metrics_registry
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+FUNCTION_DURATION_METRIC: str = "function_duration_seconds"
 
-def with_logging(func: Callable[..., Any]) -> Callable[..., Any]:
-    """
-    This decorator logs when a function starts and finishes its
-     execution.
-    :param func: The function to be decorated
-    :type func: Callable
-    :return: The decorated function that logs its call
-    :rtype: Callable
-    """
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@overload
+def instrument(
+    func: F,
+    *,
+    name: Optional[str] = None,
+    sample_rate: Optional[float] = None,
+) -> F: ...
 
-    @wraps(func)
-    async def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
-        """
-        A wrapper function that adds logging functionality
-        :param args: Positional arguments to be passed to the decorated
-         function
-        :type args: tuple[Any, ...]
-        :param kwargs: Keyword arguments to be passed to the decorated
-         function
-        :type kwargs: dict[str, Any]
-        :return: The result of the decorated function's execution
-        :rtype: Any
-        """
-        logger.info("Calling %s", func.__name__)
-        value = await func(*args, **kwargs)
-        logger.info("Finished %s", func.__name__)
-        return value
 
-    return wrapper
+@overload
+def instrument(
+    *, name: Optional[str] = None, sample_rate: Optional[float] = None
+) -> Callable[[F], F]: ...
 
 
-def benchmark(func: Callable[..., Any]) -> Callable[..., Any]:
+def instrument(
+    func: Optional[F] = None,
+    *,
+    name: Optional[str] = None,
+    sample_rate: Optional[float] = None,
+) -> Any:
     """
-    This decorator provides a benchmarking feature by logging the
-     execution time of the decorated function
-    :param func: The function to be executed
-    :type func: Callable
-    :return: The decorated function that logs its execution time
-    :rtype: Callable
+    This decorator records the latency of every call, or of a sample of
+     calls, into a histogram labelled by function. It supports sync and
+     async callables and returns the function untouched when metrics are
+     disabled.
+    :param func: The function to be decorated
+    :type func: Optional[F]
+    :param name: The label to record the function under. Defaults to
+     its qualified name
+    :type name: Optional[str]
+    :param sample_rate: The fraction of calls to record. Defaults to
+     METRICS_SAMPLE_RATE
+    :type sample_rate: Optional[float]
+    :return: The decorated function that records its execution time
+    :rtype: Any
     """
+    if func is None:
+        return lambda f: instrument(f, name=name, sample_rate=sample_rate)
+    if not performance_setting.METRICS_ENABLED:
+        return func
+    rate: float = (
+        performance_setting.METRICS_SAMPLE_RATE
+        if sample_rate is None
+        else sample_rate
+    )
+    histogram: Histogram = metrics_registry.histogram(
+        FUNCTION_DURATION_METRIC,
+        "Latency of instrumented functions",
+        function=name or f"{func.__module__}.{func.__qualname__}",
+    )
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            """
+            A wrapper function that records the latency of a coroutine
+            :param args: Positional arguments to be passed to the
+             decorated function
+            :type args: Any
+            :param kwargs: Keyword arguments to be passed to the decorated
+             function
+            :type kwargs: Any
+            :return: The result of the decorated function's execution
+            :rtype: Any
+            """
+            if rate < 1 and random() >= rate:
+                return await func(*args, **kwargs)
+            start_time: int = perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                histogram.record(perf_counter_ns() - start_time)
+
+        return cast(F, async_wrapper)
 
     @wraps(func)
-    async def wrapper(*args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Any:
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
         """
-        A wrapper function that adds benchmarking functionality
+        A wrapper function that records the latency of a function
         :param args: Positional arguments to be passed to the decorated
          function
-        :type args: tuple[Any, ...]
+        :type args: Any
         :param kwargs: Keyword arguments to be passed to the decorated
          function
-        :type kwargs: dict[str, Any]
+        :type kwargs: Any
         :return: The result of the decorated function's execution
         :rtype: Any
         """
-        start_time: float = perf_counter()
-        value = await func(*args, **kwargs)
-        end_time: float = perf_counter()
-        run_time: float = end_time - start_time
-        logger.info("Execution of %s took %s seconds.", func.__name__, run_time)
-        return value
-
-    return wrapper
+        if rate < 1 and random() >= rate:
+            return func(*args, **kwargs)
+        start_time: int = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            histogram.record(perf_counter_ns() - start_time)
+
+    return cast(F, wrapper)
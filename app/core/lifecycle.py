@@ -8,7 +8,13 @@ from typing import Any, AsyncGenerator
 
 from fastapi import FastAPI
 
+from app.config.config import init_setting
+from app.core.alert_mailer import alert_mailer
+from app.db.dashboard import dashboard_refresher
 from app.db.init_db import init_db
+from app.db.prefix_indexes import load_prefix_indexes
+from app.utils.file_utils.json_utils import write_json_file
+from app.utils.file_utils.openapi_utils import build_openapi_document
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -23,11 +29,22 @@ async def lifespan(application: FastAPI) -> AsyncGenerator[Any, None]:
     :rtype: AsyncGenerator[Any, None]
     """
     logger.info("Starting API...")
+    alert_mailer.start()
     try:
         await init_db()
+        await load_prefix_indexes(reload=True)
+        dashboard_refresher.start()
+        application.state.openapi_document = build_openapi_document(application)
+        await write_json_file(
+            application.openapi(),
+            init_setting.OPENAPI_FILE_PATH[1:],
+            init_setting,
+        )
         yield
     except Exception as exc:
         logger.error(f"Error during application startup: {exc}")
         raise
     finally:
+        await dashboard_refresher.stop()
+        await alert_mailer.stop()
         logger.info("Application shutdown completed.")
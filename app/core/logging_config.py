@@ -1,53 +1,100 @@
 """
 This script sets up different logging handlers for the Core module.
 It provides console, file, and mail logging capabilities based on the
- provided settings.
+ provided settings. Every handler runs behind a bounded queue drained by
+ a background listener thread, so logging never blocks the event loop.
 """
 
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
-from logging.handlers import SMTPHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from typing import Optional
 
 from pydantic import PositiveInt
 
 from app.config.config import get_init_settings, get_settings
 from app.config.init_settings import InitSettings
 from app.config.settings import Settings
+from app.core.alert_mailer import AlertMailHandler, alert_mailer
+from app.core.metrics import metrics_registry
 
+_queue_handler: Optional["DroppingQueueHandler"] = None
+_queue_listener: Optional[QueueListener] = None
 
-def _setup_console_handler(
-    logger: logging.Logger, log_level: PositiveInt
-) -> None:
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler over a bounded queue that never blocks the caller.
+    When the queue is full the newest or the oldest record is dropped
+     and counted.
     """
-    Configure a console handler for the given logger
-    :param logger: The logger instance to set up a console handler for
-    :type logger: logging.Logger
+
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord], drop_policy: str
+    ):
+        super().__init__(log_queue)
+        self.log_queue: queue.Queue[logging.LogRecord] = log_queue
+        self.drop_policy: str = drop_policy
+        self.dropped_records: int = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a record without blocking, applying the drop policy
+        :param record: The record to enqueue
+        :type record: logging.LogRecord
+        :return: None
+        :rtype: NoneType
+        """
+        try:
+            self.log_queue.put_nowait(record)
+            return
+        except queue.Full:
+            self.dropped_records += 1
+        if self.drop_policy != "drop_oldest":
+            return
+        try:
+            self.log_queue.get_nowait()
+            self.log_queue.put_nowait(record)
+        except (queue.Empty, queue.Full):
+            pass
+
+
+def _setup_console_handler(log_level: PositiveInt) -> logging.Handler:
+    """
+    Configure a console handler
     :param log_level: The log level for the console handler
     :type log_level: PositiveInt
-    :return: None
-    :rtype: NoneType
+    :return: A configured console handler
+    :rtype: logging.Handler
     """
     stream: logging.StreamHandler = logging.StreamHandler()  # type: ignore
     stream.setLevel(log_level)
-    logger.addHandler(stream)
+    return stream
 
 
 def _setup_mail_handler(
-    logger: logging.Logger,
     log_level: PositiveInt,
     settings: Settings = get_settings(),
-) -> None:
+) -> logging.Handler:
     """
-    Configure a mail handler for the given logger
-    :param logger: The logger instance to set up a mail handler for
-    :type logger: logging.Logger
-    :param log_level: The log level for the mail handler
+    Configure a mail handler that hands critical records over to the
+     asynchronous alert mailer
+    :param log_level: The log level for the application
     :type log_level: PositiveInt
-    :return: None
-    :rtype: NoneType
+    :param settings: Dependency method for cached setting object
+    :type settings: Settings
+    :return: A configured mail handler for critical records
+    :rtype: logging.Handler
     """
-    if not settings.SMTP_USER:
+    if not settings.SMTP_HOST:
         raise AttributeError("Mail server is not set.")
     if not settings.EMAILS_FROM_EMAIL:
         raise AttributeError("Mail from address is not set.")
@@ -57,21 +104,11 @@ def _setup_mail_handler(
         raise AttributeError("Mail subject is not set.")
     if not settings.MAIL_TIMEOUT:
         raise AttributeError("Mail timeout is not set.")
-    if log_level == logging.CRITICAL:
-        credentials: tuple[str, str] = (
-            settings.SMTP_USER,
-            settings.SMTP_PASSWORD,
-        )
-        mail_handler = SMTPHandler(
-            mailhost=settings.SMTP_USER,
-            fromaddr=settings.EMAILS_FROM_EMAIL,
-            toaddrs=settings.SMTP_USER,
-            subject=settings.MAIL_SUBJECT,
-            credentials=credentials,
-            timeout=settings.MAIL_TIMEOUT,
-        )
-        mail_handler.setLevel(log_level)
-        logger.addHandler(mail_handler)
+    mail_handler: AlertMailHandler = AlertMailHandler(
+        alert_mailer, settings.MAIL_SUBJECT
+    )
+    mail_handler.setLevel(max(log_level, logging.CRITICAL))
+    return mail_handler
 
 
 def _create_logs_folder(init_settings: InitSettings) -> str:
@@ -107,7 +144,8 @@ def _configure_file_handler(
     log_filename: str, log_level: PositiveInt, init_settings: InitSettings
 ) -> logging.FileHandler:
     """
-    Configure a file handler with the given filename and log level
+    Configure a rotating file handler with the given filename and log
+     level. Rotation is size based or time based depending on settings.
     :param log_filename: The filename for the log file
     :type log_filename: str
     :param log_level: The log level for the file handler
@@ -120,36 +158,67 @@ def _configure_file_handler(
     formatter: logging.Formatter = logging.Formatter(
         init_settings.LOG_FORMAT, init_settings.DATE_FORMAT
     )
-    file_handler: logging.FileHandler = logging.FileHandler(log_filename)
+    file_handler: logging.FileHandler
+    if init_settings.LOG_ROTATION == "time":
+        file_handler = TimedRotatingFileHandler(
+            log_filename,
+            when=init_settings.LOG_ROTATION_WHEN,
+            backupCount=init_settings.LOG_BACKUP_COUNT,
+            encoding=init_settings.ENCODING,
+        )
+    else:
+        file_handler = RotatingFileHandler(
+            log_filename,
+            maxBytes=init_settings.LOG_MAX_BYTES,
+            backupCount=init_settings.LOG_BACKUP_COUNT,
+            encoding=init_settings.ENCODING,
+        )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(formatter)
     return file_handler
 
 
 def _setup_file_handler(
-    logger: logging.Logger,
     log_level: PositiveInt,
     init_settings: InitSettings = get_init_settings(),
-) -> None:
+) -> logging.Handler:
     """
-    Configure a file handler for the given logger
-    :param logger: The logger instance to set up a file handler for
-    :type logger: logging.Logger
+    Configure a file handler inside the logs folder
     :param log_level: The log level for the file handler
     :type log_level: PositiveInt
     :param init_settings: Dependency method for cached init setting object
     :type init_settings: InitSettings
-    :return: None
-    :rtype: NoneType
+    :return: A configured file handler
+    :rtype: logging.Handler
     """
     logs_folder_path = _create_logs_folder(init_settings)
     log_filename = _build_log_filename(init_settings)
     filename_path: str = f"{logs_folder_path}/{log_filename}"
-    file_handler = _configure_file_handler(
-        filename_path, log_level, init_settings
-    )
-    logger.addHandler(file_handler)
-    file_handler.flush()
+    return _configure_file_handler(filename_path, log_level, init_settings)
+
+
+def get_dropped_records() -> int:
+    """
+    Get the number of log records dropped because the queue was full
+    :return: The number of dropped records
+    :rtype: int
+    """
+    return _queue_handler.dropped_records if _queue_handler else 0
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background listener, flushing the records still queued
+    :return: None
+    :rtype: NoneType
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
 
 
 def setup_logging(
@@ -158,7 +227,8 @@ def setup_logging(
     settings: Settings = get_settings(),
 ) -> None:
     """
-    Initialize logging for the application
+    Initialize logging for the application. Records below the log level
+     are filtered before they are formatted or enqueued.
     :param log_level: The log level to use for the application.
      Defaults to DEBUG
     :type log_level: PositiveInt
@@ -169,10 +239,34 @@ def setup_logging(
     :return: None
     :rtype: NoneType
     """
+    global _queue_handler, _queue_listener
+    shutdown_logging()
+    handlers: list[logging.Handler] = [
+        _setup_console_handler(log_level),
+        _setup_file_handler(log_level, init_settings),
+        _setup_mail_handler(log_level, settings),
+    ]
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(
+        init_settings.LOG_QUEUE_SIZE
+    )
+    _queue_handler = DroppingQueueHandler(
+        log_queue, init_settings.LOG_QUEUE_DROP_POLICY
+    )
+    _queue_handler.setLevel(log_level)
+    _queue_listener = QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
     logger: logging.Logger = logging.getLogger()
     logger.handlers.clear()
     logger.propagate = False
     logger.setLevel(log_level)
-    _setup_console_handler(logger, log_level)
-    _setup_mail_handler(logger, log_level, settings)
-    _setup_file_handler(logger, log_level, init_settings)
+    logger.addHandler(_queue_handler)
+    _queue_listener.start()
+
+
+atexit.register(shutdown_logging)
+metrics_registry.counter(
+    "log_records_dropped_total",
+    "Log records dropped because the logging queue was full",
+    get_dropped_records,
+)
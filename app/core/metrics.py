@@ -0,0 +1,461 @@
+"""
+This module provides in-memory metrics for the application.
+Latencies are recorded into HDR-style log-linear histograms and events
+ into counters, both sharded per thread so recording never takes a lock,
+ and the registry renders every metric in the Prometheus text exposition
+ format.
+"""
+
+from threading import get_ident
+from typing import Any, Callable, Optional, Union, cast
+
+SUB_BUCKET_BITS: int = 4
+SUB_BUCKET_HALF: int = 1 << (SUB_BUCKET_BITS - 1)
+SUB_BUCKET_COUNT: int = 1 << SUB_BUCKET_BITS
+BUCKET_COUNT: int = 64 * SUB_BUCKET_HALF + SUB_BUCKET_COUNT
+NANOSECONDS: float = 1e9
+EXPORT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def bucket_index(value: int) -> int:
+    """
+    Get the log-linear bucket of a value. Values below SUB_BUCKET_COUNT
+     are exact, bigger values keep SUB_BUCKET_BITS significant bits.
+    :param value: The value to locate, in nanoseconds
+    :type value: int
+    :return: The index of its bucket
+    :rtype: int
+    """
+    if value < SUB_BUCKET_COUNT:
+        return max(value, 0)
+    shift: int = value.bit_length() - SUB_BUCKET_BITS
+    return shift * SUB_BUCKET_HALF + (value >> shift)
+
+
+def bucket_upper_bound(index: int) -> int:
+    """
+    Get the highest value that falls into a bucket
+    :param index: The index of the bucket
+    :type index: int
+    :return: The inclusive upper bound of the bucket, in nanoseconds
+    :rtype: int
+    """
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift: int = index // SUB_BUCKET_HALF - 1
+    top: int = index - shift * SUB_BUCKET_HALF
+    return ((top + 1) << shift) - 1
+
+
+def escape_label_value(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text format
+    :param value: The raw label value
+    :type value: str
+    :return: The escaped label value
+    :rtype: str
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: Labels, extra: Optional[str] = None) -> str:
+    """
+    Render a label set in the Prometheus text format
+    :param labels: The label names and values
+    :type labels: Labels
+    :param extra: An additional, already rendered, label
+    :type extra: Optional[str]
+    :return: The rendered label set, including the braces
+    :rtype: str
+    """
+    rendered: list[str] = [
+        f'{name}="{escape_label_value(value)}"' for name, value in labels
+    ]
+    if extra:
+        rendered.append(extra)
+    return "{" + ",".join(rendered) + "}" if rendered else ""
+
+
+class Histogram:
+    """
+    HDR-style latency histogram. Each thread records into its own shard
+     so no lock is needed; shards are merged when the histogram is read.
+    """
+
+    def __init__(self, labels: Labels):
+        self.labels: Labels = labels
+        self._shards: dict[int, list[int]] = {}
+        self._sums: dict[int, int] = {}
+
+    def record(self, value: int) -> None:
+        """
+        Record a value
+        :param value: The value to record, in nanoseconds
+        :type value: int
+        :return: None
+        :rtype: NoneType
+        """
+        ident: int = get_ident()
+        shard: Optional[list[int]] = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards.setdefault(ident, [0] * BUCKET_COUNT)
+            self._sums.setdefault(ident, 0)
+        shard[min(bucket_index(value), BUCKET_COUNT - 1)] += 1
+        self._sums[ident] += value
+
+    def merged(self) -> list[int]:
+        """
+        Merge the shards of every thread
+        :return: The count of each bucket
+        :rtype: list[int]
+        """
+        counts: list[int] = [0] * BUCKET_COUNT
+        for shard in list(self._shards.values()):
+            for index, count in enumerate(shard):
+                if count:
+                    counts[index] += count
+        return counts
+
+    @property
+    def count(self) -> int:
+        """
+        The number of recorded values
+        :return: The total count
+        :rtype: int
+        """
+        return sum(sum(shard) for shard in list(self._shards.values()))
+
+    @property
+    def total(self) -> int:
+        """
+        The sum of the recorded values
+        :return: The total, in nanoseconds
+        :rtype: int
+        """
+        return sum(list(self._sums.values()))
+
+    def quantile(self, quantile: float) -> float:
+        """
+        Estimate a quantile of the recorded values
+        :param quantile: The quantile to estimate, between 0 and 1
+        :type quantile: float
+        :return: The estimated value in seconds
+        :rtype: float
+        """
+        counts: list[int] = self.merged()
+        target: float = quantile * sum(counts)
+        seen: int = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if count and seen >= target:
+                return bucket_upper_bound(index) / NANOSECONDS
+        return 0.0
+
+    def render(self, name: str) -> list[str]:
+        """
+        Render the histogram as Prometheus samples
+        :param name: The metric name
+        :type name: str
+        :return: The rendered sample lines
+        :rtype: list[str]
+        """
+        counts: list[int] = self.merged()
+        lines: list[str] = []
+        cumulative: int = 0
+        index: int = 0
+        for bound in EXPORT_BUCKETS:
+            limit: float = bound * NANOSECONDS
+            while index < BUCKET_COUNT and bucket_upper_bound(index) <= limit:
+                cumulative += counts[index]
+                index += 1
+            bucket_label: str = f'le="{bound}"'
+            lines.append(
+                f"{name}_bucket{format_labels(self.labels, bucket_label)} "
+                f"{cumulative}"
+            )
+        total_count: int = sum(counts)
+        inf_label: str = 'le="+Inf"'
+        lines.append(
+            f"{name}_bucket{format_labels(self.labels, inf_label)} "
+            f"{total_count}"
+        )
+        lines.append(
+            f"{name}_sum{format_labels(self.labels)} "
+            f"{self.total / NANOSECONDS}"
+        )
+        lines.append(f"{name}_count{format_labels(self.labels)} {total_count}")
+        return lines
+
+
+class Counter:
+    """
+    Monotonic counter sharded per thread, or read from a callback when
+     the value is already tracked elsewhere.
+    """
+
+    def __init__(
+        self, labels: Labels, callback: Optional[Callable[[], float]] = None
+    ):
+        self.labels: Labels = labels
+        self.callback: Optional[Callable[[], float]] = callback
+        self._shards: dict[int, float] = {}
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increment the counter
+        :param amount: The amount to add
+        :type amount: float
+        :return: None
+        :rtype: NoneType
+        """
+        ident: int = get_ident()
+        self._shards[ident] = self._shards.get(ident, 0) + amount
+
+    @property
+    def value(self) -> float:
+        """
+        The current value of the counter
+        :return: The sum of every shard or the callback value
+        :rtype: float
+        """
+        if self.callback is not None:
+            return self.callback()
+        return sum(list(self._shards.values()))
+
+    def render(self, name: str) -> list[str]:
+        """
+        Render the counter as a Prometheus sample
+        :param name: The metric name
+        :type name: str
+        :return: The rendered sample lines
+        :rtype: list[str]
+        """
+        return [f"{name}{format_labels(self.labels)} {self.value}"]
+
+
+class Gauge:
+    """
+    Gauge holding the last value set, or read from a callback at
+     exposition time.
+    """
+
+    def __init__(
+        self, labels: Labels, callback: Optional[Callable[[], float]] = None
+    ):
+        self.labels: Labels = labels
+        self.callback: Optional[Callable[[], float]] = callback
+        self._value: float = 0
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge
+        :param value: The new value
+        :type value: float
+        :return: None
+        :rtype: NoneType
+        """
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        """
+        The current value of the gauge
+        :return: The last value set or the callback value
+        :rtype: float
+        """
+        if self.callback is not None:
+            return self.callback()
+        return self._value
+
+    def render(self, name: str) -> list[str]:
+        """
+        Render the gauge as a Prometheus sample
+        :param name: The metric name
+        :type name: str
+        :return: The rendered sample lines
+        :rtype: list[str]
+        """
+        return [f"{name}{format_labels(self.labels)} {self.value}"]
+
+
+Metric = Union[Histogram, Counter, Gauge]
+
+
+class MetricsRegistry:
+    """
+    Registry of the metrics collected by this worker
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, dict[Labels, Metric]] = {}
+        self._help: dict[str, str] = {}
+        self._types: dict[str, str] = {}
+
+    def _series(
+        self,
+        name: str,
+        documentation: str,
+        metric_type: str,
+        labels: dict[str, str],
+        factory: Callable[[Labels], Metric],
+    ) -> Metric:
+        """
+        Get or create a series of a metric
+        :param name: The metric name
+        :type name: str
+        :param documentation: The help text of the metric
+        :type documentation: str
+        :param metric_type: The Prometheus type of the metric
+        :type metric_type: str
+        :param labels: The label values of the series
+        :type labels: dict[str, str]
+        :param factory: The constructor of a new series
+        :type factory: Callable[[Labels], Metric]
+        :return: The series
+        :rtype: Metric
+        """
+        registered_type: str = self._types.setdefault(name, metric_type)
+        if registered_type != metric_type:
+            raise ValueError(f"{name} is already a {registered_type}")
+        key: Labels = tuple(sorted(labels.items()))
+        series: dict[Labels, Metric] = self._metrics.setdefault(name, {})
+        metric: Optional[Metric] = series.get(key)
+        if metric is None:
+            self._help.setdefault(name, documentation)
+            metric = series.setdefault(key, factory(key))
+        return metric
+
+    def histogram(
+        self, name: str, documentation: str, **labels: str
+    ) -> Histogram:
+        """
+        Get or create a histogram
+        :param name: The metric name
+        :type name: str
+        :param documentation: The help text of the metric
+        :type documentation: str
+        :param labels: The label values of the series
+        :type labels: str
+        :return: The histogram of the series
+        :rtype: Histogram
+        """
+        metric: Metric = self._series(
+            name, documentation, "histogram", labels, Histogram
+        )
+        return cast(Histogram, metric)
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        callback: Optional[Callable[[], float]] = None,
+        **labels: str,
+    ) -> Counter:
+        """
+        Get or create a counter
+        :param name: The metric name
+        :type name: str
+        :param documentation: The help text of the metric
+        :type documentation: str
+        :param callback: A function returning the current value
+        :type callback: Optional[Callable[[], float]]
+        :param labels: The label values of the series
+        :type labels: str
+        :return: The counter of the series
+        :rtype: Counter
+        """
+        metric: Metric = self._series(
+            name,
+            documentation,
+            "counter",
+            labels,
+            lambda key: Counter(key, callback),
+        )
+        return cast(Counter, metric)
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        callback: Optional[Callable[[], float]] = None,
+        **labels: str,
+    ) -> Gauge:
+        """
+        Get or create a gauge
+        :param name: The metric name
+        :type name: str
+        :param documentation: The help text of the metric
+        :type documentation: str
+        :param callback: A function returning the current value
+        :type callback: Optional[Callable[[], float]]
+        :param labels: The label values of the series
+        :type labels: str
+        :return: The gauge of the series
+        :rtype: Gauge
+        """
+        metric: Metric = self._series(
+            name,
+            documentation,
+            "gauge",
+            labels,
+            lambda key: Gauge(key, callback),
+        )
+        return cast(Gauge, metric)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text exposition format
+        :return: The exposition text
+        :rtype: str
+        """
+        lines: list[str] = []
+        for name, series in list(self._metrics.items()):
+            lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} {self._types[name]}")
+            for metric in list(series.values()):
+                lines.extend(metric.render(name))
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry: MetricsRegistry = MetricsRegistry()
+
+
+def register_lru_cache(name: str, cached: Any) -> None:
+    """
+    Export the hit and miss counters of a functools.lru_cache
+    :param name: The label of the cache
+    :type name: str
+    :param cached: The function wrapped by lru_cache
+    :type cached: Any
+    :return: None
+    :rtype: NoneType
+    """
+    metrics_registry.counter(
+        "cache_hits_total",
+        "Lookups answered from a cache",
+        lambda: cached.cache_info().hits,
+        cache=name,
+    )
+    metrics_registry.counter(
+        "cache_misses_total",
+        "Lookups a cache could not answer",
+        lambda: cached.cache_info().misses,
+        cache=name,
+    )
@@ -0,0 +1,142 @@
+"""
+This module holds the in-process prefix indexes behind autocomplete.
+Each index keeps the distinct labels of a column as a sorted list of
+ casefolded keys, so a prefix lookup is a binary search followed by a
+ short scan. Labels are tracked by the id of the row they belong to,
+ which lets the mutations replace or drop a row's label without knowing
+ its previous value.
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import takewhile
+from typing import Iterable
+
+JOB_TITLE: str = "job_title"
+EMPLOYER_NAME: str = "employer_name"
+INDUSTRY: str = "industry"
+
+
+class PrefixIndex:
+    """
+    Distinct labels of a column sorted for prefix lookups
+    """
+
+    def __init__(self) -> None:
+        self.ready: bool = False
+        self.keys: list[str] = []
+        self.labels: dict[str, str] = {}
+        self.counts: Counter[str] = Counter()
+        self.owners: dict[int, str] = {}
+
+    def load(self, entries: Iterable[tuple[int, str]]) -> None:
+        """
+        Replace the content of the index, sorting the keys once
+        :param entries: The id of every row and its label
+        :type entries: Iterable[tuple[int, str]]
+        :return: None
+        :rtype: NoneType
+        """
+        self.labels.clear()
+        self.counts.clear()
+        self.owners.clear()
+        for owner_id, label in entries:
+            key: str = label.casefold()
+            self.owners[owner_id] = key
+            self.counts[key] += 1
+            self.labels.setdefault(key, label)
+        self.keys = sorted(self.counts)
+        self.ready = True
+
+    def set(self, owner_id: int, label: str) -> None:
+        """
+        Set the label of a row, replacing its previous one
+        :param owner_id: The id of the row
+        :type owner_id: int
+        :param label: The new label
+        :type label: str
+        :return: None
+        :rtype: NoneType
+        """
+        key: str = label.casefold()
+        if self.owners.get(owner_id) == key:
+            return
+        self.discard(owner_id)
+        self.owners[owner_id] = key
+        if not self.counts[key]:
+            insort(self.keys, key)
+            self.labels[key] = label
+        self.counts[key] += 1
+
+    def discard(self, owner_id: int) -> None:
+        """
+        Drop the label of a row, and the key once no row uses it
+        :param owner_id: The id of the row
+        :type owner_id: int
+        :return: None
+        :rtype: NoneType
+        """
+        key: str | None = self.owners.pop(owner_id, None)
+        if key is None:
+            return
+        self.counts[key] -= 1
+        if self.counts[key]:
+            return
+        del self.counts[key]
+        del self.labels[key]
+        del self.keys[bisect_left(self.keys, key)]
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        """
+        Get the labels starting with a prefix, ignoring case
+        :param prefix: The typed prefix
+        :type prefix: str
+        :param limit: The maximum number of labels
+        :type limit: int
+        :return: The matching labels in alphabetical order
+        :rtype: list[str]
+        """
+        key: str = prefix.casefold()
+        start: int = bisect_left(self.keys, key)
+        return [
+            self.labels[match]
+            for match in takewhile(
+                lambda candidate: candidate.startswith(key),
+                self.keys[start : start + limit],
+            )
+        ]
+
+
+prefix_indexes: dict[str, PrefixIndex] = {
+    kind: PrefixIndex() for kind in (JOB_TITLE, EMPLOYER_NAME, INDUSTRY)
+}
+
+
+def update_prefixes(kind: str, entries: Iterable[tuple[int, str]]) -> None:
+    """
+    Set the labels of created or updated rows in a prefix index
+    :param kind: The prefix index to update
+    :type kind: str
+    :param entries: The id of every row and its label
+    :type entries: Iterable[tuple[int, str]]
+    :return: None
+    :rtype: NoneType
+    """
+    index: PrefixIndex = prefix_indexes[kind]
+    for owner_id, label in entries:
+        index.set(owner_id, label)
+
+
+def discard_prefixes(kind: str, owner_ids: Iterable[int]) -> None:
+    """
+    Drop the labels of deleted rows from a prefix index
+    :param kind: The prefix index to update
+    :type kind: str
+    :param owner_ids: The ids of the deleted rows
+    :type owner_ids: Iterable[int]
+    :return: None
+    :rtype: NoneType
+    """
+    index: PrefixIndex = prefix_indexes[kind]
+    for owner_id in owner_ids:
+        index.discard(owner_id)
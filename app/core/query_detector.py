@@ -0,0 +1,200 @@
+"""
+This module detects N+1 query patterns in a GraphQL operation: the
+ same statement shape issued over and over from the same resolver path,
+ typically by a field resolver loading a relationship once per parent.
+Detection is opt-in per request; when no detector is active every hook
+ is a single context variable lookup.
+"""
+
+import re
+from collections import Counter
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+from graphql import GraphQLResolveInfo
+
+PLACEHOLDER_PATTERN: re.Pattern[str] = re.compile(
+    r"\$\d+(?:::\w+)?|%\(\w+\)s|%s|\?"
+)
+LITERAL_PATTERN: re.Pattern[str] = re.compile(
+    r"'(?:[^']|'')*'|(?<![\w.])\d+(?:\.\d+)?\b"
+)
+VALUES_LIST_PATTERN: re.Pattern[str] = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+WHITESPACE_PATTERN: re.Pattern[str] = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape, replacing parameters and
+     literals with placeholders and collapsing IN lists
+    :param statement: The SQL statement
+    :type statement: str
+    :return: The normalized statement
+    :rtype: str
+    """
+    shape: str = PLACEHOLDER_PATTERN.sub("?", statement)
+    shape = LITERAL_PATTERN.sub("?", shape)
+    shape = VALUES_LIST_PATTERN.sub("(?)", shape)
+    return WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+def resolver_path(info: GraphQLResolveInfo) -> str:
+    """
+    Get the path of a resolver without list indexes, so the resolvers
+     of every item of a list share it
+    :param info: The GraphQL resolve info
+    :type info: GraphQLResolveInfo
+    :return: The dotted field path
+    :rtype: str
+    """
+    return ".".join(
+        str(key) for key in info.path.as_list() if isinstance(key, str)
+    )
+
+
+class RepeatedStatement(NamedTuple):
+    """
+    A statement shape repeated from the same resolver path
+    """
+
+    path: str
+    statement: str
+    repetitions: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the finding for the response extensions
+        :return: The finding
+        :rtype: dict[str, Any]
+        """
+        return {
+            "path": self.path,
+            "statement": self.statement,
+            "count": self.repetitions,
+        }
+
+
+class QueryDetector:
+    """
+    Statements issued during a GraphQL operation, grouped by resolver
+     path and normalized SQL
+    """
+
+    def __init__(self, threshold: int):
+        self.threshold: int = threshold
+        self.statement_count: int = 0
+        self.groups: Counter[tuple[str, str]] = Counter()
+
+    def record(self, path: str, statement: str) -> None:
+        """
+        Count a statement issued from a resolver path
+        :param path: The resolver path
+        :type path: str
+        :param statement: The SQL statement
+        :type statement: str
+        :return: None
+        :rtype: NoneType
+        """
+        self.statement_count += 1
+        self.groups[path, normalize_statement(statement)] += 1
+
+    def findings(self) -> list[RepeatedStatement]:
+        """
+        Get the statement shapes repeated past the threshold
+        :return: The repeated statements, most repeated first
+        :rtype: list[RepeatedStatement]
+        """
+        return [
+            RepeatedStatement(path, statement, count)
+            for (path, statement), count in self.groups.most_common()
+            if count >= self.threshold
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the findings for the response extensions
+        :return: The statement count and the repeated statements
+        :rtype: dict[str, Any]
+        """
+        return {
+            "statementCount": self.statement_count,
+            "repeated": [finding.to_dict() for finding in self.findings()],
+        }
+
+
+_detector: ContextVar[Optional[QueryDetector]] = ContextVar(
+    "query_detector", default=None
+)
+_path: ContextVar[str] = ContextVar("resolver_path", default="")
+
+
+def start_detection(
+    threshold: int,
+) -> tuple[QueryDetector, Token[Optional[QueryDetector]]]:
+    """
+    Start detecting repeated statements in the current context
+    :param threshold: The repetitions from a path that are reported
+    :type threshold: int
+    :return: The detector and the token to stop detecting
+    :rtype: tuple[QueryDetector, Token[Optional[QueryDetector]]]
+    """
+    detector: QueryDetector = QueryDetector(threshold)
+    return detector, _detector.set(detector)
+
+
+def reset_detection(token: Token[Optional[QueryDetector]]) -> None:
+    """
+    Stop detecting repeated statements in the current context
+    :param token: The token returned by start_detection
+    :type token: Token[Optional[QueryDetector]]
+    :return: None
+    :rtype: NoneType
+    """
+    _detector.reset(token)
+
+
+def get_detector() -> Optional[QueryDetector]:
+    """
+    Get the detector of the current context
+    :return: The active detector, if any
+    :rtype: Optional[QueryDetector]
+    """
+    return _detector.get()
+
+
+def set_resolver_path(path: str) -> Token[str]:
+    """
+    Attribute the statements issued from now on to a resolver path
+    :param path: The path of the running resolver
+    :type path: str
+    :return: The token to restore the previous path
+    :rtype: Token[str]
+    """
+    return _path.set(path)
+
+
+def reset_resolver_path(token: Token[str]) -> None:
+    """
+    Restore the path that was running before set_resolver_path
+    :param token: The token returned by set_resolver_path
+    :type token: Token[str]
+    :return: None
+    :rtype: NoneType
+    """
+    _path.reset(token)
+
+
+def detect_statement(statement: str) -> None:
+    """
+    Count a statement against the resolver that issued it, if the
+     operation is being checked
+    :param statement: The SQL statement
+    :type statement: str
+    :return: None
+    :rtype: NoneType
+    """
+    detector: Optional[QueryDetector] = _detector.get()
+    if detector is not None:
+        detector.record(_path.get(), statement)
@@ -0,0 +1,169 @@
+"""
+This module holds the in-process full-text index used to search jobs
+ when the database has no full-text search of its own, as with the
+ SQLite backend. Documents are ranked with BM25 and a query matches the
+ documents that contain all of its terms, like the websearch_to_tsquery
+ of PostgreSQL, but without stemming.
+It is built from the job table on the first search and then kept up to
+ date by the job mutations of this process.
+"""
+
+import re
+from collections import Counter
+from math import log
+from typing import Iterable
+
+TOKEN_PATTERN: re.Pattern[str] = re.compile(r"\w+")
+BM25_K1: float = 1.2
+BM25_B: float = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split a text into lowercase terms
+    :param text: The text to split
+    :type text: str
+    :return: The terms in order of appearance
+    :rtype: list[str]
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Postings of every term with its frequency in each document
+    """
+
+    def __init__(self) -> None:
+        self.ready: bool = False
+        self.postings: dict[str, dict[int, int]] = {}
+        self.terms: dict[int, tuple[str, ...]] = {}
+        self.lengths: dict[int, int] = {}
+        self.total_length: int = 0
+
+    def add(self, document_id: int, text: str) -> None:
+        """
+        Index a document, replacing its previous version if any
+        :param document_id: The id of the document
+        :type document_id: int
+        :param text: The text of the document
+        :type text: str
+        :return: None
+        :rtype: NoneType
+        """
+        self.remove(document_id)
+        terms: list[str] = tokenize(text)
+        frequencies: Counter[str] = Counter(terms)
+        for term, frequency in frequencies.items():
+            self.postings.setdefault(term, {})[document_id] = frequency
+        self.terms[document_id] = tuple(frequencies)
+        self.lengths[document_id] = len(terms)
+        self.total_length += len(terms)
+
+    def remove(self, document_id: int) -> None:
+        """
+        Remove a document from the index
+        :param document_id: The id of the document
+        :type document_id: int
+        :return: None
+        :rtype: NoneType
+        """
+        terms: tuple[str, ...] | None = self.terms.pop(document_id, None)
+        if terms is None:
+            return
+        self.total_length -= self.lengths.pop(document_id)
+        for term in terms:
+            documents: dict[int, int] = self.postings[term]
+            del documents[document_id]
+            if not documents:
+                del self.postings[term]
+
+    def clear(self) -> None:
+        """
+        Empty the index so it is built again on the next search
+        :return: None
+        :rtype: NoneType
+        """
+        self.ready = False
+        self.postings.clear()
+        self.terms.clear()
+        self.lengths.clear()
+        self.total_length = 0
+
+    def search(self, query: str) -> list[tuple[float, int]]:
+        """
+        Rank the documents that contain every term of a query
+        :param query: The search text
+        :type query: str
+        :return: The score and id of the matches, best first and by id
+         on ties
+        :rtype: list[tuple[float, int]]
+        """
+        terms: list[str] = list(dict.fromkeys(tokenize(query)))
+        if not terms or any(term not in self.postings for term in terms):
+            return []
+        postings: list[dict[int, int]] = sorted(
+            (self.postings[term] for term in terms), key=len
+        )
+        matches: set[int] = set(postings[0]).intersection(*postings[1:])
+        count: int = len(self.lengths)
+        average_length: float = self.total_length / count
+        scores: list[tuple[float, int]] = []
+        for document_id in matches:
+            norm: float = BM25_K1 * (
+                1 - BM25_B + BM25_B * self.lengths[document_id] / average_length
+            )
+            score: float = 0.0
+            for documents in postings:
+                frequency: int = documents[document_id]
+                idf: float = log(
+                    1 + (count - len(documents) + 0.5) / (len(documents) + 0.5)
+                )
+                score += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+            scores.append((score, document_id))
+        scores.sort(key=lambda match: (-match[0], match[1]))
+        return scores
+
+
+job_index: InvertedIndex = InvertedIndex()
+
+
+def job_text(title: str, description: str) -> str:
+    """
+    Get the searchable text of a job
+    :param title: The title of the job
+    :type title: str
+    :param description: The description of the job
+    :type description: str
+    :return: The text indexed for the job
+    :rtype: str
+    """
+    return f"{title} {description}"
+
+
+def index_jobs(jobs: Iterable[tuple[int, str, str]]) -> None:
+    """
+    Add or refresh jobs in the in-process index once it is built
+    :param jobs: The id, title and description of every job
+    :type jobs: Iterable[tuple[int, str, str]]
+    :return: None
+    :rtype: NoneType
+    """
+    if not job_index.ready:
+        return
+    for job_id, title, description in jobs:
+        job_index.add(job_id, job_text(title, description))
+
+
+def unindex_jobs(job_ids: Iterable[int]) -> None:
+    """
+    Remove deleted jobs from the in-process index once it is built
+    :param job_ids: The ids of the deleted jobs
+    :type job_ids: Iterable[int]
+    :return: None
+    :rtype: NoneType
+    """
+    if not job_index.ready:
+        return
+    for job_id in job_ids:
+        job_index.remove(job_id)
@@ -5,9 +5,12 @@ A module for password in the app.core.security package.
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+from app.core.decorators import instrument
+
 password_hasher: PasswordHasher = PasswordHasher()
 
 
+@instrument(name="argon2.hash")
 def hash_password(password: str) -> str:
     """
     Hash a password using argon2.
@@ -17,6 +20,7 @@ def hash_password(password: str) -> str:
     return password_hasher.hash(password)
 
 
+@instrument(name="argon2.verify")
 def verify_password(hashed_password: str, password: str) -> bool:
     """
     Verify a password against the given hash.
@@ -0,0 +1,213 @@
+"""
+This module collects per-resolver traces of a GraphQL operation, with
+ the SQL issued inside each resolver, in the Apollo tracing format.
+Tracing is opt-in per request; when no trace is active every hook is a
+ single context variable lookup.
+"""
+
+import json
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from time import perf_counter_ns
+from typing import Any, Optional
+
+from graphql import GraphQLResolveInfo
+
+APOLLO_TRACING_VERSION: int = 1
+
+
+class ResolverSpan:
+    """
+    Timing of a single resolver and the statements it issued
+    """
+
+    def __init__(self, info: GraphQLResolveInfo, start_offset: int):
+        self.path: list[str | int] = info.path.as_list()
+        self.parent_type: str = info.parent_type.name
+        self.field_name: str = info.field_name
+        self.return_type: str = str(info.return_type)
+        self.start_offset: int = start_offset
+        self.duration: int = 0
+        self.statements: list[dict[str, Any]] = []
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the span as an Apollo tracing resolver entry
+        :return: The resolver entry
+        :rtype: dict[str, Any]
+        """
+        return {
+            "path": self.path,
+            "parentType": self.parent_type,
+            "fieldName": self.field_name,
+            "returnType": self.return_type,
+            "startOffset": self.start_offset,
+            "duration": self.duration,
+            "sql": self.statements,
+        }
+
+
+class Trace:
+    """
+    Trace of a GraphQL operation
+    """
+
+    def __init__(self) -> None:
+        self.start_time: datetime = datetime.now(UTC)
+        self.start_ns: int = perf_counter_ns()
+        self.end_time: Optional[datetime] = None
+        self.duration: int = 0
+        self.resolvers: list[ResolverSpan] = []
+
+    def start_resolver(self, info: GraphQLResolveInfo) -> ResolverSpan:
+        """
+        Open the span of a resolver
+        :param info: The GraphQL resolve info
+        :type info: GraphQLResolveInfo
+        :return: The new span
+        :rtype: ResolverSpan
+        """
+        span: ResolverSpan = ResolverSpan(
+            info, perf_counter_ns() - self.start_ns
+        )
+        self.resolvers.append(span)
+        return span
+
+    def finish_resolver(self, span: ResolverSpan) -> None:
+        """
+        Close the span of a resolver
+        :param span: The span to close
+        :type span: ResolverSpan
+        :return: None
+        :rtype: NoneType
+        """
+        span.duration = perf_counter_ns() - self.start_ns - span.start_offset
+
+    def finish(self) -> None:
+        """
+        Close the trace
+        :return: None
+        :rtype: NoneType
+        """
+        self.end_time = datetime.now(UTC)
+        self.duration = perf_counter_ns() - self.start_ns
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the trace in the Apollo tracing format
+        :return: The tracing extension
+        :rtype: dict[str, Any]
+        """
+        end_time: datetime = self.end_time or datetime.now(UTC)
+        return {
+            "version": APOLLO_TRACING_VERSION,
+            "startTime": self.start_time.isoformat(),
+            "endTime": end_time.isoformat(),
+            "duration": self.duration,
+            "execution": {
+                "resolvers": [span.to_dict() for span in self.resolvers]
+            },
+        }
+
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_span: ContextVar[Optional[ResolverSpan]] = ContextVar("span", default=None)
+
+
+def start_trace() -> tuple[Trace, Token[Optional[Trace]]]:
+    """
+    Start tracing the current context
+    :return: The trace and the token to stop tracing
+    :rtype: tuple[Trace, Token[Optional[Trace]]]
+    """
+    trace: Trace = Trace()
+    return trace, _trace.set(trace)
+
+
+def reset_trace(token: Token[Optional[Trace]]) -> None:
+    """
+    Stop tracing the current context
+    :param token: The token returned by start_trace
+    :type token: Token[Optional[Trace]]
+    :return: None
+    :rtype: NoneType
+    """
+    _trace.reset(token)
+
+
+def get_trace() -> Optional[Trace]:
+    """
+    Get the trace of the current context
+    :return: The active trace, if any
+    :rtype: Optional[Trace]
+    """
+    return _trace.get()
+
+
+def set_current_span(
+    span: ResolverSpan,
+) -> Token[Optional[ResolverSpan]]:
+    """
+    Attribute the statements issued from now on to a resolver
+    :param span: The span of the running resolver
+    :type span: ResolverSpan
+    :return: The token to restore the previous span
+    :rtype: Token[Optional[ResolverSpan]]
+    """
+    return _span.set(span)
+
+
+def reset_current_span(token: Token[Optional[ResolverSpan]]) -> None:
+    """
+    Restore the span that was running before set_current_span
+    :param token: The token returned by set_current_span
+    :type token: Token[Optional[ResolverSpan]]
+    :return: None
+    :rtype: NoneType
+    """
+    _span.reset(token)
+
+
+def record_statement(statement: str, start_ns: int, end_ns: int) -> None:
+    """
+    Attach a statement to the resolver that issued it, if it is traced
+    :param statement: The SQL statement
+    :type statement: str
+    :param start_ns: When the statement was sent, in nanoseconds
+    :type start_ns: int
+    :param end_ns: When the statement completed, in nanoseconds
+    :type end_ns: int
+    :return: None
+    :rtype: NoneType
+    """
+    span: Optional[ResolverSpan] = _span.get()
+    trace: Optional[Trace] = _trace.get()
+    if span is None or trace is None:
+        return
+    span.statements.append(
+        {
+            "statement": statement,
+            "startOffset": start_ns - trace.start_ns,
+            "duration": end_ns - start_ns,
+        }
+    )
+
+
+def export_trace(
+    path: str, operation_name: Optional[str], trace: Trace
+) -> None:
+    """
+    Append a trace as a JSON line to the collector file
+    :param path: The path of the collector file
+    :type path: str
+    :param operation_name: The name of the traced operation
+    :type operation_name: Optional[str]
+    :param trace: The trace to export
+    :type trace: Trace
+    :return: None
+    :rtype: NoneType
+    """
+    record: dict[str, Any] = {"operationName": operation_name}
+    record.update(trace.to_dict())
+    with open(path, mode="a", encoding="utf-8") as file:
+        file.write(json.dumps(record) + "\n")
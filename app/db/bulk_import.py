@@ -0,0 +1,458 @@
+"""
+A module for bulk import in the app.db package.
+An import reads a file a chunk at a time and applies its rows in batches
+ of IMPORT_BATCH_SIZE: each batch is validated with the schemas of the
+ bulk mutations, its valid rows are written with one multi-row INSERT,
+ as bulk_insert does, and the rejected rows are reported by their number
+ in the file. The checkpoint of the import advances in the transaction
+ of every batch, so running an interrupted import again under the same
+ name skips the rows already applied:
+    python -m app.db.bulk_import jobs feed.csv [--name NAME] [--restart]
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    NamedTuple,
+    Sequence,
+)
+
+import aiofiles
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import Row, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.graphql.mutations.bulk import existing_ids, validation_message
+from app.config.config import performance_setting
+from app.core.prefix_index import (
+    EMPLOYER_NAME,
+    INDUSTRY,
+    JOB_TITLE,
+    update_prefixes,
+)
+from app.core.search_index import index_jobs
+from app.db.session import async_engine, get_session
+from app.db.upsert import conflict_insert
+from app.exceptions.exceptions import ImportConflictException
+from app.models.employer import Employer
+from app.models.import_checkpoint import ImportCheckpoint
+from app.models.job import Job
+from app.schemas.external.bulk_import import ImportReport, ImportRowError
+from app.schemas.external.employer import EmployerCreate
+from app.schemas.external.job import JobCreate
+from app.schemas.infrastructure.file_format import FileFormat
+from app.schemas.infrastructure.import_dataset import ImportDataset
+from app.utils.file_utils.record_utils import FileRecord, read_records
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+FILE_CHUNK_SIZE: int = 64 * 1024
+
+ValidRows = list[tuple[int, Any]]
+InsertedRows = Sequence[Row[Any]]
+
+
+class ImportTarget(NamedTuple):
+    """
+    The schema of the rows of a dataset, how they are written and how
+     the written rows are indexed
+    """
+
+    schema: type[BaseModel]
+    insert: Callable[
+        [AsyncSession, ValidRows],
+        Awaitable[tuple[InsertedRows, list[ImportRowError]]],
+    ]
+    indexer: Callable[[InsertedRows], None]
+
+
+async def insert_jobs(
+    session: AsyncSession, rows: ValidRows
+) -> tuple[InsertedRows, list[ImportRowError]]:
+    """
+    Insert the valid rows of a batch of jobs whose employer exists
+    :param session: The session of the batch
+    :type session: AsyncSession
+    :param rows: The row numbers and validated jobs
+    :type rows: ValidRows
+    :return: The inserted jobs and the rejected rows
+    :rtype: tuple[InsertedRows, list[ImportRowError]]
+    """
+    employer_ids: set[int] = await existing_ids(
+        session, Employer.id, (item.employer_id for _, item in rows)
+    )
+    errors: list[ImportRowError] = [
+        ImportRowError(row=row, message="Employer not found")
+        for row, item in rows
+        if item.employer_id not in employer_ids
+    ]
+    values: list[dict[str, Any]] = [
+        item.model_dump()
+        for _, item in rows
+        if item.employer_id in employer_ids
+    ]
+    if not values:
+        return [], errors
+    inserted: InsertedRows = (
+        await session.execute(
+            insert(Job).returning(Job.id, Job.title, Job.description), values
+        )
+    ).all()
+    return inserted, errors
+
+
+async def insert_employers(
+    session: AsyncSession, rows: ValidRows
+) -> tuple[InsertedRows, list[ImportRowError]]:
+    """
+    Insert the valid rows of a batch of employers whose contact email is
+     not taken yet
+    :param session: The session of the batch
+    :type session: AsyncSession
+    :param rows: The row numbers and validated employers
+    :type rows: ValidRows
+    :return: The inserted employers and the rejected rows
+    :rtype: tuple[InsertedRows, list[ImportRowError]]
+    """
+    errors: list[ImportRowError] = []
+    insertable: dict[str, tuple[int, EmployerCreate]] = {}
+    for row, item in rows:
+        if item.contact_email in insertable:
+            errors.append(
+                ImportRowError(
+                    row=row, message="Employer repeated in the input"
+                )
+            )
+        else:
+            insertable[item.contact_email] = (row, item)
+    if not insertable:
+        return [], errors
+    inserted: InsertedRows = (
+        await session.execute(
+            conflict_insert(Employer)
+            .on_conflict_do_nothing()
+            .returning(
+                Employer.id,
+                Employer.name,
+                Employer.industry,
+                Employer.contact_email,
+            ),
+            [item.model_dump() for _, item in insertable.values()],
+        )
+    ).all()
+    emails: set[str] = {employer.contact_email for employer in inserted}
+    errors.extend(
+        ImportRowError(
+            row=row,
+            message="Employer already exists with that contact email",
+        )
+        for email, (row, _) in insertable.items()
+        if email not in emails
+    )
+    return inserted, errors
+
+
+def index_inserted_jobs(jobs: InsertedRows) -> None:
+    """
+    Add imported jobs to the in-process search and autocomplete indexes
+    :param jobs: The id, title and description of the imported jobs
+    :type jobs: InsertedRows
+    :return: None
+    :rtype: NoneType
+    """
+    index_jobs((job.id, job.title, job.description) for job in jobs)
+    update_prefixes(JOB_TITLE, ((job.id, job.title) for job in jobs))
+
+
+def index_inserted_employers(employers: InsertedRows) -> None:
+    """
+    Add imported employers to the autocomplete indexes
+    :param employers: The id, name and industry of the imported employers
+    :type employers: InsertedRows
+    :return: None
+    :rtype: NoneType
+    """
+    update_prefixes(
+        EMPLOYER_NAME, ((employer.id, employer.name) for employer in employers)
+    )
+    update_prefixes(
+        INDUSTRY, ((employer.id, employer.industry) for employer in employers)
+    )
+
+
+IMPORTS: dict[ImportDataset, ImportTarget] = {
+    ImportDataset.EMPLOYERS: ImportTarget(
+        EmployerCreate, insert_employers, index_inserted_employers
+    ),
+    ImportDataset.JOBS: ImportTarget(
+        JobCreate, insert_jobs, index_inserted_jobs
+    ),
+}
+
+
+def validate_records(
+    records: list[FileRecord], schema: type[BaseModel]
+) -> tuple[ValidRows, list[ImportRowError]]:
+    """
+    Validate the records of a batch against the schema of its dataset
+    :param records: The records of the batch
+    :type records: list[FileRecord]
+    :param schema: The Pydantic schema of a row
+    :type schema: type[BaseModel]
+    :return: The valid rows with their number and the rejected rows
+    :rtype: tuple[ValidRows, list[ImportRowError]]
+    """
+    valid: ValidRows = []
+    errors: list[ImportRowError] = []
+    for record in records:
+        if record.values is None:
+            errors.append(
+                ImportRowError(row=record.row, message=str(record.error))
+            )
+            continue
+        try:
+            valid.append((record.row, schema.model_validate(record.values)))
+        except ValidationError as exc:
+            errors.append(
+                ImportRowError(row=record.row, message=validation_message(exc))
+            )
+    return valid, errors
+
+
+async def install_import_checkpoints() -> None:
+    """
+    Add the import checkpoint table to an existing database
+    :return: None
+    :rtype: NoneType
+    """
+    async with async_engine.begin() as connection:
+        await connection.run_sync(
+            ImportCheckpoint.__table__.create, checkfirst=True
+        )
+
+
+async def start_import(
+    dataset: ImportDataset, name: str, restart: bool = False
+) -> ImportReport:
+    """
+    Get the checkpoint of an import, creating it on the first run, along
+     with its table on an existing database
+    :param dataset: The dataset the file is imported into
+    :type dataset: ImportDataset
+    :param name: The name identifying the imported file
+    :type name: str
+    :param restart: Drop the checkpoint and import the file from its
+     first row
+    :type restart: bool
+    :return: The report of the rows already applied
+    :rtype: ImportReport
+    """
+    await install_import_checkpoints()
+    key: dict[str, str] = {"dataset": dataset, "name": name}
+    async_session: AsyncSession = await get_session()
+    async with async_session as session, session.begin():
+        if restart:
+            await session.execute(delete(ImportCheckpoint).filter_by(**key))
+        await session.execute(
+            conflict_insert(ImportCheckpoint)
+            .values(**key, rows=0, imported=0, failed=0)
+            .on_conflict_do_nothing()
+        )
+        rows, imported, failed = (
+            await session.execute(
+                select(
+                    ImportCheckpoint.rows,
+                    ImportCheckpoint.imported,
+                    ImportCheckpoint.failed,
+                ).filter_by(**key)
+            )
+        ).one()
+    return ImportReport(
+        dataset=dataset,
+        name=name,
+        resumed_from=rows,
+        rows=rows,
+        imported=imported,
+        failed=failed,
+    )
+
+
+async def apply_batch(
+    report: ImportReport, records: list[FileRecord]
+) -> list[ImportRowError]:
+    """
+    Write the valid rows of a batch and advance the checkpoint past it in
+     one transaction
+    :param report: The report of the import, updated with the batch
+    :type report: ImportReport
+    :param records: The records of the batch, in file order
+    :type records: list[FileRecord]
+    :return: The rejected rows of the batch
+    :rtype: list[ImportRowError]
+    """
+    target: ImportTarget = IMPORTS[report.dataset]
+    valid, errors = validate_records(records, target.schema)
+    key: dict[str, str] = {"dataset": report.dataset, "name": report.name}
+    async_session: AsyncSession = await get_session()
+    async with async_session as session, session.begin():
+        applied: int | None = await session.scalar(
+            select(ImportCheckpoint.rows).filter_by(**key).with_for_update()
+        )
+        if applied != report.rows:
+            raise ImportConflictException(
+                f"Import {report.name} is at row {applied}, expected"
+                f" {report.rows}",
+                "Another run of the same import applied rows meanwhile",
+            )
+        inserted: InsertedRows = []
+        if valid:
+            inserted, rejected = await target.insert(session, valid)
+            errors.extend(rejected)
+        await session.execute(
+            update(ImportCheckpoint)
+            .filter_by(**key)
+            .values(
+                rows=records[-1].row,
+                imported=ImportCheckpoint.imported + len(inserted),
+                failed=ImportCheckpoint.failed + len(errors),
+            )
+        )
+    target.indexer(inserted)
+    report.rows = records[-1].row
+    report.imported += len(inserted)
+    report.failed += len(errors)
+    return sorted(errors, key=lambda error: error.row)
+
+
+async def import_records(
+    report: ImportReport,
+    records: AsyncIterator[FileRecord],
+    on_error: Callable[[ImportRowError], None],
+    batch_size: int = performance_setting.IMPORT_BATCH_SIZE,
+) -> ImportReport:
+    """
+    Apply the records of a file after its checkpoint, one batch at a time
+    :param report: The report of the import from its checkpoint
+    :type report: ImportReport
+    :param records: The records of the file
+    :type records: AsyncIterator[FileRecord]
+    :param on_error: Called with every row rejected by this run
+    :type on_error: Callable[[ImportRowError], None]
+    :param batch_size: The number of records per batch
+    :type batch_size: int
+    :return: The report of the import
+    :rtype: ImportReport
+    """
+    batch: list[FileRecord] = []
+    async for record in records:
+        if record.row <= report.resumed_from:
+            continue
+        batch.append(record)
+        if len(batch) < batch_size:
+            continue
+        for error in await apply_batch(report, batch):
+            on_error(error)
+        batch = []
+    if batch:
+        for error in await apply_batch(report, batch):
+            on_error(error)
+    logger.info(
+        "Imported %s into %s: %d rows, %d imported, %d failed",
+        report.name,
+        report.dataset,
+        report.rows,
+        report.imported,
+        report.failed,
+    )
+    return report
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    """
+    Read a file a chunk at a time
+    :param path: The path of the file
+    :type path: Path
+    :return: The chunks of the file
+    :rtype: AsyncIterator[bytes]
+    """
+    async with aiofiles.open(path, mode="rb") as file:
+        while chunk := await file.read(FILE_CHUNK_SIZE):
+            yield chunk
+
+
+async def import_file(
+    dataset: ImportDataset,
+    path: Path,
+    file_format: FileFormat,
+    name: str,
+    restart: bool = False,
+) -> ImportReport:
+    """
+    Import a file, writing every rejected row to stdout as NDJSON
+    :param dataset: The dataset to import the file into
+    :type dataset: ImportDataset
+    :param path: The path of the file
+    :type path: Path
+    :param file_format: The format of the file
+    :type file_format: FileFormat
+    :param name: The name identifying the import
+    :type name: str
+    :param restart: Import the file from its first row
+    :type restart: bool
+    :return: The report of the import
+    :rtype: ImportReport
+    """
+    report: ImportReport = await start_import(dataset, name, restart)
+    if report.resumed_from:
+        logger.info("Resuming %s after row %d", name, report.resumed_from)
+    return await import_records(
+        report,
+        read_records(read_file(path), file_format),
+        lambda error: print(error.model_dump_json(), flush=True),
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m app.db.bulk_import",
+        description="Import a CSV or NDJSON file of employers or jobs,"
+        " writing the rejected rows to stdout as NDJSON.",
+    )
+    parser.add_argument("dataset", type=ImportDataset, choices=ImportDataset)
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        type=FileFormat,
+        choices=FileFormat,
+        help="format of the file, by default its extension",
+    )
+    parser.add_argument(
+        "--name", help="name to resume the import by, by default the path"
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="import the file from its first row",
+    )
+    arguments: argparse.Namespace = parser.parse_args()
+    suffix: str = arguments.path.suffix.lstrip(".").lower()
+    if arguments.format is None and suffix not in list(FileFormat):
+        parser.error(f"cannot tell the format of {arguments.path}")
+    result: ImportReport = asyncio.run(
+        import_file(
+            arguments.dataset,
+            arguments.path,
+            arguments.format or FileFormat(suffix),
+            arguments.name or str(arguments.path),
+            arguments.restart,
+        )
+    )
+    sys.exit(1 if result.failed else 0)
@@ -0,0 +1,204 @@
+"""
+A module for counters in the app.db package.
+Employer.jobs_count and Job.applications_count are kept by triggers in
+ the transaction of every write. This command adds the counters to an
+ existing database and repairs the rows whose counter drifted from the
+ actual number of children, as after writes made without the triggers:
+    python -m app.db.counters [--check]
+Each counter is compared against a count taken in one statement, so
+ when children are written while it runs, run it again to confirm.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from typing import NamedTuple
+
+from sqlalchemy import (
+    DDL,
+    ColumnElement,
+    Connection,
+    ScalarSelect,
+    Table,
+    func,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine import Inspector
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import async_engine
+from app.models.application import APPLICATION_COUNTER_DDL, Application
+from app.models.employer import Employer
+from app.models.job import JOB_COUNTER_DDL, Job
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Counter(NamedTuple):
+    """
+    A counter column, the children it counts and its triggers
+    """
+
+    parent: Table
+    column: str
+    child: Table
+    foreign_key: str
+    ddl: dict[str, tuple[DDL, ...]]
+
+    @property
+    def name(self) -> str:
+        """
+        The qualified name of the counter column
+        :return: The table and column names
+        :rtype: str
+        """
+        return f"{self.parent.name}.{self.column}"
+
+    def actual(self) -> ScalarSelect[int]:
+        """
+        Count the children of the parent row being updated or selected
+        :return: The correlated count
+        :rtype: ScalarSelect[int]
+        """
+        return (
+            select(func.count())
+            .where(self.child.c[self.foreign_key] == self.parent.c.id)
+            .scalar_subquery()
+        )
+
+    def drifted(self) -> ColumnElement[bool]:
+        """
+        Match the parent rows whose counter is wrong
+        :return: The condition
+        :rtype: ColumnElement[bool]
+        """
+        return self.parent.c[self.column] != self.actual()
+
+
+COUNTERS: tuple[Counter, ...] = (
+    Counter(
+        Employer.__table__,
+        "jobs_count",
+        Job.__table__,
+        "employer_id",
+        JOB_COUNTER_DDL,
+    ),
+    Counter(
+        Job.__table__,
+        "applications_count",
+        Application.__table__,
+        "job_id",
+        APPLICATION_COUNTER_DDL,
+    ),
+)
+
+
+def missing_columns(connection: Connection) -> list[Counter]:
+    """
+    Get the counters whose column does not exist yet
+    :param connection: The synchronous connection of the migration
+    :type connection: Connection
+    :return: The counters to add
+    :rtype: list[Counter]
+    """
+    inspector: Inspector = inspect(connection)
+    missing: list[Counter] = []
+    for counter in COUNTERS:
+        columns: set[str] = {
+            column["name"]
+            for column in inspector.get_columns(counter.parent.name)
+        }
+        if counter.column not in columns:
+            missing.append(counter)
+    return missing
+
+
+async def install_counters(connection: AsyncConnection) -> None:
+    """
+    Add the counter columns that are missing and (re)create their
+     triggers
+    :param connection: The connection of the migration
+    :type connection: AsyncConnection
+    :return: None
+    :rtype: NoneType
+    """
+    for counter in await connection.run_sync(missing_columns):
+        await connection.execute(
+            text(
+                f"ALTER TABLE {counter.parent.name} ADD COLUMN"
+                f" {counter.column} INTEGER NOT NULL DEFAULT 0"
+            )
+        )
+        logger.info("Added the counter %s", counter.name)
+    for counter in COUNTERS:
+        for ddl in counter.ddl.get(connection.dialect.name, ()):
+            await connection.execute(ddl)
+    logger.info("Created the counter triggers if missing")
+
+
+async def reconcile_counters(
+    connection: AsyncConnection, check: bool = False
+) -> dict[str, int]:
+    """
+    Find the rows whose counter drifted and set them to the actual count
+    :param connection: The connection of the reconciliation
+    :type connection: AsyncConnection
+    :param check: Only report the drift, without repairing it
+    :type check: bool
+    :return: The number of drifted rows of every counter
+    :rtype: dict[str, int]
+    """
+    drift: dict[str, int] = {}
+    for counter in COUNTERS:
+        if check:
+            drifted: int | None = await connection.scalar(
+                select(func.count()).where(counter.drifted())
+            )
+            drift[counter.name] = drifted or 0
+            continue
+        result = await connection.execute(
+            update(counter.parent)
+            .where(counter.drifted())
+            .values({counter.column: counter.actual()})
+        )
+        drift[counter.name] = result.rowcount
+    return drift
+
+
+async def migrate_counters(check: bool = False) -> dict[str, int]:
+    """
+    Install the counters and reconcile them in one transaction
+    :param check: Only report the drift, without changing the database
+    :type check: bool
+    :return: The number of drifted rows of every counter
+    :rtype: dict[str, int]
+    """
+    async with async_engine.begin() as connection:
+        if not check:
+            await install_counters(connection)
+        drift: dict[str, int] = await reconcile_counters(connection, check)
+    for name, rows in drift.items():
+        logger.info(
+            "%s: %d rows %s", name, rows, "drifted" if check else "repaired"
+        )
+    return drift
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m app.db.counters",
+        description="Add and reconcile the denormalized counters.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="report the drifted rows and exit with 1 if there are any",
+    )
+    arguments: argparse.Namespace = parser.parse_args()
+    result: dict[str, int] = asyncio.run(migrate_counters(arguments.check))
+    sys.exit(1 if arguments.check and any(result.values()) else 0)
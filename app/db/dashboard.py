@@ -0,0 +1,446 @@
+"""
+A module for dashboard in the app.db package.
+The employer dashboard read model is refreshed from its change log: a
+ refresh takes the oldest logged changes, recomputes the read model rows
+ of the applications, jobs and employers they touch, from the changed
+ applications up to their jobs and employers, and drops the applied
+ changes in the same transaction. Refreshes are serialized, with an
+ advisory lock on PostgreSQL, so rows are always written in change order.
+The staleness of the read model is the age of its oldest pending change.
+To add the read model to an existing database and load it:
+    python -m app.db.dashboard
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional, Sequence
+
+from sqlalchemy import (
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.config.config import performance_setting
+from app.config.performance_settings import PerformanceSettings
+from app.db.base_class import Base
+from app.db.session import async_engine, get_session
+from app.models.application import Application
+from app.models.dashboard import (
+    DASHBOARD_CHANGE_DDL,
+    DASHBOARD_SOURCES,
+    DashboardApplicant,
+    DashboardChange,
+    DashboardEmployer,
+    DashboardJob,
+)
+from app.models.employer import Employer
+from app.models.job import Job
+from app.models.user import User
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+DASHBOARD_LOCK_ID: int = 4_808_001
+
+
+async def replace_rows(
+    session: AsyncSession,
+    model: type[Base],  # type: ignore
+    key: InstrumentedAttribute[int],
+    ids: Iterable[int],
+    rows: Sequence[dict[str, Any]],
+) -> None:
+    """
+    Replace the read model rows of some ids with their recomputed rows,
+     dropping the ids that no longer exist
+    :param session: The session of the refresh
+    :type session: AsyncSession
+    :param model: The read model class
+    :type model: type[Base]
+    :param key: The primary key of the read model
+    :type key: InstrumentedAttribute[int]
+    :param ids: The ids to replace
+    :type ids: Iterable[int]
+    :param rows: The recomputed rows of the ids that still exist
+    :type rows: Sequence[dict[str, Any]]
+    :return: None
+    :rtype: NoneType
+    """
+    await session.execute(delete(model).where(key.in_(list(ids))))
+    if rows:
+        await session.execute(insert(model), rows)
+
+
+async def apply_application_changes(
+    session: AsyncSession, application_ids: set[int]
+) -> set[int]:
+    """
+    Recompute the recent applicants of changed applications
+    :param session: The session of the refresh
+    :type session: AsyncSession
+    :param application_ids: The ids of the changed applications
+    :type application_ids: set[int]
+    :return: The ids of the jobs the applications were or are for
+    :rtype: set[int]
+    """
+    if not application_ids:
+        return set()
+    job_ids: set[int] = set(
+        await session.scalars(
+            select(DashboardApplicant.job_id).where(
+                DashboardApplicant.application_id.in_(application_ids)
+            )
+        )
+    )
+    rows: Sequence[Any] = (
+        (
+            await session.execute(
+                select(
+                    Application.id.label("application_id"),
+                    Job.employer_id,
+                    Application.job_id,
+                    Job.title.label("job_title"),
+                    Application.user_id,
+                    User.username,
+                )
+                .join(Job, Job.id == Application.job_id)
+                .join(User, User.id == Application.user_id)
+                .where(Application.id.in_(application_ids))
+            )
+        )
+        .mappings()
+        .all()
+    )
+    job_ids.update(row["job_id"] for row in rows)
+    await replace_rows(
+        session,
+        DashboardApplicant,
+        DashboardApplicant.application_id,
+        application_ids,
+        [dict(row) for row in rows],
+    )
+    return job_ids
+
+
+async def apply_job_changes(
+    session: AsyncSession, job_ids: set[int]
+) -> set[int]:
+    """
+    Recompute the applicant totals of changed jobs
+    :param session: The session of the refresh
+    :type session: AsyncSession
+    :param job_ids: The ids of the changed jobs
+    :type job_ids: set[int]
+    :return: The ids of the employers the jobs belonged or belong to
+    :rtype: set[int]
+    """
+    if not job_ids:
+        return set()
+    employer_ids: set[int] = set(
+        await session.scalars(
+            select(DashboardJob.employer_id).where(
+                DashboardJob.job_id.in_(job_ids)
+            )
+        )
+    )
+    rows: Sequence[Any] = (
+        (
+            await session.execute(
+                select(
+                    Job.id.label("job_id"),
+                    Job.employer_id,
+                    Job.title,
+                    Job.applications_count.label("applicants"),
+                ).where(Job.id.in_(job_ids))
+            )
+        )
+        .mappings()
+        .all()
+    )
+    employer_ids.update(row["employer_id"] for row in rows)
+    await replace_rows(
+        session,
+        DashboardJob,
+        DashboardJob.job_id,
+        job_ids,
+        [dict(row) for row in rows],
+    )
+    await session.execute(
+        update(DashboardApplicant)
+        .where(DashboardApplicant.job_id.in_(job_ids))
+        .values(
+            employer_id=select(Job.employer_id)
+            .where(Job.id == DashboardApplicant.job_id)
+            .scalar_subquery(),
+            job_title=select(Job.title)
+            .where(Job.id == DashboardApplicant.job_id)
+            .scalar_subquery(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return employer_ids
+
+
+async def apply_employer_changes(
+    session: AsyncSession, employer_ids: set[int]
+) -> None:
+    """
+    Recompute the totals of changed employers
+    :param session: The session of the refresh
+    :type session: AsyncSession
+    :param employer_ids: The ids of the changed employers
+    :type employer_ids: set[int]
+    :return: None
+    :rtype: NoneType
+    """
+    if not employer_ids:
+        return
+    applicants = (
+        select(func.coalesce(func.sum(Job.applications_count), 0))
+        .where(Job.employer_id == Employer.id)
+        .scalar_subquery()
+    )
+    rows: Sequence[Any] = (
+        (
+            await session.execute(
+                select(
+                    Employer.id.label("employer_id"),
+                    Employer.name,
+                    Employer.industry,
+                    Employer.jobs_count.label("jobs"),
+                    applicants.label("applicants"),
+                ).where(Employer.id.in_(employer_ids))
+            )
+        )
+        .mappings()
+        .all()
+    )
+    await replace_rows(
+        session,
+        DashboardEmployer,
+        DashboardEmployer.employer_id,
+        employer_ids,
+        [dict(row) for row in rows],
+    )
+
+
+async def refresh_dashboard(batch_size: int) -> int:
+    """
+    Apply a batch of the oldest pending changes to the read model
+    :param batch_size: The largest number of changes to apply
+    :type batch_size: int
+    :return: The number of changes applied
+    :rtype: int
+    """
+    async_session: AsyncSession = await get_session()
+    async with async_session as session, session.begin():
+        if async_engine.dialect.name == "postgresql":
+            await session.execute(
+                select(func.pg_advisory_xact_lock(DASHBOARD_LOCK_ID))
+            )
+        changes: Sequence[Any] = (
+            await session.execute(
+                select(
+                    DashboardChange.id,
+                    DashboardChange.entity,
+                    DashboardChange.entity_id,
+                )
+                .order_by(DashboardChange.id)
+                .limit(batch_size)
+            )
+        ).all()
+        if not changes:
+            return 0
+        changed: dict[str, set[int]] = {
+            table: set() for table in DASHBOARD_SOURCES
+        }
+        for _, entity, entity_id in changes:
+            changed[entity].add(entity_id)
+        changed["job"] |= await apply_application_changes(
+            session, changed["application"]
+        )
+        changed["employer"] |= await apply_job_changes(session, changed["job"])
+        await apply_employer_changes(session, changed["employer"])
+        await session.execute(
+            delete(DashboardChange).where(
+                DashboardChange.id.in_([change.id for change in changes])
+            )
+        )
+    return len(changes)
+
+
+async def dashboard_staleness() -> tuple[float, int]:
+    """
+    Get how far behind the writes the read model is
+    :return: The age in seconds of the oldest pending change, 0 if there
+     is none, and the number of pending changes
+    :rtype: tuple[float, int]
+    """
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        oldest: Optional[datetime]
+        pending: int
+        oldest, pending = (
+            await session.execute(
+                select(func.min(DashboardChange.changed_at), func.count())
+            )
+        ).one()
+    if oldest is None:
+        return 0.0, pending
+    if oldest.tzinfo is None:
+        oldest = oldest.replace(tzinfo=timezone.utc)
+    age: float = (datetime.now(timezone.utc) - oldest).total_seconds()
+    return max(age, 0.0), pending
+
+
+async def employer_pending(employer_id: int) -> bool:
+    """
+    Check whether an employer is missing from the read model only because
+     its logged changes are not applied yet
+    :param employer_id: The id of the employer
+    :type employer_id: int
+    :return: True if the employer has no read model row and has pending
+     changes
+    :rtype: bool
+    """
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        return bool(
+            await session.scalar(
+                select(
+                    select(DashboardChange.id)
+                    .where(
+                        DashboardChange.entity == "employer",
+                        DashboardChange.entity_id == employer_id,
+                    )
+                    .exists()
+                ).where(
+                    ~select(DashboardEmployer.employer_id)
+                    .where(DashboardEmployer.employer_id == employer_id)
+                    .exists()
+                )
+            )
+        )
+
+
+class DashboardRefresher:
+    """
+    Refreshes the employer dashboard read model on a background task
+     and on demand when it is too stale
+    """
+
+    def __init__(self, settings: PerformanceSettings):
+        self.settings: PerformanceSettings = settings
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """
+        Start the background task on the running event loop
+        :return: None
+        :rtype: NoneType
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the background task
+        :return: None
+        :rtype: NoneType
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """
+        Refresh the read model once per refresh interval
+        :return: None
+        :rtype: NoneType
+        """
+        while True:
+            await asyncio.sleep(
+                self.settings.DASHBOARD_REFRESH_INTERVAL_SECONDS
+            )
+            try:
+                await self.refresh()
+            except SQLAlchemyError as exc:
+                logger.error("Could not refresh the dashboard: %s", exc)
+
+    async def refresh(self) -> int:
+        """
+        Apply every pending change, one batch at a time
+        :return: The number of changes applied
+        :rtype: int
+        """
+        batch_size: int = self.settings.DASHBOARD_REFRESH_BATCH_SIZE
+        applied: int = 0
+        async with self._lock:
+            while True:
+                count: int = await refresh_dashboard(batch_size)
+                applied += count
+                if count < batch_size:
+                    return applied
+
+
+dashboard_refresher: DashboardRefresher = DashboardRefresher(
+    performance_setting
+)
+
+
+async def install_dashboard() -> None:
+    """
+    Add the read model tables and change log triggers to an existing
+     database and log every current row as changed, so the next refresh
+     loads them
+    :return: None
+    :rtype: NoneType
+    """
+    async with async_engine.begin() as connection:
+        for model in (
+            DashboardChange,
+            DashboardEmployer,
+            DashboardJob,
+            DashboardApplicant,
+        ):
+            await connection.run_sync(model.__table__.create, checkfirst=True)
+        for table, (source, _) in DASHBOARD_SOURCES.items():
+            for ddl in DASHBOARD_CHANGE_DDL[table].get(
+                connection.dialect.name, ()
+            ):
+                await connection.execute(ddl)
+            await connection.execute(
+                insert(DashboardChange).from_select(
+                    ["entity", "entity_id"],
+                    select(literal(table), source.id),
+                )
+            )
+            logger.info("Logged every %s as changed", table)
+
+
+async def load_dashboard() -> None:
+    """
+    Install the read model and apply the logged changes
+    :return: None
+    :rtype: NoneType
+    """
+    await install_dashboard()
+    applied: int = await dashboard_refresher.refresh()
+    logger.info("Applied %d dashboard changes", applied)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(load_dashboard())
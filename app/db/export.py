@@ -0,0 +1,75 @@
+"""
+A module for export in the app.db package.
+An export selects plain columns, never ORM entities, so no relationship
+ is loaded along with the rows, and reads them through a server-side
+ cursor one batch at a time. Only the batch being encoded is held in
+ memory, whatever the size of the table.
+"""
+
+from typing import Any, AsyncIterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_session
+from app.models.application import Application
+from app.models.employer import Employer
+from app.models.job import Job
+from app.models.user import User
+from app.schemas.infrastructure.export_dataset import ExportDataset
+from app.schemas.infrastructure.file_format import FileFormat
+from app.utils.file_utils.record_utils import encode_records
+
+EXPORTS: dict[ExportDataset, Select[Any]] = {
+    ExportDataset.APPLICATIONS: select(
+        Application.id,
+        Application.user_id,
+        User.username,
+        User.email,
+        Application.job_id,
+        Job.title.label("job_title"),
+        Job.employer_id,
+        Employer.name.label("employer_name"),
+    )
+    .join(User, User.id == Application.user_id)
+    .join(Job, Job.id == Application.job_id)
+    .join(Employer, Employer.id == Job.employer_id)
+    .order_by(Application.id),
+    ExportDataset.JOBS: select(
+        Job.id,
+        Job.title,
+        Job.description,
+        Job.employer_id,
+        Employer.name.label("employer_name"),
+        Job.applications_count,
+    )
+    .join(Employer, Employer.id == Job.employer_id)
+    .order_by(Job.id),
+}
+
+
+async def stream_export(
+    dataset: ExportDataset, file_format: FileFormat, batch_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Stream every row of a dataset as the lines of a file, one chunk per
+     batch of rows
+    :param dataset: The dataset to export
+    :type dataset: ExportDataset
+    :param file_format: The format of the file
+    :type file_format: FileFormat
+    :param batch_size: The number of rows fetched per batch
+    :type batch_size: int
+    :return: The chunks of the file
+    :rtype: AsyncIterator[bytes]
+    """
+    stmt: Select[Any] = EXPORTS[dataset].execution_options(yield_per=batch_size)
+    async_session: AsyncSession = await get_session()
+    async with async_session as session:
+        result = await session.stream(stmt)
+        columns: list[str] = list(result.keys())
+        header: bytes = encode_records([], columns, file_format, header=True)
+        if header:
+            yield header
+        async for batch in result.mappings().partitions():
+            yield encode_records(batch, columns, file_format)
@@ -0,0 +1,154 @@
+"""
+A module for indexes in the app.db package.
+The index plan follows the access paths of the resolvers: the joined
+ relationships filter job by employer_id and application by job_id or
+ user_id, the latter served by the leading column of the unique
+ (user_id, job_id) constraint. On PostgreSQL, job also gets the
+ generated search_vector column with its GIN index for job search.
+create_db_and_tables builds the plan on new databases; this migration
+ brings an existing database to it. Before the unique (user_id, job_id)
+ index is created, repeated applications are dropped, keeping the first
+ one. The migration also adds the version column that job and employer
+ updates check:
+    python -m app.db.indexes
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import CursorResult, Index, delete, func, inspect, select, text
+from sqlalchemy.engine import Connection, Inspector
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import async_engine
+from app.models import __all__ as tables
+from app.models.application import Application
+from app.models.job import JOB_SEARCH_DDL
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+REDUNDANT_INDEXES: tuple[str, ...] = (
+    "ix_users_id",
+    "ix_employer_id",
+    "ix_job_id",
+    "ix_application_id",
+)
+VERSIONED_TABLES: tuple[str, ...] = ("employer", "job")
+
+
+async def drop_redundant_indexes(connection: AsyncConnection) -> None:
+    """
+    Drop the unique indexes that duplicated the primary keys
+    :param connection: The connection of the migration
+    :type connection: AsyncConnection
+    :return: None
+    :rtype: NoneType
+    """
+    for name in REDUNDANT_INDEXES:
+        await connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        logger.info("Dropped index %s if present", name)
+
+
+def unversioned_tables(connection: Connection) -> list[str]:
+    """
+    Get the versioned tables whose version column does not exist yet
+    :param connection: The synchronous connection of the migration
+    :type connection: Connection
+    :return: The names of the tables to add the column to
+    :rtype: list[str]
+    """
+    inspector: Inspector = inspect(connection)
+    return [
+        table
+        for table in VERSIONED_TABLES
+        if "version"
+        not in {column["name"] for column in inspector.get_columns(table)}
+    ]
+
+
+async def add_version_columns(connection: AsyncConnection) -> None:
+    """
+    Add the optimistic concurrency version column where it is missing
+    :param connection: The connection of the migration
+    :type connection: AsyncConnection
+    :return: None
+    :rtype: NoneType
+    """
+    for table in await connection.run_sync(unversioned_tables):
+        await connection.execute(
+            text(
+                f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL"
+                " DEFAULT 1"
+            )
+        )
+        logger.info("Added the version column of %s", table)
+
+
+async def drop_duplicate_applications(connection: AsyncConnection) -> None:
+    """
+    Delete the repeated applications of a user to a job, keeping the
+     first one, so the unique (user_id, job_id) index can be created
+    :param connection: The connection of the migration
+    :type connection: AsyncConnection
+    :return: None
+    :rtype: NoneType
+    """
+    result: CursorResult[tuple[()]] = await connection.execute(
+        delete(Application).where(
+            Application.id.not_in(
+                select(func.min(Application.id)).group_by(
+                    Application.user_id, Application.job_id
+                )
+            )
+        )
+    )
+    logger.info("Deleted %d duplicate applications", result.rowcount)
+
+
+async def create_missing_indexes(connection: AsyncConnection) -> None:
+    """
+    Create the indexes of the models that do not exist yet
+    :param connection: The connection of the migration
+    :type connection: AsyncConnection
+    :return: None
+    :rtype: NoneType
+    """
+    for table in tables:
+        index: Index
+        for index in table.__table__.indexes:  # type: ignore
+            await connection.run_sync(index.create, checkfirst=True)
+            logger.info("Created index %s if missing", index.name)
+
+
+async def create_search_vector(connection: AsyncConnection) -> None:
+    """
+    Add the full-text search column and index of job on PostgreSQL
+    :param connection: The connection of the migration
+    :type connection: AsyncConnection
+    :return: None
+    :rtype: NoneType
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    for ddl in JOB_SEARCH_DDL:
+        await connection.execute(ddl)
+    logger.info("Created the job search vector if missing")
+
+
+async def migrate_indexes() -> None:
+    """
+    Apply the index plan to an existing database in one transaction
+    :return: None
+    :rtype: NoneType
+    """
+    async with async_engine.begin() as connection:
+        await drop_redundant_indexes(connection)
+        await add_version_columns(connection)
+        await drop_duplicate_applications(connection)
+        await create_missing_indexes(connection)
+        await create_search_vector(connection)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(migrate_indexes())
@@ -18,7 +18,7 @@ from sqlalchemy.exc import (
 from sqlalchemy.exc import TimeoutError as SATimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncTransaction
 
-from app.core.decorators import benchmark, with_logging
+from app.core.decorators import instrument
 from app.core.security.password import hash_password
 from app.db.base_class import Base
 from app.db.dummy_data import applications, employers, jobs, users
@@ -32,8 +32,7 @@ from app.models.user import User
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-@with_logging
-@benchmark
+@instrument
 async def create_db_and_tables() -> None:
     """
     Create the database and tables if they don't exist
@@ -84,8 +83,7 @@ async def bulk_insert(
         logger.error(f"Error inserting data into {model.__name__}: {exc}")
 
 
-@with_logging
-@benchmark
+@instrument
 async def init_db() -> None:
     """
     Initialize the database connection and create the necessary tables.
@@ -0,0 +1,55 @@
+"""
+A module for prefix indexes in the app.db package.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.prefix_index import (
+    EMPLOYER_NAME,
+    INDUSTRY,
+    JOB_TITLE,
+    prefix_indexes,
+)
+from app.db.session import get_session
+from app.models.employer import Employer
+from app.models.job import Job
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PREFIX_SOURCES: dict[
+    str, tuple[InstrumentedAttribute[int], InstrumentedAttribute[str]]
+] = {
+    JOB_TITLE: (Job.id, Job.title),
+    EMPLOYER_NAME: (Employer.id, Employer.name),
+    INDUSTRY: (Employer.id, Employer.industry),
+}
+
+_load_lock: asyncio.Lock = asyncio.Lock()
+
+
+async def load_prefix_indexes(reload: bool = False) -> None:
+    """
+    Load the prefix indexes of autocomplete from their columns
+    :param reload: Load the indexes that are already loaded too
+    :type reload: bool
+    :return: None
+    :rtype: NoneType
+    """
+    async with _load_lock:
+        async_session: AsyncSession = await get_session()
+        async with async_session as session:
+            for kind, (id_column, label_column) in PREFIX_SOURCES.items():
+                if prefix_indexes[kind].ready and not reload:
+                    continue
+                result = await session.execute(select(id_column, label_column))
+                prefix_indexes[kind].load(result.tuples())
+                logger.info(
+                    "Loaded %d %s prefixes",
+                    len(prefix_indexes[kind].keys),
+                    kind,
+                )
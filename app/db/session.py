@@ -3,8 +3,12 @@ Database session script
 """
 
 import logging
+from functools import partial
+from time import perf_counter_ns
 from typing import Any, AsyncGenerator, Optional
 
+from sqlalchemy import Connection, ExceptionContext, event
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -13,7 +17,11 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.config.config import sql_database_setting
-from app.core.decorators import benchmark, with_logging
+from app.core.deadline import check_deadline, get_remaining_time
+from app.core.decorators import instrument
+from app.core.metrics import metrics_registry
+from app.core.query_detector import detect_statement
+from app.core.tracing import record_statement
 
 logger: logging.Logger = logging.getLogger(__name__)
 url: str = sql_database_setting.SQLALCHEMY_DATABASE_URI.__str__()
@@ -22,6 +30,202 @@ async_engine: AsyncEngine = create_async_engine(
 )
 
 
+@event.listens_for(async_engine.sync_engine, "connect")
+def enable_sqlite_foreign_keys(
+    dbapi_connection: Any, connection_record: Any
+) -> None:
+    """
+    Enforce foreign keys on SQLite, which leaves them off by default
+    :param dbapi_connection: The new DBAPI connection
+    :type dbapi_connection: Any
+    :param connection_record: The pool record of the connection
+    :type connection_record: Any
+    :return: None
+    :rtype: NoneType
+    """
+    if async_engine.dialect.name != "sqlite":
+        return
+    cursor: Any = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@event.listens_for(async_engine.sync_engine, "begin")
+def apply_statement_timeout(connection: Connection) -> None:
+    """
+    Bound every statement of the transaction by the time left before
+     the deadline of the current operation
+    :param connection: The connection starting a transaction
+    :type connection: Connection
+    :return: None
+    :rtype: NoneType
+    """
+    remaining: Optional[float] = get_remaining_time()
+    if remaining is None or connection.dialect.name != "postgresql":
+        return
+    check_deadline()
+    connection.exec_driver_sql(
+        f"SET LOCAL statement_timeout = {max(int(remaining * 1000), 1)}"
+    )
+
+
+def statement_operation(statement: str) -> str:
+    """
+    Get the kind of a SQL statement for labelling its metrics
+    :param statement: The SQL statement
+    :type statement: str
+    :return: The leading keyword of the statement in upper case
+    :rtype: str
+    """
+    keyword: str = statement.lstrip().split(None, 1)[0] if statement else ""
+    return keyword.upper() or "UNKNOWN"
+
+
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def start_statement_timer(
+    connection: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    """
+    Remember when a statement was sent to the database
+    :param connection: The connection executing the statement
+    :type connection: Connection
+    :param cursor: The DBAPI cursor
+    :type cursor: DBAPICursor
+    :param statement: The SQL statement
+    :type statement: str
+    :param parameters: The statement parameters
+    :type parameters: Any
+    :param context: The execution context
+    :type context: Optional[ExecutionContext]
+    :param executemany: Whether the statement is an executemany
+    :type executemany: bool
+    :return: None
+    :rtype: NoneType
+    """
+    connection.info["statement_start_time"] = perf_counter_ns()
+
+
+@event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+def record_statement_duration(
+    connection: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    """
+    Record the count and duration of a statement by kind, and attach
+     it to the traced resolver that issued it
+    :param connection: The connection executing the statement
+    :type connection: Connection
+    :param cursor: The DBAPI cursor
+    :type cursor: DBAPICursor
+    :param statement: The SQL statement
+    :type statement: str
+    :param parameters: The statement parameters
+    :type parameters: Any
+    :param context: The execution context
+    :type context: Optional[ExecutionContext]
+    :param executemany: Whether the statement is an executemany
+    :type executemany: bool
+    :return: None
+    :rtype: NoneType
+    """
+    start_time: Optional[int] = connection.info.pop(
+        "statement_start_time", None
+    )
+    if start_time is None:
+        return
+    end_time: int = perf_counter_ns()
+    metrics_registry.histogram(
+        "db_statement_duration_seconds",
+        "Latency of SQL statements",
+        operation=statement_operation(statement),
+    ).record(end_time - start_time)
+    record_statement(statement, start_time, end_time)
+
+
+@event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+def detect_repeated_statement(
+    connection: Connection,
+    cursor: DBAPICursor,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    """
+    Count a statement towards the N+1 detection of the GraphQL request
+     that issued it
+    :param connection: The connection executing the statement
+    :type connection: Connection
+    :param cursor: The DBAPI cursor
+    :type cursor: DBAPICursor
+    :param statement: The SQL statement
+    :type statement: str
+    :param parameters: The statement parameters
+    :type parameters: Any
+    :param context: The execution context
+    :type context: Optional[ExecutionContext]
+    :param executemany: Whether the statement is an executemany
+    :type executemany: bool
+    :return: None
+    :rtype: NoneType
+    """
+    detect_statement(statement)
+
+
+@event.listens_for(async_engine.sync_engine, "handle_error")
+def count_statement_error(context: ExceptionContext) -> None:
+    """
+    Count the statements that failed
+    :param context: The context of the failed statement
+    :type context: ExceptionContext
+    :return: None
+    :rtype: NoneType
+    """
+    if context.connection is not None:
+        context.connection.info.pop("statement_start_time", None)
+    metrics_registry.counter(
+        "db_statement_errors_total",
+        "SQL statements that raised an error",
+        operation=statement_operation(context.statement or ""),
+    ).inc()
+
+
+def pool_gauge(attribute: str) -> float:
+    """
+    Read a figure of the connection pool, if the pool keeps it. The
+     overflow of a QueuePool counts down from minus its size while the
+     pool is not full, so values are clamped at 0
+    :param attribute: The name of the pool method
+    :type attribute: str
+    :return: The current value, 0 for pools without it
+    :rtype: float
+    """
+    method: Any = getattr(async_engine.pool, attribute, None)
+    return max(float(method()), 0.0) if callable(method) else 0.0
+
+
+for pool_attribute, pool_description in (
+    ("size", "Configured size of the connection pool"),
+    ("checkedout", "Connections currently checked out of the pool"),
+    ("checkedin", "Idle connections in the pool"),
+    ("overflow", "Connections opened beyond the pool size"),
+):
+    metrics_registry.gauge(
+        f"db_pool_{pool_attribute}",
+        pool_description,
+        partial(pool_gauge, pool_attribute),
+    )
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, Any]:
     """
     Get an asynchronous session to the database as a generator
@@ -40,8 +244,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, Any]:
         raise exc
 
 
-@with_logging
-@benchmark
+@instrument
 async def get_session() -> AsyncSession:
     """
     Get an asynchronous session to the database
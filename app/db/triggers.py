@@ -0,0 +1,129 @@
+"""
+A module for triggers in the app.db package.
+A counter column keeps the number of rows of a child table that point
+ at each parent row. Triggers on the child table adjust it in the same
+ transaction as every insert, delete or move of a child, whatever
+ statement issues it, so reading a count is reading a column.
+A change log gets the id of every row of a table that is inserted,
+ deleted or updated, in the transaction of the write, so a read model
+ can be refreshed from the rows that changed since it was last refreshed.
+"""
+
+from sqlalchemy import DDL
+
+
+def counter_trigger_ddl(
+    child: str, foreign_key: str, parent: str, counter: str
+) -> dict[str, tuple[DDL, ...]]:
+    """
+    Build the triggers that maintain a counter column, by dialect
+    :param child: The name of the child table
+    :type child: str
+    :param foreign_key: The column of the child pointing at the parent
+    :type foreign_key: str
+    :param parent: The name of the parent table
+    :type parent: str
+    :param counter: The counter column of the parent
+    :type counter: str
+    :return: The DDL statements of PostgreSQL and SQLite
+    :rtype: dict[str, tuple[DDL, ...]]
+    """
+    name: str = f"{child}_{counter}"
+    increment: str = (
+        f"UPDATE {parent} SET {counter} = {counter} + 1"
+        f" WHERE id = NEW.{foreign_key};"
+    )
+    decrement: str = (
+        f"UPDATE {parent} SET {counter} = {counter} - 1"
+        f" WHERE id = OLD.{foreign_key};"
+    )
+    return {
+        "postgresql": (
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE OR REPLACE FUNCTION {name}() RETURNS trigger"
+                " LANGUAGE plpgsql AS $$ BEGIN IF TG_OP = 'UPDATE' AND"
+                f" NEW.{foreign_key} IS NOT DISTINCT FROM OLD.{foreign_key}"
+                " THEN RETURN NULL; END IF;"
+                f" IF TG_OP <> 'DELETE' THEN {increment} END IF;"
+                f" IF TG_OP <> 'INSERT' THEN {decrement} END IF;"
+                " RETURN NULL; END $$"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"DROP TRIGGER IF EXISTS {name}_trigger ON {child}"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER {name}_trigger AFTER INSERT OR DELETE OR"
+                f" UPDATE OF {foreign_key} ON {child} FOR EACH ROW"
+                f" EXECUTE FUNCTION {name}()"
+            ),
+        ),
+        "sqlite": (
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT"
+                f" ON {child} BEGIN {increment} END"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE"
+                f" ON {child} BEGIN {decrement} END"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF"
+                f" {foreign_key} ON {child} WHEN OLD.{foreign_key} IS NOT"
+                f" NEW.{foreign_key} BEGIN {decrement} {increment} END"
+            ),
+        ),
+    }
+
+
+def change_log_trigger_ddl(
+    table: str, columns: tuple[str, ...], change_log: str
+) -> dict[str, tuple[DDL, ...]]:
+    """
+    Build the triggers that log the rows of a table that change, by
+     dialect
+    :param table: The name of the logged table
+    :type table: str
+    :param columns: The columns whose updates are logged
+    :type columns: tuple[str, ...]
+    :param change_log: The name of the change log table
+    :type change_log: str
+    :return: The DDL statements of PostgreSQL and SQLite
+    :rtype: dict[str, tuple[DDL, ...]]
+    """
+    name: str = f"{table}_{change_log}"
+    updated: str = ", ".join(columns)
+    insert: str = (
+        f"INSERT INTO {change_log} (entity, entity_id) VALUES ('{table}',"
+    )
+    return {
+        "postgresql": (
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE OR REPLACE FUNCTION {name}() RETURNS trigger"
+                " LANGUAGE plpgsql AS $$ BEGIN IF TG_OP = 'DELETE' THEN"
+                f" {insert} OLD.id); ELSE {insert} NEW.id); END IF;"
+                " RETURN NULL; END $$"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"DROP TRIGGER IF EXISTS {name}_trigger ON {table}"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER {name}_trigger AFTER INSERT OR DELETE OR"
+                f" UPDATE OF {updated} ON {table} FOR EACH ROW"
+                f" EXECUTE FUNCTION {name}()"
+            ),
+        ),
+        "sqlite": (
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT"
+                f" ON {table} BEGIN {insert} NEW.id); END"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE"
+                f" ON {table} BEGIN {insert} OLD.id); END"
+            ),
+            DDL(  # type: ignore[no-untyped-call]
+                f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF"
+                f" {updated} ON {table} BEGIN {insert} NEW.id); END"
+            ),
+        ),
+    }
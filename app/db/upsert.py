@@ -0,0 +1,24 @@
+"""
+A module for upsert in the app.db package.
+"""
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.db.base_class import Base
+from app.db.session import async_engine
+
+
+def conflict_insert(
+    model: type[Base],  # type: ignore
+) -> postgresql.Insert | sqlite.Insert:
+    """
+    Build an INSERT for the dialect of the engine, which supports the
+     ON CONFLICT clause on both PostgreSQL and SQLite
+    :param model: The model class
+    :type model: type[Base]
+    :return: The dialect specific INSERT statement
+    :rtype: postgresql.Insert | sqlite.Insert
+    """
+    if async_engine.dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
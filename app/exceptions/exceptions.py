@@ -5,6 +5,7 @@ This module defines custom exception classes for the Core Security
 from typing import Any, Optional
 
 from fastapi import HTTPException, status
+from graphql import GraphQLError
 from sqlalchemy.exc import SQLAlchemyError
 
 
@@ -52,6 +53,79 @@ class SecurityException(Exception):
             self.add_note(note)
 
 
+class ServiceUnavailableException(Exception):
+    """
+    Service Unavailable Exception class raised when a request is shed
+    """
+
+    def __init__(self, message: str, note: Optional[str] = None):
+        super().__init__(message)
+        if note:
+            self.add_note(note)
+
+
+class ImportConflictException(Exception):
+    """
+    Import Conflict Exception class raised when another run applied rows
+     of the same import
+    """
+
+    def __init__(self, message: str, note: Optional[str] = None):
+        super().__init__(message)
+        if note:
+            self.add_note(note)
+
+
+class RepeatedQueryError(Exception):
+    """
+    Repeated Query Exception class raised when an operation issues the
+     same statement shape repeatedly from a resolver path
+    """
+
+    def __init__(self, message: str, note: Optional[str] = None):
+        super().__init__(message)
+        if note:
+            self.add_note(note)
+
+
+class DeadlineExceededError(GraphQLError):
+    """
+    GraphQL error raised when an operation runs past its deadline
+    """
+
+    def __init__(self, message: str = "Operation deadline exceeded"):
+        super().__init__(message, extensions={"code": "DEADLINE_EXCEEDED"})
+
+
+class AlreadyExistsError(GraphQLError):
+    """
+    GraphQL error raised when a mutation would duplicate a unique row
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": "ALREADY_EXISTS"})
+
+
+class TooManyItemsError(GraphQLError):
+    """
+    GraphQL error raised when a bulk mutation receives more items than
+     allowed
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": "TOO_MANY_ITEMS"})
+
+
+class InvalidArgumentError(GraphQLError):
+    """
+    GraphQL error raised when an argument is well typed but unusable,
+     such as a malformed cursor
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message, extensions={"code": "BAD_USER_INPUT"})
+
+
 class UnauthorizedError(HTTPException):
     def __init__(self, detail: str, headers: dict[str, Any]):
         super().__init__(
@@ -0,0 +1,120 @@
+"""
+A module for admission control in the app.middlewares package.
+"""
+
+import logging
+from time import perf_counter
+from typing import Optional
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from graphql import GraphQLSchema, OperationType
+from starlette.middleware.base import (
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+from starlette.types import ASGIApp
+
+from app.core.concurrency import AdmissionController
+from app.exceptions.exceptions import ServiceUnavailableException
+from app.schemas.infrastructure.request_priority import RequestPriority
+from app.utils.graphql_utils import (
+    GraphQLOperation,
+    get_list_root_fields,
+    get_operation_from_body,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware for bounding the in-flight GraphQL operations and
+     shedding load with a fast 503 response when the queue overflows.
+    It wraps the GraphQL application only, so every POST it sees is a
+     GraphQL operation.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: AdmissionController,
+        schema: GraphQLSchema,
+        retry_after: int,
+    ):
+        super().__init__(app)
+        self.controller: AdmissionController = controller
+        self.retry_after: int = retry_after
+        self.list_fields: frozenset[str] = get_list_root_fields(schema)
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """
+        Dispatch the request once the admission controller grants a slot
+        :param request: The HTTP request to be dispatched
+        :type request: Request
+        :param call_next: The call_next middleware function
+        :type call_next: RequestResponseEndpoint
+        :return: The downstream response or a 503 if the request is shed
+        :rtype: Response
+        """
+        if request.method != "POST":
+            return await call_next(request)
+        priority: RequestPriority = self.classify(await request.body())
+        try:
+            await self.controller.acquire(priority)
+        except ServiceUnavailableException as exc:
+            logger.warning(
+                "Shedding %s request: %s", priority.name, exc.args[0]
+            )
+            return self.overloaded_response(exc.args[0])
+        start_time: float = perf_counter()
+        dropped: bool = True
+        try:
+            response: Response = await call_next(request)
+            dropped = (
+                response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+            return response
+        finally:
+            self.controller.release(perf_counter() - start_time, dropped)
+
+    def classify(self, body: bytes) -> RequestPriority:
+        """
+        Classify a request body into an admission priority
+        :param body: The raw request body
+        :type body: bytes
+        :return: The priority of the request
+        :rtype: RequestPriority
+        """
+        operation: Optional[GraphQLOperation] = get_operation_from_body(body)
+        if operation is None:
+            return RequestPriority.QUERY
+        if operation.operation_type == OperationType.MUTATION:
+            return RequestPriority.MUTATION
+        if operation.root_fields & self.list_fields:
+            return RequestPriority.LIST_QUERY
+        return RequestPriority.QUERY
+
+    def overloaded_response(self, message: str) -> JSONResponse:
+        """
+        Build the response returned to shed requests
+        :param message: The reason the request was shed
+        :type message: str
+        :return: A GraphQL shaped 503 response
+        :rtype: JSONResponse
+        """
+        return JSONResponse(
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": message,
+                        "extensions": {"code": "SERVICE_UNAVAILABLE"},
+                    }
+                ],
+            },
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(self.retry_after)},
+        )
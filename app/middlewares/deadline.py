@@ -0,0 +1,146 @@
+"""
+A module for deadline in the app.middlewares package.
+"""
+
+import asyncio
+import logging
+from contextvars import Token
+from typing import Optional
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.performance_settings import PerformanceSettings
+from app.core.deadline import reset_deadline, resolve_timeout, set_deadline
+from app.utils.graphql_utils import GraphQLOperation, get_operation_from_body
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+GRAPHQL_OPERATION_STATE: str = "graphql_operation"
+
+
+class DeadlineMiddleware:
+    """
+    Middleware that bounds every GraphQL request with a deadline.
+    It is a plain ASGI middleware so that an expired deadline cancels
+     the task running the resolvers instead of only the response wait.
+    It wraps the GraphQL application only, so the other routes keep their
+     body streamed and have no deadline.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        performance_settings: PerformanceSettings,
+    ):
+        self.app: ASGIApp = app
+        self.performance_settings: PerformanceSettings = performance_settings
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """
+        Run the request under the deadline resolved for its operation
+        :param scope: The ASGI connection scope
+        :type scope: Scope
+        :param receive: The ASGI receive channel
+        :type receive: Receive
+        :param send: The ASGI send channel
+        :type send: Send
+        :return: None
+        :rtype: NoneType
+        """
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        body: bytes = await self._read_body(receive)
+        operation: Optional[GraphQLOperation] = get_operation_from_body(body)
+        scope.setdefault("state", {})[GRAPHQL_OPERATION_STATE] = operation
+        timeout: float = resolve_timeout(
+            operation.name if operation else None,
+            Headers(scope=scope).get(
+                self.performance_settings.REQUEST_TIMEOUT_HEADER
+            ),
+            self.performance_settings,
+        )
+        response_started: bool = False
+        body_sent: bool = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {
+                    "type": "http.request",
+                    "body": body,
+                    "more_body": False,
+                }
+            return await receive()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        token: Token[Optional[float]] = set_deadline(timeout)
+        try:
+            async with asyncio.timeout(timeout):
+                await self.app(scope, replay_receive, send_wrapper)
+        except TimeoutError:
+            logger.warning(
+                "Operation %s exceeded its deadline of %s seconds",
+                operation.name if operation else None,
+                timeout,
+            )
+            if response_started:
+                raise
+            await self.timeout_response(timeout)(scope, replay_receive, send)
+        finally:
+            reset_deadline(token)
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        """
+        Buffer the request body so it can be inspected and replayed
+        :param receive: The ASGI receive channel
+        :type receive: Receive
+        :return: The complete request body
+        :rtype: bytes
+        """
+        chunks: list[bytes] = []
+        more_body: bool = True
+        while more_body:
+            message: Message = await receive()
+            if message["type"] != "http.request":
+                break
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        return b"".join(chunks)
+
+    @staticmethod
+    def timeout_response(timeout: float) -> JSONResponse:
+        """
+        Build the response returned when the deadline expires
+        :param timeout: The deadline that was exceeded, in seconds
+        :type timeout: float
+        :return: A GraphQL shaped 504 response
+        :rtype: JSONResponse
+        """
+        return JSONResponse(
+            {
+                "data": None,
+                "errors": [
+                    {
+                        "message": "Operation deadline exceeded",
+                        "extensions": {
+                            "code": "DEADLINE_EXCEEDED",
+                            "timeout": timeout,
+                        },
+                    }
+                ],
+            },
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        )
@@ -0,0 +1,100 @@
+"""
+A module for metrics in the app.middlewares package.
+"""
+
+from time import perf_counter_ns
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.performance_settings import PerformanceSettings
+from app.core.metrics import metrics_registry
+from app.middlewares.deadline import GRAPHQL_OPERATION_STATE
+from app.utils.graphql_utils import GraphQLOperation
+
+HTTP_DURATION_METRIC: str = "http_request_duration_seconds"
+OPERATION_DURATION_METRIC: str = "graphql_operation_duration_seconds"
+ANONYMOUS_OPERATION: str = "anonymous"
+OTHER_OPERATION: str = "other"
+
+
+class MetricsMiddleware:
+    """
+    Middleware that records the latency of every HTTP request and, for
+     GraphQL requests, of the operation by name and type.
+    It must wrap DeadlineMiddleware, which publishes the parsed
+     operation into the request state.
+    """
+
+    def __init__(self, app: ASGIApp, performance_settings: PerformanceSettings):
+        self.app: ASGIApp = app
+        self.max_operation_names: int = (
+            performance_settings.METRICS_MAX_OPERATION_NAMES
+        )
+        self.operation_names: set[str] = set()
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """
+        Run the request and record how long it took
+        :param scope: The ASGI connection scope
+        :type scope: Scope
+        :param receive: The ASGI receive channel
+        :type receive: Receive
+        :param send: The ASGI send channel
+        :type send: Send
+        :return: None
+        :rtype: NoneType
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status_code: int = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start_time: int = perf_counter_ns()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed: int = perf_counter_ns() - start_time
+            metrics_registry.histogram(
+                HTTP_DURATION_METRIC,
+                "Latency of HTTP requests",
+                method=scope["method"],
+                status=str(status_code),
+            ).record(elapsed)
+            state: dict[str, Any] = scope.get("state", {})
+            operation: Optional[GraphQLOperation] = state.get(
+                GRAPHQL_OPERATION_STATE
+            )
+            if operation is not None:
+                metrics_registry.histogram(
+                    OPERATION_DURATION_METRIC,
+                    "Latency of GraphQL operations",
+                    operation=self.operation_label(operation.name),
+                    type=operation.operation_type.value,
+                ).record(elapsed)
+
+    def operation_label(self, name: Optional[str]) -> str:
+        """
+        Get the label of an operation, bounding the number of distinct
+         names since they are chosen by the clients
+        :param name: The name of the operation
+        :type name: Optional[str]
+        :return: The label to record the operation under
+        :rtype: str
+        """
+        if not name:
+            return ANONYMOUS_OPERATION
+        if name in self.operation_names:
+            return name
+        if len(self.operation_names) >= self.max_operation_names:
+            return OTHER_OPERATION
+        self.operation_names.add(name)
+        return name
@@ -4,7 +4,14 @@ Package app-models initialization.
 
 from ..db.base_class import Base
 from .application import Application
+from .dashboard import (
+    DashboardApplicant,
+    DashboardChange,
+    DashboardEmployer,
+    DashboardJob,
+)
 from .employer import Employer
+from .import_checkpoint import ImportCheckpoint
 from .job import Job
 from .user import User
 
@@ -14,4 +21,9 @@ __all__: list[Base] = [  # type: ignore
     Job,
     User,
     Application,
+    DashboardChange,
+    DashboardEmployer,
+    DashboardJob,
+    DashboardApplicant,
+    ImportCheckpoint,
 ]
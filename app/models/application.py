@@ -3,11 +3,11 @@ A module for application in the app-models package.
 """
 
 from pydantic import PositiveInt
-from sqlalchemy import ForeignKey
-from sqlalchemy.dialects.postgresql import INTEGER
+from sqlalchemy import DDL, ForeignKey, Index, Integer, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.triggers import counter_trigger_ddl
 from app.models.job import Job
 from app.models.user import User
 
@@ -20,15 +20,13 @@ class Application(Base):  # type: ignore
     __tablename__ = "application"
 
     id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         nullable=False,
         primary_key=True,
-        index=True,
-        unique=True,
         comment="ID of the Application",
     )
     user_id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         ForeignKey(
             "users.id",
             name="users_id_fkey",
@@ -37,7 +35,7 @@ class Application(Base):  # type: ignore
         comment="ID of the User",
     )
     job_id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         ForeignKey(
             "job.id",
             name="job_id_fkey",
@@ -51,3 +49,22 @@ class Application(Base):  # type: ignore
     job: Mapped["Job"] = relationship(
         "Job", back_populates="applications", lazy="joined"
     )
+
+    __table_args__ = (
+        Index(
+            "application_user_id_job_id_key", "user_id", "job_id", unique=True
+        ),
+        Index("application_job_id_idx", "job_id"),
+    )
+
+
+APPLICATION_COUNTER_DDL: dict[str, tuple[DDL, ...]] = counter_trigger_ddl(
+    "application", "job_id", "job", "applications_count"
+)
+for dialect, counter_ddls in APPLICATION_COUNTER_DDL.items():
+    for counter_ddl in counter_ddls:
+        event.listen(
+            Application.__table__,
+            "after_create",
+            counter_ddl.execute_if(dialect=dialect),
+        )
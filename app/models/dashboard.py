@@ -0,0 +1,215 @@
+"""
+A module for dashboard in the app-models package.
+These tables are the read model of the employer dashboard. They are not
+ written by the mutations: triggers log the employers, jobs and
+ applications that change into dashboard_change, and the dashboard
+ refresher applies the logged changes to the other tables.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import PositiveInt
+from sqlalchemy import (
+    DDL,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    event,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.config import sql_database_setting
+from app.db.base_class import Base
+from app.db.triggers import change_log_trigger_ddl
+from app.models.application import Application
+from app.models.employer import Employer
+from app.models.job import Job
+
+
+class DashboardChange(Base):  # type: ignore
+    """
+    Change log model class representing the "dashboard_change" table
+    """
+
+    __tablename__ = "dashboard_change"
+
+    id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        primary_key=True,
+        comment="ID of the change, in the order of the writes",
+    )
+    entity: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        comment="Table of the changed row",
+    )
+    entity_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID of the changed row",
+    )
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True).with_variant(
+            TIMESTAMP(
+                timezone=True,
+                precision=sql_database_setting.TIMESTAMP_PRECISION,
+            ),
+            "postgresql",
+        ),
+        nullable=False,
+        server_default=func.now(),
+        comment="Time the row changed",
+    )
+
+
+class DashboardEmployer(Base):  # type: ignore
+    """
+    Read model class representing the "dashboard_employer" table
+    """
+
+    __tablename__ = "dashboard_employer"
+
+    employer_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        primary_key=True,
+        autoincrement=False,
+        comment="ID of the employer",
+    )
+    name: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        comment="Name of the employer",
+    )
+    industry: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Industry of the employer",
+    )
+    jobs: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of jobs of the employer",
+    )
+    applicants: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of applications to the jobs of the employer",
+    )
+
+    __table_args__ = (
+        Index(
+            "dashboard_employer_industry_applicants_idx",
+            "industry",
+            "applicants",
+        ),
+    )
+
+
+class DashboardJob(Base):  # type: ignore
+    """
+    Read model class representing the "dashboard_job" table
+    """
+
+    __tablename__ = "dashboard_job"
+
+    job_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        primary_key=True,
+        autoincrement=False,
+        comment="ID of the job",
+    )
+    employer_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID of the employer of the job",
+    )
+    title: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Title of the job",
+    )
+    applicants: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of applications to the job",
+    )
+
+    __table_args__ = (
+        Index("dashboard_job_employer_id_idx", "employer_id", "applicants"),
+    )
+
+
+class DashboardApplicant(Base):  # type: ignore
+    """
+    Read model class representing the "dashboard_applicant" table
+    """
+
+    __tablename__ = "dashboard_applicant"
+
+    application_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        primary_key=True,
+        autoincrement=False,
+        comment="ID of the application",
+    )
+    employer_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID of the employer of the job",
+    )
+    job_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID of the job",
+    )
+    job_title: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment="Title of the job",
+    )
+    user_id: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="ID of the applicant",
+    )
+    username: Mapped[str] = mapped_column(
+        String(15),
+        nullable=False,
+        comment="Username of the applicant",
+    )
+
+    __table_args__ = (
+        Index(
+            "dashboard_applicant_employer_id_idx",
+            "employer_id",
+            "application_id",
+        ),
+        Index("dashboard_applicant_job_id_idx", "job_id"),
+    )
+
+
+DASHBOARD_SOURCES: dict[str, tuple[Any, tuple[str, ...]]] = {
+    "employer": (Employer, ("name", "industry")),
+    "job": (Job, ("title", "employer_id")),
+    "application": (Application, ("job_id", "user_id")),
+}
+DASHBOARD_CHANGE_DDL: dict[str, dict[str, tuple[DDL, ...]]] = {
+    table: change_log_trigger_ddl(table, columns, DashboardChange.__tablename__)
+    for table, (_, columns) in DASHBOARD_SOURCES.items()
+}
+for table, (source, _) in DASHBOARD_SOURCES.items():
+    for dialect, change_ddls in DASHBOARD_CHANGE_DDL[table].items():
+        for change_ddl in change_ddls:
+            event.listen(
+                source.__table__,
+                "after_create",
+                change_ddl.execute_if(dialect=dialect),
+            )
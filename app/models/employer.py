@@ -5,8 +5,7 @@ A module for employer in the app-models package.
 from typing import TYPE_CHECKING
 
 from pydantic import EmailStr, PositiveInt
-from sqlalchemy import CheckConstraint
-from sqlalchemy.dialects.postgresql import INTEGER, VARCHAR
+from sqlalchemy import CheckConstraint, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config.config import sql_database_setting
@@ -24,44 +23,59 @@ class Employer(Base):  # type: ignore
     __tablename__ = "employer"
 
     id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         nullable=False,
         primary_key=True,
-        index=True,
-        unique=True,
         comment="ID of the employer",
     )
     name: Mapped[str] = mapped_column(
-        VARCHAR(200),
+        String(200),
         nullable=False,
         comment="Name to identify the employer",
     )
     contact_email: Mapped[EmailStr] = mapped_column(
-        VARCHAR(320),
+        String(320),
         nullable=False,
         index=True,
         unique=True,
         comment="Preferred e-mail address of the employer",
     )
     industry: Mapped[str] = mapped_column(
-        VARCHAR(100),
+        String(100),
         nullable=False,
         comment="Industry from the employer works",
     )
+    version: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("1"),
+        comment="Version of the employer for optimistic concurrency",
+    )
+    jobs_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        comment="Number of jobs of the employer, kept by triggers",
+    )
     jobs: Mapped[list["Job"]] = relationship(
         "Job",
         back_populates="employer",
         lazy="joined",
     )
 
+    __mapper_args__ = {"version_id_col": version}
     __table_args__ = (
-        CheckConstraint("char_length(name) >= 4", name="employer_name_length"),
+        CheckConstraint("LENGTH(name) >= 4", name="employer_name_length"),
         CheckConstraint(
-            "char_length(contact_email) >= 3",
+            "LENGTH(contact_email) >= 3",
             name="employer_contact_email_length",
         ),
         CheckConstraint(
             sql_database_setting.DB_EMAIL_CONSTRAINT,
             name="employer_email_format",
-        ),
+        ).ddl_if(dialect="postgresql"),
+        CheckConstraint(
+            sql_database_setting.DB_EMAIL_CONSTRAINT_SQLITE,
+            name="employer_email_format",
+        ).ddl_if(dialect="sqlite"),
     )
@@ -0,0 +1,63 @@
+"""
+A module for import checkpoint in the app-models package.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.config.config import sql_database_setting
+from app.db.base_class import Base
+
+
+class ImportCheckpoint(Base):  # type: ignore
+    """
+    Checkpoint model class representing the "import_checkpoint" table.
+    It is written in the transaction of every imported batch, so it
+     always counts the rows of the file that are already applied.
+    """
+
+    __tablename__ = "import_checkpoint"
+
+    dataset: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        primary_key=True,
+        comment="Dataset the file is imported into",
+    )
+    name: Mapped[str] = mapped_column(
+        String(200),
+        nullable=False,
+        primary_key=True,
+        comment="Name identifying the imported file",
+    )
+    rows: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of rows of the file already applied",
+    )
+    imported: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of applied rows that were inserted",
+    )
+    failed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Number of applied rows that were rejected",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True).with_variant(
+            TIMESTAMP(
+                timezone=True,
+                precision=sql_database_setting.TIMESTAMP_PRECISION,
+            ),
+            "postgresql",
+        ),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Time the last batch was applied",
+    )
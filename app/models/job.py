@@ -5,11 +5,20 @@ A module for job in the app-models package.
 from typing import TYPE_CHECKING
 
 from pydantic import PositiveInt
-from sqlalchemy import CheckConstraint, ForeignKey
-from sqlalchemy.dialects.postgresql import INTEGER, VARCHAR
+from sqlalchemy import (
+    DDL,
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    event,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
+from app.db.triggers import counter_trigger_ddl
 
 if TYPE_CHECKING:
     from app.models.application import Application
@@ -24,25 +33,23 @@ class Job(Base):  # type: ignore
     __tablename__ = "job"
 
     id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         nullable=False,
         primary_key=True,
-        index=True,
-        unique=True,
         comment="ID of the Job",
     )
     title: Mapped[str] = mapped_column(
-        VARCHAR(100),
+        String(100),
         nullable=False,
         comment="Title to identify the job",
     )
     description: Mapped[str] = mapped_column(
-        VARCHAR(320),
+        String(320),
         nullable=False,
         comment="Description to identify the job",
     )
     employer_id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         ForeignKey(
             "employer.id",
             name="job_employer_id_fkey",
@@ -50,6 +57,18 @@ class Job(Base):  # type: ignore
         nullable=False,
         comment="ID of the Employer related with the job",
     )
+    version: Mapped[PositiveInt] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("1"),
+        comment="Version of the Job for optimistic concurrency",
+    )
+    applications_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=text("0"),
+        comment="Number of applications to the job, kept by triggers",
+    )
     employer: Mapped["Employer"] = relationship(
         "Employer",
         back_populates="jobs",
@@ -59,10 +78,43 @@ class Job(Base):  # type: ignore
         "Application", back_populates="job", lazy="joined"
     )
 
+    __mapper_args__ = {"version_id_col": version}
     __table_args__ = (
-        CheckConstraint("char_length(title) >= 4", name="job_title_length"),
+        CheckConstraint("LENGTH(title) >= 4", name="job_title_length"),
         CheckConstraint(
-            "char_length(description) >= 5",
+            "LENGTH(description) >= 5",
             name="job_description_length",
         ),
+        Index("job_employer_id_idx", "employer_id"),
     )
+
+
+SEARCH_CONFIGURATION: str = "english"
+JOB_SEARCH_DDL: tuple[DDL, ...] = (
+    DDL(  # type: ignore[no-untyped-call]
+        "ALTER TABLE job ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        f" GENERATED ALWAYS AS (to_tsvector('{SEARCH_CONFIGURATION}',"
+        " title || ' ' || description)) STORED"
+    ),
+    DDL(  # type: ignore[no-untyped-call]
+        "CREATE INDEX IF NOT EXISTS job_search_vector_idx ON job"
+        " USING GIN (search_vector)"
+    ),
+)
+for search_ddl in JOB_SEARCH_DDL:
+    event.listen(
+        Job.__table__,
+        "after_create",
+        search_ddl.execute_if(dialect="postgresql"),
+    )
+
+JOB_COUNTER_DDL: dict[str, tuple[DDL, ...]] = counter_trigger_ddl(
+    "job", "employer_id", "employer", "jobs_count"
+)
+for dialect, counter_ddls in JOB_COUNTER_DDL.items():
+    for counter_ddl in counter_ddls:
+        event.listen(
+            Job.__table__,
+            "after_create",
+            counter_ddl.execute_if(dialect=dialect),
+        )
@@ -6,8 +6,15 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 from pydantic import EmailStr, PositiveInt
-from sqlalchemy import CheckConstraint, text
-from sqlalchemy.dialects.postgresql import INTEGER, TIMESTAMP, VARCHAR
+from sqlalchemy import (
+    CheckConstraint,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.config.config import sql_database_setting
@@ -25,48 +32,54 @@ class User(Base):  # type: ignore
     __tablename__ = "users"
 
     id: Mapped[PositiveInt] = mapped_column(
-        INTEGER,
+        Integer,
         nullable=False,
         primary_key=True,
-        index=True,
-        unique=True,
         comment="ID of the User",
     )
     username: Mapped[str] = mapped_column(
-        VARCHAR(15),
+        String(15),
         index=True,
         unique=True,
         nullable=False,
         comment="Username to identify the user",
     )
     email: Mapped[EmailStr] = mapped_column(
-        VARCHAR(320),
+        String(320),
         index=True,
         unique=True,
         nullable=False,
         comment="Preferred e-mail address of the User",
     )
     hashed_password: Mapped[str] = mapped_column(
-        VARCHAR(97), nullable=False, comment="Hashed password of the User"
+        String(97), nullable=False, comment="Hashed password of the User"
     )
     role: Mapped[str] = mapped_column(
-        VARCHAR(50), nullable=False, comment="Role of the User"
+        String(50), nullable=False, comment="Role of the User"
     )
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(
-            timezone=True, precision=sql_database_setting.TIMESTAMP_PRECISION
+        DateTime(timezone=True).with_variant(
+            TIMESTAMP(
+                timezone=True,
+                precision=sql_database_setting.TIMESTAMP_PRECISION,
+            ),
+            "postgresql",
         ),
         default=datetime.now(),
         nullable=False,
-        server_default=text("now()"),
+        server_default=func.now(),
         comment="Time the User was created",
     )
     updated_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(
-            timezone=True, precision=sql_database_setting.TIMESTAMP_PRECISION
+        DateTime(timezone=True).with_variant(
+            TIMESTAMP(
+                timezone=True,
+                precision=sql_database_setting.TIMESTAMP_PRECISION,
+            ),
+            "postgresql",
         ),
         nullable=True,
-        onupdate=text("now()"),
+        onupdate=func.now(),
         comment="Time the User was updated",
     )
     applications: Mapped[list["Application"]] = relationship(
@@ -75,17 +88,23 @@ class User(Base):  # type: ignore
 
     __table_args__ = (
         CheckConstraint(
-            "char_length(username) >= 4",
+            "LENGTH(username) >= 4",
             name="users_username_length",
         ),
         CheckConstraint(
-            "char_length(email) >= 3",
+            "LENGTH(email) >= 3",
             name="users_email_length",
         ),
         CheckConstraint(
             sql_database_setting.DB_EMAIL_CONSTRAINT[8:],
             name="users_email_format",
-        ),
+        ).ddl_if(dialect="postgresql"),
+        CheckConstraint(
+            sql_database_setting.DB_EMAIL_CONSTRAINT_SQLITE.replace(
+                "contact_email", "email"
+            ),
+            name="users_email_format",
+        ).ddl_if(dialect="sqlite"),
         CheckConstraint(
             "LENGTH(hashed_password) = 97",
             name="users_hashed_password_length",
@@ -93,9 +112,10 @@ class User(Base):  # type: ignore
         CheckConstraint(
             "created_at <= CURRENT_TIMESTAMP",
             name="users_created_at_check",
-        ),
+        ).ddl_if(dialect="postgresql"),
         CheckConstraint(
             "updated_at IS NULL OR" " updated_at <= CURRENT_TIMESTAMP",
             name="users_updated_at_check",
-        ),
+        ).ddl_if(dialect="postgresql"),
+        Index("users_created_at_idx", "created_at"),
     )
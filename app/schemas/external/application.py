@@ -0,0 +1,24 @@
+"""
+A module for application in the app.schemas.external package.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+
+from app.schemas.schemas import application_create_example
+
+
+class ApplicationCreate(BaseModel):
+    """
+    Schema for a User applying to a Job.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra=application_create_example,
+    )
+
+    user_id: PositiveInt = Field(
+        ..., title="User ID", description="ID of the User"
+    )
+    job_id: PositiveInt = Field(
+        ..., title="Job ID", description="ID of the Job"
+    )
@@ -0,0 +1,60 @@
+"""
+A module for bulk import in the app.schemas.external package.
+"""
+
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+
+from app.schemas.infrastructure.import_dataset import ImportDataset
+
+
+class ImportRowError(BaseModel):
+    """
+    Schema for a row of an imported file that was rejected.
+    """
+
+    row: PositiveInt = Field(
+        ...,
+        title="Row",
+        description="Number of the record in the file, from 1",
+    )
+    message: str = Field(
+        ..., title="Message", description="Why the row was rejected"
+    )
+
+
+class ImportReport(BaseModel):
+    """
+    Schema for the outcome of an import, counting the rows applied by
+     earlier runs under the same name.
+    """
+
+    dataset: ImportDataset = Field(
+        ..., title="Dataset", description="Dataset the file was imported into"
+    )
+    name: str = Field(
+        ..., title="Name", description="Name identifying the imported file"
+    )
+    resumed_from: NonNegativeInt = Field(
+        ...,
+        title="Resumed from",
+        description="Number of rows already applied when this run started",
+    )
+    rows: NonNegativeInt = Field(
+        ..., title="Rows", description="Number of rows of the file applied"
+    )
+    imported: NonNegativeInt = Field(
+        ..., title="Imported", description="Number of rows inserted"
+    )
+    failed: NonNegativeInt = Field(
+        ..., title="Failed", description="Number of rows rejected"
+    )
+    errors: list[ImportRowError] = Field(
+        default_factory=list,
+        title="Errors",
+        description="Rows rejected by this run, up to the reported limit",
+    )
+    errors_truncated: bool = Field(
+        default=False,
+        title="Errors truncated",
+        description="Whether this run rejected more rows than reported",
+    )
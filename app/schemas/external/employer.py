@@ -0,0 +1,39 @@
+"""
+A module for employer in the app.schemas.external package.
+"""
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.schemas.schemas import employer_create_example
+
+
+class EmployerCreate(BaseModel):
+    """
+    Schema for creating an Employer, with the limits of its table
+     constraints.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra=employer_create_example,
+    )
+
+    name: str = Field(
+        ...,
+        title="Name",
+        description="Name to identify the employer",
+        min_length=4,
+        max_length=200,
+    )
+    contact_email: EmailStr = Field(
+        ...,
+        title="Contact email",
+        description="Preferred e-mail address of the employer",
+        max_length=320,
+    )
+    industry: str = Field(
+        ...,
+        title="Industry",
+        description="Industry from the employer works",
+        min_length=1,
+        max_length=100,
+    )
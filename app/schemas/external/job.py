@@ -0,0 +1,75 @@
+"""
+A module for job in the app.schemas.external package.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+
+from app.schemas.schemas import job_create_example, job_update_example
+
+
+class JobCreate(BaseModel):
+    """
+    Schema for creating a Job, with the limits of its table constraints.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra=job_create_example,
+    )
+
+    title: str = Field(
+        ...,
+        title="Title",
+        description="Title to identify the job",
+        min_length=4,
+        max_length=100,
+    )
+    description: str = Field(
+        ...,
+        title="Description",
+        description="Description to identify the job",
+        min_length=5,
+        max_length=320,
+    )
+    employer_id: PositiveInt = Field(
+        ...,
+        title="Employer ID",
+        description="ID of the Employer related with the job",
+    )
+
+
+class JobUpdate(BaseModel):
+    """
+    Schema for updating a Job, optionally at an expected version.
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra=job_update_example,
+    )
+
+    id: PositiveInt = Field(..., title="ID", description="ID of the Job")
+    title: Optional[str] = Field(
+        default=None,
+        title="Title",
+        description="Title to identify the job",
+        min_length=4,
+        max_length=100,
+    )
+    description: Optional[str] = Field(
+        default=None,
+        title="Description",
+        description="Description to identify the job",
+        min_length=5,
+        max_length=320,
+    )
+    employer_id: Optional[PositiveInt] = Field(
+        default=None,
+        title="Employer ID",
+        description="ID of the Employer related with the job",
+    )
+    expected_version: Optional[PositiveInt] = Field(
+        default=None,
+        title="Expected version",
+        description="Version the Job must have for the update to apply",
+    )
@@ -0,0 +1,15 @@
+"""
+A module for export dataset in the app.schemas.infrastructure package.
+"""
+
+from enum import UNIQUE, StrEnum, auto, verify
+
+
+@verify(UNIQUE)
+class ExportDataset(StrEnum):
+    """
+    Enum representing the tables that admins can export
+    """
+
+    APPLICATIONS = auto()
+    JOBS = auto()
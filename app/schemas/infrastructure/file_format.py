@@ -0,0 +1,15 @@
+"""
+A module for file format in the app.schemas.infrastructure package.
+"""
+
+from enum import UNIQUE, StrEnum, auto, verify
+
+
+@verify(UNIQUE)
+class FileFormat(StrEnum):
+    """
+    Enum representing the formats of the exported and imported files
+    """
+
+    NDJSON = auto()
+    CSV = auto()
@@ -0,0 +1,15 @@
+"""
+A module for import dataset in the app.schemas.infrastructure package.
+"""
+
+from enum import UNIQUE, StrEnum, auto, verify
+
+
+@verify(UNIQUE)
+class ImportDataset(StrEnum):
+    """
+    Enum representing the tables that admins can import files into
+    """
+
+    EMPLOYERS = auto()
+    JOBS = auto()
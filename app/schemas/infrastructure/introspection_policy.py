@@ -0,0 +1,17 @@
+"""
+A module for introspection policy in the app.schemas.infrastructure
+ package.
+"""
+
+from enum import UNIQUE, StrEnum, auto, verify
+
+
+@verify(UNIQUE)
+class IntrospectionPolicy(StrEnum):
+    """
+    Enum representing who may introspect the GraphQL schema
+    """
+
+    ENABLED = auto()
+    ADMIN = auto()
+    DISABLED = auto()
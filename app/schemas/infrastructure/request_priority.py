@@ -0,0 +1,17 @@
+"""
+A module for request priority in the app.schemas.infrastructure package.
+"""
+
+from enum import UNIQUE, IntEnum, auto, verify
+
+
+@verify(UNIQUE)
+class RequestPriority(IntEnum):
+    """
+    Enum representing the admission priority of a GraphQL request.
+    Lower values are admitted first.
+    """
+
+    MUTATION = auto()
+    QUERY = auto()
+    LIST_QUERY = auto()
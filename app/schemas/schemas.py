@@ -45,6 +45,34 @@ user_base_auth_example: JsonDict = {
     }
 }
 
+job_create_example: JsonDict = {
+    "example": {
+        "title": "Backend Developer",
+        "description": "Build and maintain the GraphQL API",
+        "employer_id": 1,
+    }
+}
+job_update_example: JsonDict = {
+    "example": {
+        "id": 1,
+        "title": "Senior Backend Developer",
+        "expected_version": 1,
+    }
+}
+employer_create_example: JsonDict = {
+    "example": {
+        "name": "Example Corp",
+        "contact_email": "jobs@example.com",
+        "industry": "Technology",
+    }
+}
+application_create_example: JsonDict = {
+    "example": {
+        "user_id": 1,
+        "job_id": 1,
+    }
+}
+
 
 def merge_examples(*examples: Any) -> JsonDict:
     """
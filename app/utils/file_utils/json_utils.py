@@ -4,31 +4,89 @@ A module for json utils in the app.utils.files utils package.
 
 import json
 import logging
-from typing import Any
+import os
+from typing import Any, NamedTuple, Optional
 
 import aiofiles
+import aiofiles.os
 from fastapi import Depends
 
 from app.config.config import get_init_settings
 from app.config.init_settings import InitSettings
-from app.core.decorators import benchmark, with_logging
+from app.core.decorators import instrument
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
-@with_logging
-@benchmark
+class CachedJSONFile(NamedTuple):
+    """
+    Parsed content of a JSON file with the stat it was read at
+    """
+
+    mtime_ns: int
+    size: int
+    data: dict[str, Any]
+
+
+_json_cache: dict[str, CachedJSONFile] = {}
+
+
+async def _get_cached(file_path: str) -> Optional[CachedJSONFile]:
+    """
+    Get the cached content of a file if the file did not change since
+    :param file_path: The path of the JSON file
+    :type file_path: str
+    :return: The cached content, or None if it is missing or stale
+    :rtype: Optional[CachedJSONFile]
+    """
+    cached: Optional[CachedJSONFile] = _json_cache.get(file_path)
+    if cached is None:
+        return None
+    try:
+        stat: os.stat_result = await aiofiles.os.stat(file_path)
+    except FileNotFoundError:
+        _json_cache.pop(file_path, None)
+        return None
+    if (stat.st_mtime_ns, stat.st_size) != (cached.mtime_ns, cached.size):
+        return None
+    return cached
+
+
+async def _store_cached(file_path: str, data: dict[str, Any]) -> None:
+    """
+    Cache the content of a file along with its current stat
+    :param file_path: The path of the JSON file
+    :type file_path: str
+    :param data: The parsed content of the file
+    :type data: dict[str, Any]
+    :return: None
+    :rtype: NoneType
+    """
+    stat: os.stat_result = await aiofiles.os.stat(file_path)
+    _json_cache[file_path] = CachedJSONFile(
+        stat.st_mtime_ns, stat.st_size, data
+    )
+
+
+@instrument
 async def read_json_file(
+    file_path: str,
     init_setting: InitSettings = Depends(get_init_settings),
 ) -> dict[str, Any]:
     """
-    Read the OpenAPI JSON file
+    Read a JSON file. The parsed content is cached by modification time
+     and size, so an unchanged file is never parsed twice; the returned
+     object is shared and must not be mutated.
+    :param file_path: The path of the JSON file
+    :type file_path: str
     :param init_setting: Dependency method for cached setting object
     :type init_setting: InitSettings
     :return: JSON data
     :rtype: dict[str, Any]
     """
-    file_path: str = f"{init_setting.OPENAPI_FILE_PATH}"
+    cached: Optional[CachedJSONFile] = await _get_cached(file_path)
+    if cached is not None:
+        return cached.data
     async with aiofiles.open(
         file_path, mode="r", encoding=init_setting.ENCODING
     ) as file:
@@ -37,27 +95,39 @@ async def read_json_file(
     if not content:
         raise ValueError(f"The file {file_path} is empty or not readable.")
     data: dict[str, Any] = json.loads(content)
+    await _store_cached(file_path, data)
     return data
 
 
-@with_logging
-@benchmark
+@instrument
 async def write_json_file(
     data: dict[str, Any],
+    file_path: str,
     init_setting: InitSettings = Depends(get_init_settings),
 ) -> None:
     """
-    Write the modified JSON data back to the file
+    Write JSON data to a file, skipping the write if the file already
+     holds the same data
     :param data: Modified JSON data
     :type data: dict[str, Any]
+    :param file_path: The path of the JSON file
+    :type file_path: str
     :param init_setting: Dependency method for cached setting object
     :type init_setting: InitSettings
     :return: None
     :rtype: NoneType
     """
-    file_path: str = f"{init_setting.OPENAPI_FILE_PATH}"
+    try:
+        existing: Optional[dict[str, Any]] = await read_json_file(
+            file_path, init_setting
+        )
+    except (OSError, ValueError):
+        existing = None
+    if existing == data:
+        return
     async with aiofiles.open(
         file_path, mode="w", encoding=init_setting.ENCODING
     ) as out_file:
         await out_file.write(json.dumps(data, indent=4))
-    logger.info("Json file written: %s", init_setting.OPENAPI_FILE_PATH)
+    await _store_cached(file_path, data)
+    logger.info("Json file written: %s", file_path)
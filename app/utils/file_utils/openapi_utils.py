@@ -2,12 +2,15 @@
 A module for openapi utils in the app.utils.files utils package.
 """
 
+import gzip
 import json
-from typing import Any, Optional
+from hashlib import sha256
+from typing import Any, NamedTuple, Optional
 
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from fastapi.routing import APIRoute
+from starlette.routing import Route
 
 from app.config.config import auth_setting, init_setting, setting
 
@@ -103,7 +106,66 @@ def custom_openapi(app: FastAPI) -> dict[str, Any]:
     )
     openapi_schema = modify_json_data(openapi_schema)
     app.openapi_schema = openapi_schema
-    file_path: str = f"{init_setting.OPENAPI_FILE_PATH}"[1:]
-    with open(file_path, mode="w", encoding=init_setting.ENCODING) as out_file:
-        out_file.write(json.dumps(openapi_schema, indent=4))
     return app.openapi_schema
+
+
+class OpenAPIDocument(NamedTuple):
+    """
+    OpenAPI document serialized once, ready to be sent as is
+    """
+
+    content: bytes
+    compressed: bytes
+    etag: str
+
+
+def build_openapi_document(app: FastAPI) -> OpenAPIDocument:
+    """
+    Serialize and compress the OpenAPI schema of the application
+    :param app: FastAPI instance.
+    :type app: FastAPI
+    :return: The serialized document with its gzip body and ETag
+    :rtype: OpenAPIDocument
+    """
+    content: bytes = json.dumps(
+        app.openapi(), ensure_ascii=False, separators=(",", ":")
+    ).encode(init_setting.ENCODING)
+    return OpenAPIDocument(
+        content,
+        gzip.compress(content, mtime=0),
+        f'"{sha256(content).hexdigest()[:32]}"',
+    )
+
+
+def get_openapi_document(app: FastAPI) -> OpenAPIDocument:
+    """
+    Get the document built at startup, building it if it is missing
+    :param app: FastAPI instance.
+    :type app: FastAPI
+    :return: The serialized OpenAPI document
+    :rtype: OpenAPIDocument
+    """
+    document: Optional[OpenAPIDocument] = getattr(
+        app.state, "openapi_document", None
+    )
+    if document is None:
+        document = build_openapi_document(app)
+        app.state.openapi_document = document
+    return document
+
+
+def remove_default_openapi_route(app: FastAPI) -> None:
+    """
+    Remove the OpenAPI route FastAPI registers, which serializes the
+     schema on every request, so the precomputed document is served
+     instead
+    :param app: FastAPI instance.
+    :type app: FastAPI
+    :return: None
+    :rtype: NoneType
+    """
+    app.router.routes[:] = [
+        route
+        for route in app.router.routes
+        if not (isinstance(route, Route) and route.path == app.openapi_url)
+    ]
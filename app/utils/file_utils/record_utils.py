@@ -0,0 +1,181 @@
+"""
+A module for record utils in the app.utils.file utils package.
+Records are written one line each, so a file of any size can be produced
+ one batch of rows at a time: NDJSON holds a JSON object per line and CSV
+ a header line followed by a line of values per row. Files are read the
+ same way, a chunk at a time, and only a CSV value quoted across lines
+ makes a record span more than one.
+"""
+
+import codecs
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Mapping, NamedTuple, Optional, Sequence
+
+from app.schemas.infrastructure.file_format import FileFormat
+
+MEDIA_TYPES: dict[FileFormat, str] = {
+    FileFormat.NDJSON: "application/x-ndjson",
+    FileFormat.CSV: "text/csv; charset=utf-8",
+}
+MAX_RECORD_LINES: int = 1000
+
+
+def encode_records(
+    records: Sequence[Mapping[Any, Any]],
+    columns: Sequence[str],
+    file_format: FileFormat,
+    header: bool = False,
+) -> bytes:
+    """
+    Encode a batch of records as lines of a file
+    :param records: The records of the batch
+    :type records: Sequence[Mapping[Any, Any]]
+    :param columns: The keys of the records, in output order
+    :type columns: Sequence[str]
+    :param file_format: The format of the file
+    :type file_format: FileFormat
+    :param header: Start the batch with the CSV header line
+    :type header: bool
+    :return: The encoded lines
+    :rtype: bytes
+    """
+    if file_format == FileFormat.NDJSON:
+        return "".join(
+            json.dumps(
+                {column: record[column] for column in columns},
+                default=str,
+                separators=(",", ":"),
+            )
+            + "\n"
+            for record in records
+        ).encode()
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(columns)
+    writer.writerows(
+        [record[column] for column in columns] for record in records
+    )
+    return buffer.getvalue().encode()
+
+
+class FileRecord(NamedTuple):
+    """
+    A record read from a file, or the reason it could not be read
+    """
+
+    row: int
+    values: Optional[dict[str, Any]]
+    error: Optional[str] = None
+
+
+async def read_lines(
+    chunks: AsyncIterator[bytes], encoding: str = "utf-8-sig"
+) -> AsyncIterator[str]:
+    """
+    Split a stream of bytes into its lines, as the chunks arrive
+    :param chunks: The chunks of the file
+    :type chunks: AsyncIterator[bytes]
+    :param encoding: The encoding of the file
+    :type encoding: str
+    :return: The lines of the file, without their line break
+    :rtype: AsyncIterator[str]
+    """
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(encoding)(
+        errors="replace"
+    )
+    pending: str = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.removesuffix("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def read_ndjson(lines: AsyncIterator[str]) -> AsyncIterator[FileRecord]:
+    """
+    Parse the records of an NDJSON file, skipping blank lines
+    :param lines: The lines of the file
+    :type lines: AsyncIterator[str]
+    :return: The records, numbered from 1
+    :rtype: AsyncIterator[FileRecord]
+    """
+    row: int = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            values: Any = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield FileRecord(row, None, f"Invalid JSON: {exc.msg}")
+            continue
+        if isinstance(values, dict):
+            yield FileRecord(row, values)
+        else:
+            yield FileRecord(row, None, "Expected a JSON object")
+
+
+async def read_csv(lines: AsyncIterator[str]) -> AsyncIterator[FileRecord]:
+    """
+    Parse the records of a CSV file with a header line, skipping blank
+     lines. A quoted value left open for more than MAX_RECORD_LINES
+     lines ends the file with an error
+    :param lines: The lines of the file
+    :type lines: AsyncIterator[str]
+    :return: The records keyed by the header, numbered from 1
+    :rtype: AsyncIterator[FileRecord]
+    """
+    header: Optional[list[str]] = None
+    row: int = 0
+    record: list[str] = []
+    quotes: int = 0
+    async for line in lines:
+        record.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            if len(record) > MAX_RECORD_LINES:
+                break
+            continue
+        text: str = "\n".join(record)
+        record = []
+        quotes = 0
+        if not text.strip():
+            continue
+        values: list[str] = next(csv.reader([text]))
+        if header is None:
+            header = values
+            continue
+        row += 1
+        if len(values) != len(header):
+            yield FileRecord(
+                row,
+                None,
+                f"Expected {len(header)} values, got {len(values)}",
+            )
+            continue
+        yield FileRecord(row, dict(zip(header, values)))
+    if record:
+        yield FileRecord(row + 1, None, "Unterminated quoted value")
+
+
+def read_records(
+    chunks: AsyncIterator[bytes], file_format: FileFormat
+) -> AsyncIterator[FileRecord]:
+    """
+    Parse the records of a file as its chunks arrive
+    :param chunks: The chunks of the file
+    :type chunks: AsyncIterator[bytes]
+    :param file_format: The format of the file
+    :type file_format: FileFormat
+    :return: The records of the file
+    :rtype: AsyncIterator[FileRecord]
+    """
+    if file_format == FileFormat.NDJSON:
+        return read_ndjson(read_lines(chunks))
+    return read_csv(read_lines(chunks))
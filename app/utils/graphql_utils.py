@@ -0,0 +1,215 @@
+"""
+A module for graphql utils in the app.utils package.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLList,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    InlineFragmentNode,
+    NoSchemaIntrospectionCustomRule,
+    OperationType,
+    SelectionSetNode,
+    get_nullable_type,
+    parse,
+    validate,
+)
+from graphql.utilities import get_operation_ast
+
+from app.core.metrics import register_lru_cache
+
+
+class GraphQLOperation(NamedTuple):
+    """
+    Lightweight description of the operation carried by a request
+    """
+
+    operation_type: OperationType
+    name: Optional[str]
+    root_fields: frozenset[str]
+
+
+def load_graphql_payload(body: bytes) -> Optional[dict[str, Any]]:
+    """
+    Load the JSON payload of a GraphQL HTTP request
+    :param body: The raw request body
+    :type body: bytes
+    :return: The decoded payload, or None if it is not a JSON object
+    :rtype: Optional[dict[str, Any]]
+    """
+    try:
+        payload: Any = json.loads(body)
+    except (TypeError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def collect_root_fields(
+    selection_set: SelectionSetNode,
+    fragments: dict[str, FragmentDefinitionNode],
+    visited: set[str],
+) -> Optional[set[str]]:
+    """
+    Collect the names of the root fields of an operation, including the
+     ones selected through fragment spreads and inline fragments
+    :param selection_set: The selection set of the operation
+    :type selection_set: SelectionSetNode
+    :param fragments: The fragment definitions of the document by name
+    :type fragments: dict[str, FragmentDefinitionNode]
+    :param visited: The names of the fragments already expanded
+    :type visited: set[str]
+    :return: The root field names, or None if a spread references an
+     unknown fragment
+    :rtype: Optional[set[str]]
+    """
+    fields: set[str] = set()
+    for selection in selection_set.selections:
+        nested: Optional[SelectionSetNode] = None
+        if isinstance(selection, FieldNode):
+            fields.add(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            nested = selection.selection_set
+        elif isinstance(selection, FragmentSpreadNode):
+            name: str = selection.name.value
+            if name not in fragments:
+                return None
+            if name not in visited:
+                visited.add(name)
+                nested = fragments[name].selection_set
+        if nested is not None:
+            nested_fields: Optional[set[str]] = collect_root_fields(
+                nested, fragments, visited
+            )
+            if nested_fields is None:
+                return None
+            fields |= nested_fields
+    return fields
+
+
+@lru_cache(maxsize=512)
+def inspect_operation(
+    query: str, operation_name: Optional[str] = None
+) -> Optional[GraphQLOperation]:
+    """
+    Parse a GraphQL document and describe the selected operation.
+    Results are cached by document so repeated operations are only
+     parsed once.
+    :param query: The GraphQL document
+    :type query: str
+    :param operation_name: The name of the operation to select
+    :type operation_name: Optional[str]
+    :return: The operation description, or None if it is invalid
+    :rtype: Optional[GraphQLOperation]
+    """
+    try:
+        document = parse(query, no_location=True)
+    except GraphQLError:
+        return None
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return None
+    root_fields: Optional[set[str]] = collect_root_fields(
+        operation.selection_set,
+        {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        },
+        set(),
+    )
+    if root_fields is None:
+        return None
+    name: Optional[str] = (
+        operation.name.value if operation.name else operation_name
+    )
+    return GraphQLOperation(operation.operation, name, frozenset(root_fields))
+
+
+register_lru_cache("graphql_operation", inspect_operation)
+
+
+@lru_cache(maxsize=512)
+def uses_introspection(schema: GraphQLSchema, query: str) -> bool:
+    """
+    Check whether a GraphQL document selects any introspection field,
+     including through fragments
+    :param schema: The GraphQL schema the document runs against
+    :type schema: GraphQLSchema
+    :param query: The GraphQL document
+    :type query: str
+    :return: True if the document introspects the schema
+    :rtype: bool
+    """
+    try:
+        document = parse(query, no_location=True)
+    except GraphQLError:
+        return False
+    return bool(validate(schema, document, [NoSchemaIntrospectionCustomRule]))
+
+
+def get_operation_from_body(body: bytes) -> Optional[GraphQLOperation]:
+    """
+    Describe the GraphQL operation sent in a raw request body
+    :param body: The raw request body
+    :type body: bytes
+    :return: The operation description, or None if it cannot be parsed
+    :rtype: Optional[GraphQLOperation]
+    """
+    payload: Optional[dict[str, Any]] = load_graphql_payload(body)
+    if not payload or not isinstance(payload.get("query"), str):
+        return None
+    operation_name: Any = payload.get("operationName")
+    return inspect_operation(
+        payload["query"],
+        operation_name if isinstance(operation_name, str) else None,
+    )
+
+
+def get_list_root_fields(schema: GraphQLSchema) -> frozenset[str]:
+    """
+    Get the names of the root query fields that return lists
+    :param schema: The GraphQL schema to inspect
+    :type schema: GraphQLSchema
+    :return: The names of the list root fields
+    :rtype: frozenset[str]
+    """
+    if schema.query_type is None:
+        return frozenset()
+    return frozenset(
+        name
+        for name, field in schema.query_type.fields.items()
+        if isinstance(get_nullable_type(field.type), GraphQLList)
+    )
+
+
+def selected_fields(
+    info: Optional[GraphQLResolveInfo],
+) -> Optional[frozenset[str]]:
+    """
+    Get the names of the fields selected on the value of the field being
+     resolved
+    :param info: The GraphQL resolve info, if any
+    :type info: Optional[GraphQLResolveInfo]
+    :return: The names of the selected fields, or None if they are not
+     known, as when the selection uses fragments
+    :rtype: Optional[frozenset[str]]
+    """
+    if info is None:
+        return None
+    names: set[str] = set()
+    for field_node in info.field_nodes:
+        if field_node.selection_set is None:
+            continue
+        for selection in field_node.selection_set.selections:
+            if not isinstance(selection, FieldNode):
+                return None
+            names.add(selection.name.value)
+    return frozenset(names)
@@ -13,6 +13,7 @@ from fastapi import Depends, HTTPException, status
 from app.config.auth_settings import AuthSettings
 from app.config.config import get_auth_settings, get_init_settings
 from app.config.init_settings import InitSettings
+from app.core.decorators import instrument
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -86,6 +87,7 @@ def decode_jwt(
         ) from exc
 
 
+@instrument(name="jwt.verify")
 def decode_and_validate_jwt(
     auth_settings: Annotated[AuthSettings, Depends(get_auth_settings)],
     token: str,
@@ -0,0 +1,294 @@
+"""
+Command line entry point of the benchmarks package.
+Usage:
+    python -m benchmarks seed [--employers N] [--users N] ...
+    python -m benchmarks run [--url URL] [--concurrency N] ...
+    python -m benchmarks resolvers [--iterations N] ...
+    python -m benchmarks compare BASELINE CURRENT
+    python -m benchmarks explain
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Any
+
+import httpx
+
+from benchmarks.dataset import DatasetSpec, seed_database
+from benchmarks.driver import (
+    BenchmarkError,
+    LoadDriver,
+    OperationStats,
+    format_report,
+)
+from benchmarks.explain import PathCheck, check_access_paths, format_checks
+from benchmarks.operations import OPERATIONS
+from benchmarks.regression import (
+    MetricDiff,
+    Results,
+    compare,
+    format_diff,
+    has_regression,
+    load_results,
+)
+from benchmarks.resolvers import RESOLVERS, run_resolvers
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser
+    :return: The parser of the seed and run commands
+    :rtype: argparse.ArgumentParser
+    """
+    defaults: DatasetSpec = DatasetSpec()
+    dataset: argparse.ArgumentParser = argparse.ArgumentParser(add_help=False)
+    dataset.add_argument("--employers", type=int, default=defaults.employers)
+    dataset.add_argument(
+        "--jobs-per-employer", type=int, default=defaults.jobs_per_employer
+    )
+    dataset.add_argument("--users", type=int, default=defaults.users)
+    dataset.add_argument(
+        "--applications-per-user",
+        type=int,
+        default=defaults.applications_per_user,
+    )
+    dataset.add_argument("--seed", type=int, default=defaults.seed)
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Seed a benchmark dataset and load test the API",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "seed", parents=[dataset], help="Recreate and seed the database"
+    )
+    output: argparse.ArgumentParser = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--warmup", type=int, default=10)
+    output.add_argument(
+        "--repeats",
+        type=int,
+        default=1,
+        help="Repeat the whole run to measure its noise",
+    )
+    output.add_argument("--output", help="Write the results as JSON to a file")
+    output.add_argument(
+        "--baseline",
+        help="Compare with the baseline at this path, storing it if missing,"
+        " and exit with status 1 on regression",
+    )
+    run: argparse.ArgumentParser = commands.add_parser(
+        "run", parents=[dataset, output], help="Run the load driver"
+    )
+    run.add_argument(
+        "--url",
+        help="Base URL of a running server; the app runs in-process if omitted",
+    )
+    run.add_argument("--concurrency", type=int, default=8)
+    run.add_argument("--requests", type=int, default=200)
+    run.add_argument(
+        "--operations",
+        nargs="+",
+        choices=sorted(OPERATIONS),
+        default=[
+            name for name, operation in OPERATIONS.items() if operation.default
+        ],
+    )
+    resolvers: argparse.ArgumentParser = commands.add_parser(
+        "resolvers",
+        parents=[dataset, output],
+        help="Call the resolvers and mutations directly",
+    )
+    resolvers.add_argument("--iterations", type=int, default=200)
+    resolvers.add_argument(
+        "--resolvers",
+        nargs="+",
+        choices=sorted(RESOLVERS),
+        default=[
+            name for name, benchmark in RESOLVERS.items() if benchmark.default
+        ],
+    )
+    compare_parser: argparse.ArgumentParser = commands.add_parser(
+        "compare", help="Compare a results file with a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    commands.add_parser(
+        "explain", help="Check that the resolver lookups use their indexes"
+    )
+    return parser
+
+
+def get_spec(arguments: argparse.Namespace) -> DatasetSpec:
+    """
+    Get the dataset spec from the parsed arguments
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :return: The dataset spec
+    :rtype: DatasetSpec
+    """
+    return DatasetSpec(
+        employers=arguments.employers,
+        jobs_per_employer=arguments.jobs_per_employer,
+        users=arguments.users,
+        applications_per_user=arguments.applications_per_user,
+        seed=arguments.seed,
+    )
+
+
+def build_client(url: str | None) -> httpx.AsyncClient:
+    """
+    Build the HTTP client of the load driver
+    :param url: The base URL of a running server, if any
+    :type url: str | None
+    :return: A client for the server, or for the app in-process
+    :rtype: httpx.AsyncClient
+    """
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=60)
+    from main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark",
+        timeout=60,
+    )
+
+
+async def run(arguments: argparse.Namespace) -> list[OperationStats]:
+    """
+    Run the load driver with the parsed arguments
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :return: The summary of every operation
+    :rtype: list[OperationStats]
+    """
+    from app.config.config import performance_setting
+
+    async with build_client(arguments.url) as client:
+        driver: LoadDriver = LoadDriver(
+            client,
+            get_spec(arguments),
+            arguments.concurrency,
+            arguments.requests,
+            arguments.warmup,
+            performance_setting.TRACING_HEADER,
+            measure_allocations=not arguments.url,
+        )
+        return await driver.run(arguments.operations)
+
+
+async def run_repeats(arguments: argparse.Namespace) -> Results:
+    """
+    Run the requested benchmark as many times as asked
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :return: The stats of every repeat of each operation
+    :rtype: Results
+    """
+    results: Results = {}
+    for repeat in range(arguments.repeats):
+        logger.info("Repeat %d of %d", repeat + 1, arguments.repeats)
+        stats: list[OperationStats]
+        if arguments.command == "resolvers":
+            stats = await run_resolvers(
+                arguments.resolvers,
+                get_spec(arguments),
+                arguments.iterations,
+                arguments.warmup,
+            )
+        else:
+            stats = await run(arguments)
+        print(format_report(stats))
+        for operation in stats:
+            results.setdefault(operation.operation, []).append(
+                operation._asdict()
+            )
+    return results
+
+
+def write_results(
+    arguments: argparse.Namespace, results: Results, path: str
+) -> None:
+    """
+    Write the results of a run as JSON
+    :param arguments: The parsed command line arguments
+    :type arguments: argparse.Namespace
+    :param results: The stats of every repeat of each operation
+    :type results: Results
+    :param path: The path of the JSON file
+    :type path: str
+    :return: None
+    :rtype: NoneType
+    """
+    report: dict[str, Any] = {
+        "spec": get_spec(arguments)._asdict(),
+        "command": arguments.command,
+        "concurrency": getattr(arguments, "concurrency", 1),
+        "repeats": arguments.repeats,
+        "operations": results,
+    }
+    with open(path, mode="w", encoding="utf-8") as file:
+        json.dump(report, file, indent=4)
+
+
+def check_regression(baseline: Results, current: Results) -> bool:
+    """
+    Print the diff of a run against a baseline
+    :param baseline: The stored baseline
+    :type baseline: Results
+    :param current: The new run
+    :type current: Results
+    :return: True if any metric regressed
+    :rtype: bool
+    """
+    diffs: list[MetricDiff] = compare(baseline, current)
+    missing: list[str] = sorted(set(baseline) - set(current))
+    print(format_diff(diffs, missing))
+    return has_regression(diffs)
+
+
+def main() -> None:
+    """
+    Parse the command line and run the requested command
+    :return: None
+    :rtype: NoneType
+    """
+    arguments: argparse.Namespace = build_parser().parse_args()
+    if arguments.command == "explain":
+        checks: list[PathCheck] = asyncio.run(check_access_paths())
+        print(format_checks(checks))
+        if not all(check.used for check in checks):
+            sys.exit(1)
+        return
+    if arguments.command == "seed":
+        asyncio.run(seed_database(get_spec(arguments)))
+        return
+    if arguments.command == "compare":
+        if check_regression(
+            load_results(arguments.baseline), load_results(arguments.current)
+        ):
+            sys.exit(1)
+        return
+    try:
+        results: Results = asyncio.run(run_repeats(arguments))
+    except BenchmarkError as exc:
+        sys.exit(str(exc))
+    if arguments.output:
+        write_results(arguments, results, arguments.output)
+    if not arguments.baseline:
+        return
+    if not os.path.exists(arguments.baseline):
+        write_results(arguments, results, arguments.baseline)
+        logger.info("Stored a new baseline at %s", arguments.baseline)
+        return
+    if check_regression(load_results(arguments.baseline), results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+A module for dataset in the benchmarks package.
+The dataset is generated from a seed, so every run against the same
+ spec sees the same rows and the same ids.
+"""
+
+import logging
+from random import Random
+from typing import Any, NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security.password import hash_password
+from app.db.init_db import bulk_insert, create_db_and_tables
+from app.db.session import get_session
+from app.models.application import Application
+from app.models.employer import Employer
+from app.models.job import Job
+from app.models.user import User
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+BENCHMARK_PASSWORD: str = "Benchmark123."
+INSERT_BATCH_SIZE: int = 1000
+INDUSTRIES: tuple[str, ...] = (
+    "Tech",
+    "Finance",
+    "Health",
+    "Retail",
+    "Energy",
+    "Education",
+)
+JOB_TITLES: tuple[str, ...] = (
+    "Software Engineer",
+    "Data Analyst",
+    "Accountant",
+    "Product Manager",
+    "Designer",
+    "Support Specialist",
+)
+
+
+class DatasetSpec(NamedTuple):
+    """
+    Size and seed of a benchmark dataset
+    """
+
+    employers: int = 50
+    jobs_per_employer: int = 20
+    users: int = 500
+    applications_per_user: int = 5
+    seed: int = 42
+
+    @property
+    def jobs(self) -> int:
+        """
+        The total number of jobs
+        :return: The number of jobs in the dataset
+        :rtype: int
+        """
+        return self.employers * self.jobs_per_employer
+
+
+def build_rows(spec: DatasetSpec) -> dict[str, list[dict[str, Any]]]:
+    """
+    Generate the rows of every table. Ids are implied by the insert
+     order, starting at 1 on freshly created tables.
+    :param spec: The size and seed of the dataset
+    :type spec: DatasetSpec
+    :return: The rows to insert by table name
+    :rtype: dict[str, list[dict[str, Any]]]
+    """
+    rng: Random = Random(spec.seed)
+    employers: list[dict[str, Any]] = [
+        {
+            "name": f"Employer {index:05d}",
+            "contact_email": f"contact@employer{index}.com",
+            "industry": rng.choice(INDUSTRIES),
+        }
+        for index in range(1, spec.employers + 1)
+    ]
+    jobs: list[dict[str, Any]] = [
+        {
+            "title": f"{rng.choice(JOB_TITLES)} {index}",
+            "description": f"Opening number {index} at employer {employer}",
+            "employer_id": employer,
+        }
+        for index, employer in enumerate(
+            (
+                employer
+                for employer in range(1, spec.employers + 1)
+                for _ in range(spec.jobs_per_employer)
+            ),
+            start=1,
+        )
+    ]
+    hashed_password: str = hash_password(BENCHMARK_PASSWORD)
+    users: list[dict[str, Any]] = [
+        {
+            "username": f"user{index:05d}",
+            "email": f"user{index}@benchmark.com",
+            "hashed_password": hashed_password,
+            "role": "admin" if index == 1 else "user",
+        }
+        for index in range(1, spec.users + 1)
+    ]
+    applications: list[dict[str, Any]] = [
+        {"user_id": user, "job_id": job}
+        for user in range(1, spec.users + 1)
+        for job in rng.sample(
+            range(1, spec.jobs + 1),
+            min(spec.applications_per_user, spec.jobs),
+        )
+    ]
+    return {
+        "employer": employers,
+        "job": jobs,
+        "users": users,
+        "application": applications,
+    }
+
+
+async def seed_database(spec: DatasetSpec) -> None:
+    """
+    Recreate the tables and load a generated dataset
+    :param spec: The size and seed of the dataset
+    :type spec: DatasetSpec
+    :return: None
+    :rtype: NoneType
+    """
+    await create_db_and_tables()
+    rows: dict[str, list[dict[str, Any]]] = build_rows(spec)
+    async_session: AsyncSession = await get_session()
+    try:
+        for model in (Employer, Job, User, Application):
+            table_rows: list[dict[str, Any]] = rows[model.__tablename__]
+            for start in range(0, len(table_rows), INSERT_BATCH_SIZE):
+                await bulk_insert(
+                    async_session,
+                    model,
+                    table_rows[start : start + INSERT_BATCH_SIZE],
+                )
+            logger.info(
+                "Seeded %s rows into %s", len(table_rows), model.__tablename__
+            )
+        await async_session.commit()
+    finally:
+        await async_session.close()
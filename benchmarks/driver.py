@@ -0,0 +1,348 @@
+"""
+A module for driver in the benchmarks package.
+The driver replays catalogue operations with a fixed number of
+ concurrent workers and reports latency percentiles, throughput and the
+ SQL statements each operation issues.
+"""
+
+import asyncio
+import logging
+import tracemalloc
+from math import ceil
+from random import Random
+from time import perf_counter_ns
+from typing import Any, NamedTuple, Optional
+
+import httpx
+
+from benchmarks.dataset import DatasetSpec
+from benchmarks.operations import OPERATIONS, BenchmarkOperation
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+NANOSECONDS: float = 1e9
+MILLISECONDS: float = 1e6
+
+
+class BenchmarkError(Exception):
+    """
+    Raised when a run would measure failing requests instead of the
+     operations
+    """
+
+
+class OperationStats(NamedTuple):
+    """
+    Summary of the requests sent for an operation
+    """
+
+    operation: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    throughput: float
+    sql_statements: Optional[int]
+    allocated_kib: Optional[float] = None
+
+
+def percentile(values: list[int], quantile: float) -> float:
+    """
+    Get a percentile of sorted values with the nearest-rank method
+    :param values: The sorted values
+    :type values: list[int]
+    :param quantile: The quantile, between 0 and 1
+    :type quantile: float
+    :return: The value at the quantile, or 0 if there are no values
+    :rtype: float
+    """
+    if not values:
+        return 0.0
+    rank: int = max(ceil(quantile * len(values)), 1)
+    return float(values[min(rank, len(values)) - 1])
+
+
+def summarize(
+    operation: str,
+    latencies: list[int],
+    errors: int,
+    elapsed: int,
+    sql_statements: Optional[int],
+    allocated_kib: Optional[float] = None,
+) -> OperationStats:
+    """
+    Summarize the latencies recorded for an operation
+    :param operation: The name of the operation
+    :type operation: str
+    :param latencies: The latency of every request, in nanoseconds
+    :type latencies: list[int]
+    :param errors: The number of failed requests
+    :type errors: int
+    :param elapsed: The wall time of the run, in nanoseconds
+    :type elapsed: int
+    :param sql_statements: The statements issued by one request
+    :type sql_statements: Optional[int]
+    :param allocated_kib: The peak memory allocated by one request
+    :type allocated_kib: Optional[float]
+    :return: The summary of the operation
+    :rtype: OperationStats
+    """
+    ordered: list[int] = sorted(latencies)
+    return OperationStats(
+        operation=operation,
+        requests=len(ordered),
+        errors=errors,
+        p50_ms=percentile(ordered, 0.5) / MILLISECONDS,
+        p95_ms=percentile(ordered, 0.95) / MILLISECONDS,
+        p99_ms=percentile(ordered, 0.99) / MILLISECONDS,
+        mean_ms=(
+            sum(ordered) / len(ordered) / MILLISECONDS if ordered else 0.0
+        ),
+        throughput=len(ordered) / (elapsed / NANOSECONDS) if elapsed else 0.0,
+        sql_statements=sql_statements,
+        allocated_kib=allocated_kib,
+    )
+
+
+def is_error(response: httpx.Response) -> bool:
+    """
+    Check whether a GraphQL response failed
+    :param response: The HTTP response
+    :type response: httpx.Response
+    :return: True if the request failed or returned GraphQL errors
+    :rtype: bool
+    """
+    if response.status_code != httpx.codes.OK:
+        return True
+    try:
+        return bool(response.json().get("errors"))
+    except ValueError:
+        return True
+
+
+def check_errors(stats: OperationStats) -> None:
+    """
+    Stop a run whose measured requests failed, since their latencies
+     are those of the error path
+    :param stats: The summary of an operation
+    :type stats: OperationStats
+    :return: None
+    :rtype: NoneType
+    :raises BenchmarkError: If any request of the operation failed
+    """
+    if stats.errors:
+        raise BenchmarkError(
+            f"{stats.operation} failed {stats.errors} of"
+            f" {stats.requests} requests"
+        )
+
+
+class LoadDriver:
+    """
+    Closed-loop load driver for the GraphQL endpoint
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        spec: DatasetSpec,
+        concurrency: int,
+        requests: int,
+        warmup: int,
+        tracing_header: str,
+        measure_allocations: bool = False,
+    ):
+        self.client: httpx.AsyncClient = client
+        self.spec: DatasetSpec = spec
+        self.concurrency: int = concurrency
+        self.requests: int = requests
+        self.warmup: int = warmup
+        self.tracing_header: str = tracing_header
+        self.measure_allocations: bool = measure_allocations
+        self.rng: Random = Random(spec.seed)
+        self.headers: dict[str, str] = {}
+
+    async def post(
+        self,
+        operation: BenchmarkOperation,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Send an operation with variables drawn from the dataset
+        :param operation: The operation to send
+        :type operation: BenchmarkOperation
+        :param headers: Additional request headers
+        :type headers: Optional[dict[str, str]]
+        :return: The HTTP response
+        :rtype: httpx.Response
+        """
+        request_headers: dict[str, str] = (
+            dict(self.headers) if operation.authenticated else {}
+        )
+        request_headers.update(headers or {})
+        return await self.client.post(
+            "/",
+            json={
+                "query": operation.query,
+                "operationName": operation.name,
+                "variables": operation.variables(self.rng, self.spec),
+            },
+            headers=request_headers,
+        )
+
+    async def login(self) -> None:
+        """
+        Log in as the first seeded user to send authenticated operations
+        :return: None
+        :rtype: NoneType
+        :raises BenchmarkError: If the login does not return a token
+        """
+        response: httpx.Response = await self.client.post(
+            "/",
+            json={
+                "query": OPERATIONS["LoginUser"].query,
+                "variables": {
+                    "email": "user1@benchmark.com",
+                    "password": OPERATIONS["LoginUser"].variables(
+                        self.rng, self.spec
+                    )["password"],
+                },
+            },
+        )
+        token: Any = (
+            (response.json().get("data") or {}).get("loginUser") or {}
+        ).get("token")
+        if not token:
+            raise BenchmarkError(
+                "Could not log in to send the authenticated operations"
+            )
+        self.headers["Authorization"] = f"Bearer {token}"
+
+    async def probe(
+        self, operation: BenchmarkOperation
+    ) -> tuple[Optional[int], Optional[float]]:
+        """
+        Send one traced request to count its SQL statements and, when
+         the app runs in this process, the memory it allocates
+        :param operation: The operation to probe
+        :type operation: BenchmarkOperation
+        :return: The number of statements, or None if tracing is off,
+         and the peak allocation in KiB, or None if not measured
+        :rtype: tuple[Optional[int], Optional[float]]
+        """
+        allocated_kib: Optional[float] = None
+        if self.measure_allocations:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline: int = tracemalloc.get_traced_memory()[0]
+        try:
+            response: httpx.Response = await self.post(
+                operation, {self.tracing_header: "1"}
+            )
+        finally:
+            if self.measure_allocations:
+                allocated_kib = (
+                    tracemalloc.get_traced_memory()[1] - baseline
+                ) / 1024
+                tracemalloc.stop()
+        try:
+            resolvers: list[dict[str, Any]] = response.json()["extensions"][
+                "tracing"
+            ]["execution"]["resolvers"]
+        except (ValueError, KeyError, TypeError):
+            return None, allocated_kib
+        return (
+            sum(len(resolver.get("sql", [])) for resolver in resolvers),
+            allocated_kib,
+        )
+
+    async def run_operation(
+        self, operation: BenchmarkOperation
+    ) -> OperationStats:
+        """
+        Send an operation from every worker until the request budget is
+         spent
+        :param operation: The operation to benchmark
+        :type operation: BenchmarkOperation
+        :return: The summary of the run
+        :rtype: OperationStats
+        """
+        for _ in range(self.warmup):
+            await self.post(operation)
+        sql_statements: Optional[int]
+        allocated_kib: Optional[float]
+        sql_statements, allocated_kib = await self.probe(operation)
+        latencies: list[int] = []
+        errors: int = 0
+        remaining: int = self.requests
+
+        async def worker() -> None:
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                start_time: int = perf_counter_ns()
+                response: httpx.Response = await self.post(operation)
+                latencies.append(perf_counter_ns() - start_time)
+                if is_error(response):
+                    errors += 1
+
+        start_time: int = perf_counter_ns()
+        async with asyncio.TaskGroup() as group:
+            for _ in range(self.concurrency):
+                group.create_task(worker())
+        elapsed: int = perf_counter_ns() - start_time
+        return summarize(
+            operation.name,
+            latencies,
+            errors,
+            elapsed,
+            sql_statements,
+            allocated_kib,
+        )
+
+    async def run(self, operations: list[str]) -> list[OperationStats]:
+        """
+        Benchmark the operations one after the other, stopping at the
+         first one with failed requests
+        :param operations: The names of the catalogue operations
+        :type operations: list[str]
+        :return: The summary of every operation
+        :rtype: list[OperationStats]
+        :raises BenchmarkError: If the login or a request fails
+        """
+        if any(OPERATIONS[name].authenticated for name in operations):
+            await self.login()
+        results: list[OperationStats] = []
+        for name in operations:
+            stats: OperationStats = await self.run_operation(OPERATIONS[name])
+            logger.info("%s: %s", name, stats)
+            check_errors(stats)
+            results.append(stats)
+        return results
+
+
+def format_report(results: list[OperationStats]) -> str:
+    """
+    Render the summaries as a fixed width table
+    :param results: The summary of every operation
+    :type results: list[OperationStats]
+    :return: The report
+    :rtype: str
+    """
+    header: str = (
+        f"{'operation':<28}{'requests':>9}{'errors':>8}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'req/s':>10}{'sql':>6}"
+    )
+    lines: list[str] = [header, "-" * len(header)]
+    for stats in results:
+        sql: str = (
+            "-" if stats.sql_statements is None else str(stats.sql_statements)
+        )
+        lines.append(
+            f"{stats.operation:<28}{stats.requests:>9}{stats.errors:>8}"
+            f"{stats.p50_ms:>10.2f}{stats.p95_ms:>10.2f}"
+            f"{stats.p99_ms:>10.2f}{stats.throughput:>10.1f}{sql:>6}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,146 @@
+"""
+A module for explain in the benchmarks package.
+Every access path of the resolvers is run through EXPLAIN on the
+ configured database, and the check fails when the plan does not use
+ the index meant for it. Sequential scans are disabled on PostgreSQL
+ so a small seeded table does not hide a missing index.
+"""
+
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import Select, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.session import async_engine
+from app.models.application import Application
+from app.models.employer import Employer
+from app.models.job import Job
+from app.models.user import User
+
+PRIMARY_KEY_MARKERS: dict[str, str] = {
+    "postgresql": "_pkey",
+    "sqlite": "PRIMARY KEY",
+}
+EXPLAIN_PREFIXES: dict[str, str] = {
+    "postgresql": "EXPLAIN",
+    "sqlite": "EXPLAIN QUERY PLAN",
+}
+
+
+class AccessPath(NamedTuple):
+    """
+    A lookup issued by the resolvers and the index that must serve it
+    """
+
+    name: str
+    statement: Select[Any]
+    index_name: Optional[str] = None
+
+
+class PathCheck(NamedTuple):
+    """
+    The plan of an access path and whether it uses its index
+    """
+
+    name: str
+    index_name: str
+    used: bool
+    plan: str
+
+
+ACCESS_PATHS: tuple[AccessPath, ...] = (
+    AccessPath("user_by_id", select(User.id).where(User.id == 1)),
+    AccessPath("employer_by_id", select(Employer.id).where(Employer.id == 1)),
+    AccessPath("job_by_id", select(Job.id).where(Job.id == 1)),
+    AccessPath(
+        "users_by_created_at",
+        select(User.id).where(User.created_at >= datetime(2024, 1, 1)),
+        "users_created_at_idx",
+    ),
+    AccessPath(
+        "jobs_by_employer",
+        select(Job.id).where(Job.employer_id == 1),
+        "job_employer_id_idx",
+    ),
+    AccessPath(
+        "applications_by_job",
+        select(Application.id).where(Application.job_id == 1),
+        "application_job_id_idx",
+    ),
+    AccessPath(
+        "applications_by_user",
+        select(Application.id).where(Application.user_id == 1),
+        "application_user_id_job_id_key",
+    ),
+    AccessPath(
+        "application_by_user_and_job",
+        select(Application.id).where(
+            Application.user_id == 1, Application.job_id == 1
+        ),
+        "application_user_id_job_id_key",
+    ),
+)
+
+
+async def explain(connection: AsyncConnection, statement: Select[Any]) -> str:
+    """
+    Get the query plan of a statement
+    :param connection: The connection to explain the statement on
+    :type connection: AsyncConnection
+    :param statement: The statement to explain
+    :type statement: Select[Any]
+    :return: The plan, one line per node
+    :rtype: str
+    """
+    compiled: str = str(
+        statement.compile(
+            dialect=connection.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    prefix: str = EXPLAIN_PREFIXES[connection.dialect.name]
+    rows = await connection.exec_driver_sql(f"{prefix} {compiled}")
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+async def check_access_paths() -> list[PathCheck]:
+    """
+    Explain every access path and check the index it uses
+    :return: The check of every access path
+    :rtype: list[PathCheck]
+    """
+    checks: list[PathCheck] = []
+    async with async_engine.connect() as connection:
+        dialect: str = connection.dialect.name
+        if dialect == "postgresql":
+            await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        for path in ACCESS_PATHS:
+            plan: str = await explain(connection, path.statement)
+            index_name: str = path.index_name or PRIMARY_KEY_MARKERS[dialect]
+            checks.append(
+                PathCheck(path.name, index_name, index_name in plan, plan)
+            )
+        await connection.rollback()
+    return checks
+
+
+def format_checks(checks: list[PathCheck]) -> str:
+    """
+    Render the checks as a fixed width table, with the plan of every
+     path that misses its index
+    :param checks: The check of every access path
+    :type checks: list[PathCheck]
+    :return: The report
+    :rtype: str
+    """
+    header: str = f"{'access path':<32}{'index':<36}status"
+    lines: list[str] = [header, "-" * len(header)]
+    for check in checks:
+        lines.append(
+            f"{check.name:<32}{check.index_name:<36}"
+            f"{'ok' if check.used else 'MISSING'}"
+        )
+        if not check.used:
+            lines.extend(f"    {line}" for line in check.plan.splitlines())
+    return "\n".join(lines)
@@ -0,0 +1,152 @@
+"""
+A module for operations in the benchmarks package.
+The catalogue holds representative operations of the API, each with a
+ function drawing its variables from the seeded dataset. LoginUser and
+ ApplyToJob are left out of the default run, since loginUser does not
+ issue a usable token yet and both would only measure their errors.
+"""
+
+from random import Random
+from typing import Any, Callable, NamedTuple
+
+from benchmarks.dataset import BENCHMARK_PASSWORD, JOB_TITLES, DatasetSpec
+
+VariablesFactory = Callable[[Random, DatasetSpec], dict[str, Any]]
+
+
+class BenchmarkOperation(NamedTuple):
+    """
+    A GraphQL operation of the benchmark catalogue
+    """
+
+    name: str
+    query: str
+    variables: VariablesFactory
+    authenticated: bool = False
+    default: bool = True
+
+
+def no_variables(rng: Random, spec: DatasetSpec) -> dict[str, Any]:
+    """
+    Variables of an operation without arguments
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: No variables
+    :rtype: dict[str, Any]
+    """
+    return {}
+
+
+def login_variables(rng: Random, spec: DatasetSpec) -> dict[str, Any]:
+    """
+    Credentials of a random seeded user
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: The email and password of the user
+    :rtype: dict[str, Any]
+    """
+    return {
+        "email": f"user{rng.randint(1, spec.users)}@benchmark.com",
+        "password": BENCHMARK_PASSWORD,
+    }
+
+
+def apply_variables(rng: Random, spec: DatasetSpec) -> dict[str, Any]:
+    """
+    An application of the benchmark user to a random job
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: The user and job ids
+    :rtype: dict[str, Any]
+    """
+    return {"userId": 1, "jobId": rng.randint(1, spec.jobs)}
+
+
+def search_variables(rng: Random, spec: DatasetSpec) -> dict[str, Any]:
+    """
+    A search for the words of a random seeded job title
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: The search text and page size
+    :rtype: dict[str, Any]
+    """
+    return {"query": rng.choice(JOB_TITLES), "first": 20}
+
+
+def autocomplete_variables(rng: Random, spec: DatasetSpec) -> dict[str, Any]:
+    """
+    The first letters of a random seeded job title
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: The prefix, kind and limit of the suggestions
+    :rtype: dict[str, Any]
+    """
+    return {
+        "prefix": rng.choice(JOB_TITLES)[: rng.randint(1, 4)],
+        "kind": "JOB_TITLE",
+        "limit": 10,
+    }
+
+
+OPERATIONS: dict[str, BenchmarkOperation] = {
+    operation.name: operation
+    for operation in (
+        BenchmarkOperation(
+            "Jobs",
+            "query Jobs { jobs { id title description employerId } }",
+            no_variables,
+        ),
+        BenchmarkOperation(
+            "EmployersJobsApplications",
+            "query EmployersJobsApplications { employers { id name jobs {"
+            " id title applications { id userId } } } }",
+            no_variables,
+        ),
+        BenchmarkOperation(
+            "EmployersJobsCounts",
+            "query EmployersJobsCounts { employers { id name jobsCount jobs {"
+            " id title applicationsCount } } }",
+            no_variables,
+        ),
+        BenchmarkOperation(
+            "LoginUser",
+            "mutation LoginUser($email: String!, $password: String!) {"
+            " loginUser(email: $email, password: $password) { token } }",
+            login_variables,
+            default=False,
+        ),
+        BenchmarkOperation(
+            "ApplyToJob",
+            "mutation ApplyToJob($userId: Int!, $jobId: Int!) {"
+            " applyToJob(userId: $userId, jobId: $jobId) {"
+            " application { id } } }",
+            apply_variables,
+            authenticated=True,
+            default=False,
+        ),
+        BenchmarkOperation(
+            "SearchJobs",
+            "query SearchJobs($query: String!, $first: Int) {"
+            " searchJobs(query: $query, first: $first) {"
+            " edges { rank node { id title } } hasNextPage } }",
+            search_variables,
+        ),
+        BenchmarkOperation(
+            "Autocomplete",
+            "query Autocomplete($prefix: String!, $kind: AutocompleteKind!,"
+            " $limit: Int) { autocomplete(prefix: $prefix, kind: $kind,"
+            " limit: $limit) }",
+            autocomplete_variables,
+        ),
+    )
+}
@@ -0,0 +1,208 @@
+"""
+A module for regression in the benchmarks package.
+A run is compared metric by metric against a stored baseline. A change
+ counts as a regression only when it exceeds both a relative tolerance
+ and the noise measured across the repeats of the two runs, except for
+ counts such as SQL statements, which must not grow at all.
+"""
+
+import json
+from math import sqrt
+from statistics import fmean, stdev
+from typing import Any, NamedTuple, Optional
+
+Results = dict[str, list[dict[str, Any]]]
+
+
+class MetricThreshold(NamedTuple):
+    """
+    Tolerance of a benchmark metric
+    """
+
+    relative: float
+    higher_is_better: bool = False
+    exact: bool = False
+
+
+METRICS: dict[str, MetricThreshold] = {
+    "p50_ms": MetricThreshold(0.10),
+    "p95_ms": MetricThreshold(0.15),
+    "p99_ms": MetricThreshold(0.25),
+    "throughput": MetricThreshold(0.10, higher_is_better=True),
+    "sql_statements": MetricThreshold(0.0, exact=True),
+    "errors": MetricThreshold(0.0, exact=True),
+    "allocated_kib": MetricThreshold(0.10),
+}
+NOISE_SIGMAS: float = 3.0
+
+
+class MetricDiff(NamedTuple):
+    """
+    Change of a metric of an operation between two runs
+    """
+
+    operation: str
+    metric: str
+    baseline: float
+    current: float
+    change: float
+    regression: bool
+
+
+def load_results(path: str) -> Results:
+    """
+    Load the operations of a benchmark results file
+    :param path: The path of the JSON results
+    :type path: str
+    :return: The repeats of every operation
+    :rtype: Results
+    """
+    with open(path, encoding="utf-8") as file:
+        report: dict[str, Any] = json.load(file)
+    return {
+        operation: stats if isinstance(stats, list) else [stats]
+        for operation, stats in report["operations"].items()
+    }
+
+
+def samples(repeats: list[dict[str, Any]], metric: str) -> list[float]:
+    """
+    Get the measured values of a metric across repeats
+    :param repeats: The stats of every repeat of an operation
+    :type repeats: list[dict[str, Any]]
+    :param metric: The name of the metric
+    :type metric: str
+    :return: The values, skipping repeats that did not measure it
+    :rtype: list[float]
+    """
+    return [
+        float(stats[metric])
+        for stats in repeats
+        if stats.get(metric) is not None
+    ]
+
+
+def noise(baseline: list[float], current: list[float]) -> float:
+    """
+    Get the standard error of the difference of two means
+    :param baseline: The samples of the baseline
+    :type baseline: list[float]
+    :param current: The samples of the current run
+    :type current: list[float]
+    :return: The standard error, 0 if a side has a single sample
+    :rtype: float
+    """
+    if len(baseline) < 2 or len(current) < 2:
+        return 0.0
+    return sqrt(
+        stdev(baseline) ** 2 / len(baseline)
+        + stdev(current) ** 2 / len(current)
+    )
+
+
+def compare_metric(
+    operation: str,
+    metric: str,
+    baseline: list[float],
+    current: list[float],
+) -> MetricDiff:
+    """
+    Compare a metric of an operation between two runs
+    :param operation: The name of the operation
+    :type operation: str
+    :param metric: The name of the metric
+    :type metric: str
+    :param baseline: The samples of the baseline
+    :type baseline: list[float]
+    :param current: The samples of the current run
+    :type current: list[float]
+    :return: The change of the metric
+    :rtype: MetricDiff
+    """
+    threshold: MetricThreshold = METRICS[metric]
+    baseline_mean: float = fmean(baseline)
+    current_mean: float = fmean(current)
+    delta: float = current_mean - baseline_mean
+    worse: float = -delta if threshold.higher_is_better else delta
+    tolerance: float = (
+        0.0
+        if threshold.exact
+        else max(
+            threshold.relative * abs(baseline_mean),
+            NOISE_SIGMAS * noise(baseline, current),
+        )
+    )
+    return MetricDiff(
+        operation=operation,
+        metric=metric,
+        baseline=baseline_mean,
+        current=current_mean,
+        change=delta / baseline_mean if baseline_mean else 0.0,
+        regression=worse > tolerance,
+    )
+
+
+def compare(baseline: Results, current: Results) -> list[MetricDiff]:
+    """
+    Compare every metric of the operations present in both runs
+    :param baseline: The stored baseline
+    :type baseline: Results
+    :param current: The new run
+    :type current: Results
+    :return: The change of every metric
+    :rtype: list[MetricDiff]
+    """
+    diffs: list[MetricDiff] = []
+    for operation, repeats in current.items():
+        if operation not in baseline:
+            continue
+        for metric in METRICS:
+            baseline_samples: list[float] = samples(baseline[operation], metric)
+            current_samples: list[float] = samples(repeats, metric)
+            if baseline_samples and current_samples:
+                diffs.append(
+                    compare_metric(
+                        operation, metric, baseline_samples, current_samples
+                    )
+                )
+    return diffs
+
+
+def has_regression(diffs: list[MetricDiff]) -> bool:
+    """
+    Check whether any metric regressed
+    :param diffs: The change of every metric
+    :type diffs: list[MetricDiff]
+    :return: True if at least one metric regressed
+    :rtype: bool
+    """
+    return any(diff.regression for diff in diffs)
+
+
+def format_diff(
+    diffs: list[MetricDiff], missing: Optional[list[str]] = None
+) -> str:
+    """
+    Render the changes as a fixed width table
+    :param diffs: The change of every metric
+    :type diffs: list[MetricDiff]
+    :param missing: The baseline operations absent from the new run
+    :type missing: Optional[list[str]]
+    :return: The diff report
+    :rtype: str
+    """
+    header: str = (
+        f"{'operation':<28}{'metric':<16}{'baseline':>12}{'current':>12}"
+        f"{'change':>10}  status"
+    )
+    lines: list[str] = [header, "-" * len(header)]
+    for diff in diffs:
+        status: str = "REGRESSION" if diff.regression else "ok"
+        lines.append(
+            f"{diff.operation:<28}{diff.metric:<16}{diff.baseline:>12.2f}"
+            f"{diff.current:>12.2f}{diff.change:>+10.1%}  {status}"
+        )
+    lines.extend(
+        f"{operation:<28}missing from run" for operation in missing or []
+    )
+    return "\n".join(lines)
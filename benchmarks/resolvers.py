@@ -0,0 +1,229 @@
+"""
+A module for resolvers in the benchmarks package.
+The resolver benchmarks call the query resolvers and mutation classes
+ directly, without the HTTP and GraphQL layers, so a regression can be
+ told apart from the cost of the transport.
+"""
+
+import logging
+import tracemalloc
+from random import Random
+from time import perf_counter_ns
+from typing import Any, Awaitable, Callable, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+
+from app.api.graphql.mutations.user import LoginUser
+from app.api.graphql.resolvers.application import resolver_applications
+from app.api.graphql.resolvers.autocomplete import resolver_autocomplete
+from app.api.graphql.resolvers.employer import resolver_employers
+from app.api.graphql.resolvers.job import resolver_jobs
+from app.api.graphql.resolvers.search import resolver_search_jobs
+from app.api.graphql.resolvers.user import resolver_users
+from app.db.session import async_engine
+from benchmarks.dataset import DatasetSpec
+from benchmarks.driver import OperationStats, check_errors, summarize
+from benchmarks.operations import (
+    autocomplete_variables,
+    login_variables,
+    search_variables,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ResolverCall = Callable[[Random, DatasetSpec], Awaitable[Any]]
+
+
+class ResolverBenchmark(NamedTuple):
+    """
+    A resolver or mutation called directly by the benchmark
+    """
+
+    name: str
+    call: ResolverCall
+    default: bool = True
+
+
+async def autocomplete(rng: Random, spec: DatasetSpec) -> Any:
+    """
+    Suggest job titles for the first letters of a random seeded title
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: The suggestions
+    :rtype: Any
+    """
+    variables: dict[str, Any] = autocomplete_variables(rng, spec)
+    return await resolver_autocomplete(
+        variables["prefix"], variables["kind"].lower(), variables["limit"]
+    )
+
+
+async def login_user(rng: Random, spec: DatasetSpec) -> Any:
+    """
+    Log in as a random seeded user through the mutation class
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: The mutation payload
+    :rtype: Any
+    """
+    return await LoginUser.mutate(None, None, **login_variables(rng, spec))
+
+
+RESOLVERS: dict[str, ResolverBenchmark] = {
+    benchmark.name: benchmark
+    for benchmark in (
+        ResolverBenchmark("resolver_jobs", lambda rng, spec: resolver_jobs()),
+        ResolverBenchmark(
+            "resolver_employers", lambda rng, spec: resolver_employers()
+        ),
+        ResolverBenchmark("resolver_users", lambda rng, spec: resolver_users()),
+        ResolverBenchmark(
+            "resolver_applications",
+            lambda rng, spec: resolver_applications(),
+        ),
+        ResolverBenchmark("LoginUser.mutate", login_user, default=False),
+        ResolverBenchmark(
+            "resolver_search_jobs",
+            lambda rng, spec: resolver_search_jobs(
+                **search_variables(rng, spec)
+            ),
+        ),
+        ResolverBenchmark("resolver_autocomplete", autocomplete),
+    )
+}
+
+
+class StatementCounter:
+    """
+    Count the statements the engine executes while it is attached
+    """
+
+    def __init__(self) -> None:
+        self.count: int = 0
+
+    def __call__(
+        self,
+        connection: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        self.count += 1
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(async_engine.sync_engine, "after_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        event.remove(async_engine.sync_engine, "after_cursor_execute", self)
+
+
+async def call_resolver(
+    benchmark: ResolverBenchmark, rng: Random, spec: DatasetSpec
+) -> bool:
+    """
+    Call a resolver once, logging instead of raising its errors
+    :param benchmark: The resolver to call
+    :type benchmark: ResolverBenchmark
+    :param rng: The random generator of the run
+    :type rng: Random
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :return: True if the call failed
+    :rtype: bool
+    """
+    try:
+        await benchmark.call(rng, spec)
+    except Exception as exc:
+        logger.debug("%s failed: %s", benchmark.name, exc)
+        return True
+    return False
+
+
+async def run_resolver(
+    benchmark: ResolverBenchmark,
+    spec: DatasetSpec,
+    iterations: int,
+    warmup: int,
+) -> OperationStats:
+    """
+    Call a resolver sequentially and summarize its latencies, the
+     statements it issues and the memory it allocates per call
+    :param benchmark: The resolver to benchmark
+    :type benchmark: ResolverBenchmark
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :param iterations: The number of measured calls
+    :type iterations: int
+    :param warmup: The number of calls before measuring
+    :type warmup: int
+    :return: The summary of the run
+    :rtype: OperationStats
+    """
+    rng: Random = Random(spec.seed)
+    for _ in range(warmup):
+        await call_resolver(benchmark, rng, spec)
+    with StatementCounter() as counter:
+        tracemalloc.start()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        try:
+            await call_resolver(benchmark, rng, spec)
+        finally:
+            allocated_kib: float = (
+                tracemalloc.get_traced_memory()[1] - baseline
+            ) / 1024
+            tracemalloc.stop()
+    latencies: list[int] = []
+    errors: int = 0
+    start_time: int = perf_counter_ns()
+    for _ in range(iterations):
+        call_start: int = perf_counter_ns()
+        if await call_resolver(benchmark, rng, spec):
+            errors += 1
+        latencies.append(perf_counter_ns() - call_start)
+    elapsed: int = perf_counter_ns() - start_time
+    return summarize(
+        benchmark.name,
+        latencies,
+        errors,
+        elapsed,
+        counter.count,
+        allocated_kib,
+    )
+
+
+async def run_resolvers(
+    names: list[str], spec: DatasetSpec, iterations: int, warmup: int
+) -> list[OperationStats]:
+    """
+    Benchmark the resolvers one after the other, stopping at the first
+     one with failed calls
+    :param names: The names of the resolver benchmarks
+    :type names: list[str]
+    :param spec: The seeded dataset
+    :type spec: DatasetSpec
+    :param iterations: The number of measured calls per resolver
+    :type iterations: int
+    :param warmup: The number of calls before measuring
+    :type warmup: int
+    :return: The summary of every resolver
+    :rtype: list[OperationStats]
+    :raises BenchmarkError: If a call fails
+    """
+    results: list[OperationStats] = []
+    for name in names:
+        stats: OperationStats = await run_resolver(
+            RESOLVERS[name], spec, iterations, warmup
+        )
+        logger.info("%s: %s", name, stats)
+        check_errors(stats)
+        results.append(stats)
+    return results
@@ -13,16 +13,38 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from starlette_graphene3 import GraphQLApp, make_graphiql_handler
+from starlette_graphene3 import make_graphiql_handler
 
+from app.api.bulk_import import router as import_router
+from app.api.export import router as export_router
+from app.api.graphql.graphql_app import GraphQLApplication
+from app.api.graphql.middlewares.deadline import DeadlineResolverMiddleware
+from app.api.graphql.middlewares.metrics import MetricsResolverMiddleware
+from app.api.graphql.middlewares.query_detector import (
+    QueryDetectorResolverMiddleware,
+)
+from app.api.graphql.middlewares.tracing import TracingResolverMiddleware
 from app.api.graphql.schema import schema
-from app.config.config import auth_setting, init_setting, setting
+from app.api.metrics import router as metrics_router
+from app.api.openapi import router as openapi_router
+from app.api.sdl import router as sdl_router
+from app.config.config import (
+    auth_setting,
+    init_setting,
+    performance_setting,
+    setting,
+)
 from app.core import logging_config
+from app.core.concurrency import build_admission_controller
 from app.core.lifecycle import lifespan
+from app.middlewares.admission_control import AdmissionControlMiddleware
+from app.middlewares.deadline import DeadlineMiddleware
+from app.middlewares.metrics import MetricsMiddleware
 from app.middlewares.security_headers import SecurityHeadersMiddleware
 from app.utils.file_utils.openapi_utils import (
     custom_generate_unique_id,
     custom_openapi,
+    remove_default_openapi_route,
 )
 
 logging_config.setup_logging(init_settings=init_setting, settings=setting)
@@ -36,6 +58,7 @@ app: FastAPI = FastAPI(
     generate_unique_id_function=custom_generate_unique_id,
 )
 app.openapi = partial(custom_openapi, app)  # type: ignore
+remove_default_openapi_route(app)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(
     CORSMiddleware,
@@ -45,13 +68,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(GZipMiddleware)
+app.add_middleware(MetricsMiddleware, performance_settings=performance_setting)
+app.include_router(export_router)
+app.include_router(import_router)
+app.include_router(metrics_router)
+app.include_router(openapi_router)
+app.include_router(sdl_router)
 
 app.mount(
     init_setting.IMAGES_PATH,
     StaticFiles(directory=init_setting.IMAGES_DIRECTORY),
     name=init_setting.IMAGES_APP,
 )
-app.mount("/", GraphQLApp(schema, on_get=make_graphiql_handler()), "graphql")
+app.mount(
+    "/",
+    DeadlineMiddleware(
+        AdmissionControlMiddleware(
+            GraphQLApplication(
+                schema,
+                on_get=make_graphiql_handler(),
+                middleware=[
+                    DeadlineResolverMiddleware(),
+                    MetricsResolverMiddleware(),
+                    TracingResolverMiddleware(),
+                    QueryDetectorResolverMiddleware(),
+                ],
+                auth_settings=auth_setting,
+                performance_settings=performance_setting,
+            ),
+            controller=build_admission_controller(performance_setting),
+            schema=schema.graphql_schema,
+            retry_after=performance_setting.RETRY_AFTER_SECONDS,
+        ),
+        performance_settings=performance_setting,
+    ),
+    "graphql",
+)
 
 
 @app.get(